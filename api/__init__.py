@@ -0,0 +1,7 @@
+from .server import JobAPI, ResponseCache, serve
+
+__all__ = [
+    "JobAPI",
+    "ResponseCache",
+    "serve",
+]
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Read-only local JSON API over the job store.
+
+Usage:
+    python api/server.py                       # http://127.0.0.1:8765
+    python api/server.py --port 9000 --db data/jobs.sqlite
+
+Endpoints (all GET, all filters optional):
+    /jobs?zone=Turbo&contract_type=temporal&order_by=salary_max&limit=20&offset=40
+    /jobs?q=auxiliar+bodega&zone=Apartadó           # BM25-ranked via the search index
+    /facets?field=zone&source=Computrabajo          # every facet when field is omitted
+    /salaries?group_by=zone&posted_since=2026-01-01
+    /health
+
+Filters: zone, source, contract_type, posted_since, seen_since, min_relevance, search.
+
+Errors are JSON ``{"error": ...}``: 400 for bad parameters, 404 for unknown
+paths, 503 when the job store cannot be read, 500 otherwise.
+
+Responses are cached (LRU) per path + query string together with a gzip
+copy; each encoding has its own strong ETag (``"<hash>"``, ``"<hash>-gz"``). The cache is dropped when the store or the search index
+changes on disk, so clients polling an unchanged dataset get 304s without
+touching SQLite.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import config
+from search import SearchIndex
+from storage import JobStore
+from storage.sqlite_store import FACETS, ORDERABLE
+
+logger = logging.getLogger(__name__)
+
+FILTERS = ("zone", "source", "contract_type", "posted_since", "seen_since", "min_relevance", "search")
+GROUPS = ("zone", "source", "contract_type")
+_GZIP_MIN_BYTES = 1024
+
+
+class BadRequest(ValueError):
+    pass
+
+
+# ── Response cache ────────────────────────────────────────────────
+class CachedResponse:
+    __slots__ = ("body", "etag", "gzip_etag", "_gzipped")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        digest = hashlib.blake2b(body, digest_size=12).hexdigest()
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gz"'     # A strong ETag names one representation
+        self._gzipped: Optional[bytes] = None
+
+    @property
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzipped
+
+
+class ResponseCache:
+    """Thread-safe LRU of encoded responses, keyed by request path + query."""
+
+    def __init__(self, size: int = config.API_CACHE_SIZE):
+        self.size = size
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# ── Data access ───────────────────────────────────────────────────
+class JobAPI:
+    """Answers API requests from the job store; one read-only connection per thread."""
+
+    def __init__(
+        self,
+        db: Path = config.JOB_STORE_PATH,
+        index_dir: Path = config.SEARCH_INDEX_DIR,
+        cache_size: int = config.API_CACHE_SIZE,
+    ):
+        self.db = Path(db)
+        self.index_dir = Path(index_dir)
+        self.cache = ResponseCache(cache_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation: Tuple = ()
+        self._index: Optional[SearchIndex] = None
+
+    def _store(self) -> JobStore:
+        store = getattr(self._local, "store", None)
+        if store is None:
+            store = self._local.store = JobStore(self.db, readonly=True)
+        return store
+
+    @staticmethod
+    def _stat(path: Path) -> Tuple[int, int]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return (0, 0)
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh(self) -> bool:
+        """Drop cached responses if the store or search index changed. Returns True if it did."""
+        generation = (
+            self._stat(self.db),
+            self._stat(self.db.with_name(self.db.name + "-wal")),
+            self._stat(self.index_dir / SearchIndex.FILENAME),
+        )
+        if generation == self._generation:
+            return False
+        with self._lock:
+            if generation != self._generation:
+                self.cache.clear()
+                self._index = None
+                self._generation = generation
+                logger.info("API: data changed, response cache cleared")
+        return True
+
+    def _search_index(self) -> SearchIndex:
+        with self._lock:
+            if self._index is None:
+                self._index = SearchIndex(self.index_dir)
+            return self._index
+
+    # ── Parameters ────────────────────────────────────────────────
+    @staticmethod
+    def _filters(params: Dict[str, str]) -> dict:
+        filters = {name: params[name] for name in FILTERS if params.get(name)}
+        if "min_relevance" in filters:
+            filters["min_relevance"] = _number(filters["min_relevance"], "min_relevance", float)
+        return filters
+
+    @staticmethod
+    def _page(params: Dict[str, str]) -> Tuple[int, int]:
+        limit = _number(params.get("limit", config.API_DEFAULT_LIMIT), "limit", int)
+        offset = _number(params.get("offset", 0), "offset", int)
+        if not 0 < limit <= config.API_MAX_LIMIT or offset < 0:
+            raise BadRequest(f"limit must be 1..{config.API_MAX_LIMIT} and offset ≥ 0")
+        return limit, offset
+
+    # ── Endpoints ─────────────────────────────────────────────────
+    def jobs(self, params: Dict[str, str]) -> dict:
+        filters = self._filters(params)
+        limit, offset = self._page(params)
+        store = self._store()
+        if params.get("q"):
+            # Facet filters go to the index; the rest are checked on the ranked page
+            hits = self._search_index().search(
+                params["q"], limit=None,
+                **{name: filters.pop(name) for name in GROUPS if name in filters},
+            )
+            if filters:
+                allowed = set(store.fingerprints(**filters))
+                hits = [hit for hit in hits if hit[0] in allowed]
+            page = hits[offset:offset + limit]
+            jobs = store.get_many([fp for fp, _ in page])
+            scores = dict(page)
+            records = [dict(job.to_dict(), score=scores[job.fingerprint]) for job in jobs]
+            return {"total": len(hits), "limit": limit, "offset": offset, "jobs": records}
+
+        order_by = params.get("order_by", "first_seen")
+        if order_by not in ORDERABLE:
+            raise BadRequest(f"order_by must be one of {', '.join(ORDERABLE)}")
+        jobs = store.query(
+            order_by=order_by, descending=params.get("order", "desc") != "asc",
+            limit=limit, offset=offset, **filters,
+        )
+        return {
+            "total": store.count(**filters), "limit": limit, "offset": offset,
+            "jobs": [job.to_dict() for job in jobs],
+        }
+
+    def facets(self, params: Dict[str, str]) -> dict:
+        filters = self._filters(params)
+        fields = [params["field"]] if params.get("field") else list(FACETS)
+        for name in fields:
+            if name not in FACETS:
+                raise BadRequest(f"field must be one of {', '.join(FACETS)}")
+        store = self._store()
+        return {name: store.facet_counts(name, **filters) for name in fields}
+
+    def salaries(self, params: Dict[str, str]) -> dict:
+        """Salary summary (COP) per group, over postings with a parsed salary."""
+        group_by = params.get("group_by", "zone")
+        if group_by not in GROUPS:
+            raise BadRequest(f"group_by must be one of {', '.join(GROUPS)}")
+        groups, values = self._store().salary_column(group_by, **self._filters(params))
+        summary = {}
+        if len(values):
+            order = np.argsort(groups, kind="stable")
+            groups, values = groups[order], values[order]
+            names, starts = np.unique(groups, return_index=True)
+            for name, chunk in zip(names, np.split(values, starts[1:])):
+                q1, median, q3 = np.percentile(chunk, [25, 50, 75])
+                summary[str(name)] = {
+                    "count": int(len(chunk)), "min": float(chunk.min()), "q1": float(q1),
+                    "median": float(median), "q3": float(q3), "max": float(chunk.max()),
+                    "mean": round(float(chunk.mean()), 2),
+                }
+        return {"group_by": group_by, "field": "salary_max", "groups": summary}
+
+    def health(self, params: Dict[str, str]) -> dict:
+        return {"jobs": len(self._store()), "cache_hits": self.cache.hits, "cache_misses": self.cache.misses}
+
+    ROUTES = {"/jobs": jobs, "/facets": facets, "/salaries": salaries, "/health": health}
+
+    def respond(self, path: str, query: str) -> Tuple[int, Optional[CachedResponse]]:
+        """(status, response) for a GET; cached unless it is /health."""
+        handler = self.ROUTES.get(path.rstrip("/") or "/")
+        if handler is None:
+            return HTTPStatus.NOT_FOUND, _encode({"error": f"no endpoint {path}"})
+        self.refresh()
+        generation = self._generation
+        key = f"{path}?{query}"
+        cacheable = handler is not JobAPI.health
+        entry = self.cache.get(key) if cacheable else None
+        if entry is None:
+            try:
+                entry = _encode(handler(self, dict(parse_qsl(query))))
+            except BadRequest as exc:
+                return HTTPStatus.BAD_REQUEST, _encode({"error": str(exc)})
+            except sqlite3.Error as exc:
+                # Typically no job store yet (nothing scraped) or it is being replaced
+                logger.warning("API: %s failed: %s", path, exc)
+                return HTTPStatus.SERVICE_UNAVAILABLE, _encode({"error": f"job store unavailable: {exc}"})
+            except Exception:
+                logger.exception("API: %s?%s failed", path, query)
+                return HTTPStatus.INTERNAL_SERVER_ERROR, _encode({"error": "internal error"})
+            if cacheable:
+                # Built from data older than a refresh() that ran meanwhile: serve it, don't cache it
+                with self._lock:
+                    if self._generation == generation:
+                        self.cache.put(key, entry)
+        return HTTPStatus.OK, entry
+
+    def close(self) -> None:
+        store = getattr(self._local, "store", None)
+        if store is not None:
+            store.close()
+
+
+def _number(value, name: str, kind):
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        raise BadRequest(f"{name} must be a number") from None
+
+
+def _encode(payload: dict) -> CachedResponse:
+    return CachedResponse(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+# ── HTTP ──────────────────────────────────────────────────────────
+class APIHandler(BaseHTTPRequestHandler):
+    api: JobAPI = None     # Set by serve()
+    server_version = "UrabaJobsAPI/1.0"
+    protocol_version = "HTTP/1.1"     # Keep-alive for pollers; every response has a Content-Length
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        status, entry = self.api.respond(url.path, url.query)
+        use_gzip = len(entry.body) >= _GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", "")
+        etag = entry.gzip_etag if use_gzip else entry.etag
+        if status == HTTPStatus.OK and etag in self.headers.get("If-None-Match", ""):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        body = entry.gzipped if use_gzip else entry.body
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        if status == HTTPStatus.OK:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt: str, *args) -> None:
+        logger.debug("%s - %s", self.address_string(), fmt % args)
+
+
+def serve(
+    host: str = config.API_HOST,
+    port: int = config.API_PORT,
+    db: Path = config.JOB_STORE_PATH,
+    index_dir: Path = config.SEARCH_INDEX_DIR,
+) -> None:
+    api = JobAPI(db, index_dir)
+    handler = type("Handler", (APIHandler,), {"api": api})
+    with ThreadingHTTPServer((host, port), handler) as httpd:
+        logger.info("API: serving %s on http://%s:%d", db, host, port)
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Read-only local JSON API over the job store.")
+    ap.add_argument("--host", default=config.API_HOST)
+    ap.add_argument("--port", type=int, default=config.API_PORT)
+    ap.add_argument("--db", default=str(config.JOB_STORE_PATH), help="job store path")
+    ap.add_argument("--index-dir", default=str(config.SEARCH_INDEX_DIR), help="search index directory")
+    args = ap.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s  %(name)-18s  %(levelname)-7s  %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    if not Path(args.db).exists():
+        sys.exit(f"No job store at {args.db}; run main.py or seed_data.py first.")
+    serve(args.host, args.port, Path(args.db), Path(args.index_dir))
+
+
+if __name__ == "__main__":
+    main()
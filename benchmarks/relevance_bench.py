@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Relevance scoring benchmark: the original per-posting rules vs feature
+extraction + vectorized scoring, and re-scoring with new weights.
+
+Usage:
+    python benchmarks/relevance_bench.py            # 200k postings
+    python benchmarks/relevance_bench.py -n 20000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import compiled_config
+import config
+from data_schema import JobPosting
+from processing.relevance import RelevanceFeatures, RelevanceScorer
+from seed_data import RAW_JOBS
+
+ZONES = ["Apartadó", "Turbo", "Urabá (General)", "Antioquia (Other)", "Sin especificar"]
+
+
+def make_jobs(n: int) -> list:
+    return [
+        JobPosting(
+            title=RAW_JOBS[i % len(RAW_JOBS)]["title"],
+            company=RAW_JOBS[i % len(RAW_JOBS)]["company"],
+            location=RAW_JOBS[(i * 7) % len(RAW_JOBS)]["location"],
+            zone=ZONES[i % len(ZONES)],
+            description=RAW_JOBS[(i * 3) % len(RAW_JOBS)].get("description", ""),
+            source=RAW_JOBS[i % len(RAW_JOBS)].get("source", ""),
+        )
+        for i in range(n)
+    ]
+
+
+def legacy_score(job: JobPosting) -> float:
+    """The per-posting rules as they were before the batch scorer."""
+    cfg = compiled_config.current()
+    text = (job.title + " " + job.location + " " + job.company + " " + job.description).lower()
+    score = 0.0
+    strong_hits = sum(1 for kw in cfg.strong_keywords if kw in text)
+    if strong_hits >= 2:
+        score = 1.0
+    elif strong_hits == 1:
+        score = 0.85
+    if job.zone and job.zone not in (cfg.unknown_zone, cfg.parent_zone):
+        score = max(score, 0.9)
+    if score < 0.5:
+        if sum(1 for kw in cfg.medium_keywords if kw in text):
+            score = max(score, 0.5)
+    neg_hits = sum(1 for kw in cfg.negative_keywords if kw in text)
+    if neg_hits and score < 0.8:
+        score = max(0.1, score - 0.3 * neg_hits)
+    if score == 0.0:
+        score = 0.3
+    return round(score, 2)
+
+
+def timed(label: str, fn):
+    t0 = time.perf_counter()
+    result = fn()
+    print(f"  {label:40s} {(time.perf_counter() - t0) * 1e3:9.1f} ms")
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("-n", type=int, default=200_000, help="number of postings")
+    args = ap.parse_args()
+
+    jobs = make_jobs(args.n)
+    print(f"\n  {args.n:,} postings\n")
+
+    expected = timed("legacy per-posting rules", lambda: [legacy_score(j) for j in jobs])
+    hits = timed("keyword hits (cached in the pipeline)",
+                 lambda: [RelevanceFeatures.keyword_hits(j) for j in jobs])
+    features = timed("feature columns", lambda: RelevanceFeatures.from_jobs(jobs, hits))
+    rules = timed("vectorized rules", lambda: features.scores("rules"))
+    timed("vectorized weighted", lambda: features.scores("weighted", config.RELEVANCE_WEIGHTS))
+    timed("full batch (score_all, no cache)", lambda: RelevanceScorer.score_all(jobs))
+
+    mismatches = sum(a != b for a, b in zip(expected, rules.tolist()))
+    print(f"\n  rules vs legacy mismatches: {mismatches}\n")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Salary parser benchmark + golden-output check.
+
+The corpus is every `salary_raw` in seed_data.RAW_JOBS plus a few synthetic
+shapes (ranges, "millones", SMMLV multiples, hourly/daily rates).
+
+Usage:
+    python benchmarks/salary_bench.py                  # check golden, then benchmark
+    python benchmarks/salary_bench.py --update-golden  # rewrite salary_golden.json
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+from processing import SalaryParser
+from seed_data import RAW_JOBS
+
+GOLDEN_PATH = BENCH_DIR / "salary_golden.json"
+
+EXTRA_CASES = [
+    "",
+    "2 a 3 millones",
+    "Entre 1.800.000 y 2.200.000",
+    "$1.5M - $2M",
+    "1 a 2 SMMLV",
+    "1,5 SMMLV + prestaciones",
+    "Salario mínimo legal vigente",
+    "$8.000 por hora",
+    "$60.000 diarios",
+    "valor hora: $8.000",
+    "jornal de $60.000",
+    "Trabajo de 8 horas diarias $1.500.000",
+    "2 SMMLV, turnos de 8 horas diarias",
+    "$60.000 diarios o $1.800.000 mensuales",
+    "1500000.0 - 2000000.0 COP",
+    "$1.500.000 m/cte",
+]
+
+
+def corpus() -> list:
+    seen = dict.fromkeys(raw.get("salary_raw", "") for raw in RAW_JOBS)
+    seen.update(dict.fromkeys(EXTRA_CASES))
+    return list(seen)
+
+
+def shape(raw: str) -> str:
+    text = raw.lower()
+    if re.search(r"smmlv|m[ií]nimo", text):
+        return "smmlv"
+    if re.search(r"hora|d[ií]a\b|diari", text):
+        return "period"
+    amounts = re.findall(r"\d[\d.,]*", text)
+    if not amounts:
+        return "no-amount"
+    return "single" if len(amounts) == 1 else "multi/range"
+
+
+def check_golden() -> int:
+    golden = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+    failures = 0
+    for raw, expected in golden.items():
+        got = list(SalaryParser.parse(raw))
+        if got != expected:
+            failures += 1
+            print(f"  MISMATCH {raw!r}: expected {expected}, got {got}")
+    print(f"  Golden: {len(golden) - failures}/{len(golden)} match")
+    return failures
+
+
+def update_golden() -> None:
+    golden = {raw: list(SalaryParser.parse(raw)) for raw in corpus()}
+    GOLDEN_PATH.write_text(
+        json.dumps(golden, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+    print(f"  Wrote {len(golden)} cases → {GOLDEN_PATH}")
+
+
+def bench(repeat: int) -> None:
+    cases = corpus()
+    by_shape = defaultdict(list)
+    for raw in cases:
+        by_shape[shape(raw)].append(raw)
+
+    print(f"\n  {'shape':14s} {'n':>4s} {'cold µs':>10s} {'warm µs':>10s}")
+    for name, raws in sorted(by_shape.items()):
+        SalaryParser.cache_clear()
+        t0 = time.perf_counter()
+        for raw in raws:
+            SalaryParser.parse(raw)
+        cold = (time.perf_counter() - t0) / len(raws) * 1e6
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            for raw in raws:
+                SalaryParser.parse(raw)
+        warm = (time.perf_counter() - t0) / (len(raws) * repeat) * 1e6
+        print(f"  {name:14s} {len(raws):4d} {cold:10.2f} {warm:10.2f}")
+
+    # Realistic stream: the seed distribution replicated to ~100k postings
+    stream = [raw.get("salary_raw", "") for raw in RAW_JOBS]
+    stream *= max(1, 100_000 // len(stream))
+    SalaryParser.cache_clear()
+    t0 = time.perf_counter()
+    for raw in stream:
+        SalaryParser.parse(raw)
+    elapsed = time.perf_counter() - t0
+    print(f"\n  {len(stream):,} postings in {elapsed * 1e3:.1f} ms  {SalaryParser.cache_info()}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--update-golden", action="store_true", help="rewrite the golden file")
+    ap.add_argument("--repeat", type=int, default=1000, help="warm-cache passes per shape")
+    args = ap.parse_args()
+
+    if args.update_golden:
+        update_golden()
+        return
+
+    failures = check_golden()
+    bench(args.repeat)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Full-text search benchmark: indexing, save/load and BM25 queries against
+a substring scan over title + company.
+
+Usage:
+    python benchmarks/search_bench.py            # 200k postings
+    python benchmarks/search_bench.py -n 20000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from data_schema import JobPosting
+from search import SearchIndex
+from seed_data import RAW_JOBS
+
+ZONES = ["Apartadó", "Turbo", "Carepa", "Chigorodó", "Necoclí"]
+CONTRACTS = ["permanente", "temporal", "sin especificar"]
+QUERIES = [
+    ("auxiliar bodega Apartadó", {}),
+    ("auxiliar bodega", {"zone": "Turbo"}),
+    ("vendedor", {"zone": "Apartadó", "contract_type": "temporal"}),
+    ("operario cultivo banano", {"source": "Computrabajo"}),
+]
+
+
+def make_jobs(n: int) -> list:
+    return [
+        JobPosting(
+            title=RAW_JOBS[i % len(RAW_JOBS)]["title"],
+            company=RAW_JOBS[(i * 5) % len(RAW_JOBS)]["company"],
+            location=RAW_JOBS[(i * 7) % len(RAW_JOBS)]["location"],
+            zone=ZONES[i % len(ZONES)],
+            contract_type=CONTRACTS[i % len(CONTRACTS)],
+            description=RAW_JOBS[(i * 3) % len(RAW_JOBS)].get("description", ""),
+            source=RAW_JOBS[i % len(RAW_JOBS)].get("source", ""),
+            fingerprint=f"{i:032x}",
+            raw_hash=str(i),
+        )
+        for i in range(n)
+    ]
+
+
+def timed(label: str, fn, repeat: int = 1):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    print(f"  {label:48s} {(time.perf_counter() - t0) / repeat * 1e3:9.2f} ms")
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("-n", type=int, default=200_000, help="number of postings")
+    args = ap.parse_args()
+
+    jobs = make_jobs(args.n)
+    print(f"\n  {args.n:,} postings\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SearchIndex(tmp)
+        timed("index 90%", lambda: index.add(jobs[: args.n * 9 // 10]))
+        timed("save", index.save)
+        index = timed("load", lambda: SearchIndex(tmp))
+        timed("incremental add 10% + save", lambda: (index.add(jobs[args.n * 9 // 10:]), index.save()))
+        timed("re-add everything (all skipped)", lambda: index.add(jobs))
+        print()
+        for query, filters in QUERIES:
+            label = f"bm25 {query!r} {filters or ''}"
+            hits = timed(label[:48], lambda: index.search(query, limit=20, **filters), repeat=20)
+            if not hits:
+                print("    (no hits)")
+
+    needle = "auxiliar"
+    timed("substring scan over title + company", lambda: [
+        j for j in jobs if needle in (j.title + " " + j.company).lower()
+    ], repeat=3)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+JobPosting serialization micro-benchmark: dataclasses.asdict vs the generated
+codec vs orjson/msgpack, encode and decode.
+
+Usage:
+    python benchmarks/serialization_bench.py            # 100k postings
+    python benchmarks/serialization_bench.py -n 20000
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import serialization
+from data_schema import JobPosting
+from seed_data import RAW_JOBS
+
+
+def make_jobs(n: int) -> list:
+    jobs = []
+    for i in range(n):
+        raw = RAW_JOBS[i % len(RAW_JOBS)]
+        jobs.append(JobPosting(
+            title=raw["title"],
+            company=raw["company"],
+            location=raw["location"],
+            zone="Apartadó",
+            salary_raw=raw.get("salary_raw", ""),
+            salary_min=1_423_500.0,
+            salary_max=1_800_000.0,
+            benefits=["Salud/EPS", "Pensión", "Transporte"][: i % 4],
+            description=raw.get("description", ""),
+            url=raw.get("url", ""),
+            source=raw.get("source", ""),
+            relevance_score=0.9,
+        ))
+    return jobs
+
+
+def timed(label: str, fn, baseline: float = None) -> float:
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    speedup = f"{baseline / elapsed:6.1f}x" if baseline else "   base"
+    print(f"  {label:38s} {elapsed * 1e3:9.1f} ms  {speedup}")
+    return elapsed
+
+
+def legacy_to_dict(job: JobPosting) -> dict:
+    return asdict(job)
+
+
+def legacy_from_dict(data: dict) -> JobPosting:
+    return JobPosting(**{k: v for k, v in data.items() if k in JobPosting.__dataclass_fields__})
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("-n", type=int, default=100_000, help="number of postings")
+    args = ap.parse_args()
+
+    jobs = make_jobs(args.n)
+    records = serialization.encode_jobs(jobs)
+    payload = json.dumps(records, ensure_ascii=False)
+    print(f"\n  {args.n:,} postings\n")
+
+    print("  encode → dicts")
+    base = timed("dataclasses.asdict", lambda: [legacy_to_dict(j) for j in jobs])
+    timed("generated to_dict (encode_jobs)", lambda: serialization.encode_jobs(jobs), base)
+
+    print("\n  encode → bytes")
+    base = timed("asdict + json.dumps", lambda: json.dumps(
+        [legacy_to_dict(j) for j in jobs], ensure_ascii=False, default=str))
+    timed("encode_jobs + json.dumps", lambda: serialization.dumps(jobs, backend="json"), base)
+    if serialization.orjson:
+        timed("orjson (dataclasses natively)", lambda: serialization.dumps(jobs, backend="orjson"), base)
+    if serialization.msgpack:
+        timed("encode_jobs + msgpack", lambda: serialization.dumps(jobs, backend="msgpack"), base)
+
+    print("\n  decode ← dicts")
+    base = timed("filtered-dict from_dict", lambda: [legacy_from_dict(r) for r in records])
+    timed("generated from_dict (decode_jobs)", lambda: serialization.decode_jobs(records), base)
+
+    print("\n  decode ← bytes")
+    base = timed("json.loads + filtered-dict from_dict",
+                 lambda: [legacy_from_dict(r) for r in json.loads(payload)])
+    timed("json.loads + decode_jobs", lambda: serialization.loads(payload, backend="json"), base)
+    if serialization.orjson:
+        timed("orjson.loads + decode_jobs", lambda: serialization.loads(payload, backend="orjson"), base)
+    if serialization.msgpack:
+        packed = serialization.dumps(jobs, backend="msgpack")
+        timed("msgpack + decode_jobs", lambda: serialization.loads(packed, backend="msgpack"), base)
+    print()
+
+
+if __name__ == "__main__":
+    main()
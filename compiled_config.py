@@ -0,0 +1,298 @@
+"""
+Compiled configuration: validate the keyword tables once and derive the
+lookup structures the pipeline uses (pruned keyword tuples, keyword → category
+maps, zone priority order, the place-name gazetteer).
+
+The compiled form is pickled under config.CACHE_DIR keyed by a hash of the
+config file (plus config.py when a region config falls back to its tables,
+and the GAZETTEER_FILE place list), so later startups load it directly. An alternate region config
+(a Python file defining the same names as config.py) can be activated with
+``activate(path)`` or the URABA_CONFIG environment variable.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import config as base_config
+from processing.gazetteer import Gazetteer, load_places_csv
+from processing.text import fold_accents
+
+logger = logging.getLogger(__name__)
+
+# Bump when the compiled structure changes so stale pickles are ignored
+COMPILER_VERSION = 2
+
+# Names a region config may define; anything missing falls back to config.py
+REGION_TABLES = (
+    "URABA_MUNICIPALITIES",
+    "URABA_PLACES",
+    "REGION_KEYWORDS",
+    "PARENT_REGION_KEYWORDS",
+    "GENERIC_ZONE",
+    "PARENT_ZONE",
+    "UNKNOWN_ZONE",
+    "TEMPORAL_KEYWORDS",
+    "PERMANENT_KEYWORDS",
+    "BENEFITS_MAP",
+    "STRONG_RELEVANCE_KEYWORDS",
+    "MEDIUM_RELEVANCE_KEYWORDS",
+    "NEGATIVE_RELEVANCE_KEYWORDS",
+)
+
+
+class ConfigError(ValueError):
+    """Raised when a config file fails validation."""
+
+
+def prune_keywords(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """Drop keywords that contain another keyword of the same group.
+
+    For "does any keyword occur in the text" checks the result is identical
+    ("comisiones" can only match where "comision" already does), with fewer
+    substring scans per call.
+    """
+    unique = list(dict.fromkeys(keywords))
+    return tuple(
+        kw for kw in unique
+        if not any(other != kw and other in kw for other in unique)
+    )
+
+
+@dataclass
+class CompiledConfig:
+    source: str
+    digest: str
+    tables: Dict[str, object]
+
+    # Zones, in priority order (first match wins)
+    municipalities: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+    zone_priority: Dict[str, int] = field(default_factory=dict)
+    zone_keyword_map: Dict[str, str] = field(default_factory=dict)
+    region_keywords: Tuple[str, ...] = ()
+    parent_keywords: Tuple[str, ...] = ()
+    generic_zone: str = ""
+    parent_zone: str = ""
+    unknown_zone: str = ""
+    gazetteer: Optional[Gazetteer] = None
+
+    # Contract type / benefits
+    temporal_keywords: Tuple[str, ...] = ()
+    permanent_keywords: Tuple[str, ...] = ()
+    benefits: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+    benefit_keyword_map: Dict[str, str] = field(default_factory=dict)
+
+    # Relevance lists count every keyword, so they are kept unpruned
+    strong_keywords: Tuple[str, ...] = ()
+    medium_keywords: Tuple[str, ...] = ()
+    negative_keywords: Tuple[str, ...] = ()
+
+    # Accent-folded relevance tokens, for token-level matchers
+    folded_relevance_tokens: frozenset = frozenset()
+
+    @property
+    def generic_zones(self) -> frozenset:
+        """Zone labels that don't pin a posting to a municipality."""
+        return frozenset(("", self.generic_zone, self.parent_zone, self.unknown_zone))
+
+
+# ── Loading & validation ──────────────────────────────────────────
+def _load_module(path: Union[str, Path]) -> ModuleType:
+    path = Path(path)
+    spec = importlib.util.spec_from_file_location(f"region_config_{path.stem}", path)
+    if spec is None or spec.loader is None:
+        raise ConfigError(f"Cannot load config file {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _tables(module: ModuleType) -> Dict[str, object]:
+    return {
+        name: getattr(module, name, getattr(base_config, name))
+        for name in REGION_TABLES
+    }
+
+
+def _gazetteer_file(module: ModuleType, config_path: Path) -> Optional[Path]:
+    """GAZETTEER_FILE of the config, resolved relative to the config file."""
+    value = getattr(module, "GAZETTEER_FILE", getattr(base_config, "GAZETTEER_FILE", None))
+    if not value:
+        return None
+    path = Path(value)
+    return path if path.is_absolute() else config_path.parent / path
+
+
+def _keyword_list(name: str, value) -> None:
+    if not isinstance(value, (list, tuple)) or not value:
+        raise ConfigError(f"{name} must be a non-empty list of keywords")
+    for kw in value:
+        if not isinstance(kw, str) or not kw.strip():
+            raise ConfigError(f"{name} contains an empty or non-string keyword: {kw!r}")
+        if kw != kw.lower():
+            # Matching runs on lowercased text, so this keyword could never match
+            raise ConfigError(f"{name} keyword {kw!r} must be lowercase")
+
+
+def _keyword_map(name: str, value) -> None:
+    if not isinstance(value, dict) or not value:
+        raise ConfigError(f"{name} must be a non-empty dict of name → keywords")
+    for key, keywords in value.items():
+        _keyword_list(f"{name}[{key!r}]", keywords)
+
+
+def validate(tables: Dict[str, object]) -> None:
+    _keyword_map("URABA_MUNICIPALITIES", tables["URABA_MUNICIPALITIES"])
+    if tables["URABA_PLACES"]:
+        _keyword_map("URABA_PLACES", tables["URABA_PLACES"])
+        unknown = set(tables["URABA_PLACES"]) - set(tables["URABA_MUNICIPALITIES"])
+        if unknown:
+            raise ConfigError(f"URABA_PLACES parents are not municipalities: {sorted(unknown)}")
+    _keyword_map("BENEFITS_MAP", tables["BENEFITS_MAP"])
+    for name in (
+        "REGION_KEYWORDS", "PARENT_REGION_KEYWORDS", "TEMPORAL_KEYWORDS",
+        "PERMANENT_KEYWORDS", "STRONG_RELEVANCE_KEYWORDS",
+    ):
+        _keyword_list(name, tables[name])
+    for name in ("MEDIUM_RELEVANCE_KEYWORDS", "NEGATIVE_RELEVANCE_KEYWORDS"):
+        if tables[name]:
+            _keyword_list(name, tables[name])
+    for name in ("GENERIC_ZONE", "PARENT_ZONE", "UNKNOWN_ZONE"):
+        if not isinstance(tables[name], str) or not tables[name]:
+            raise ConfigError(f"{name} must be a non-empty string")
+
+    owners: Dict[str, str] = {}
+    for zone, keywords in tables["URABA_MUNICIPALITIES"].items():
+        for kw in keywords:
+            if kw in owners and owners[kw] != zone:
+                logger.warning(
+                    "Keyword %r maps to both %s and %s; %s wins", kw, owners[kw], zone, owners[kw],
+                )
+            owners.setdefault(kw, zone)
+
+
+def compile_tables(
+    tables: Dict[str, object],
+    source: str,
+    digest: str,
+    extra_places: Sequence[Tuple[str, str]] = (),
+) -> CompiledConfig:
+    validate(tables)
+    municipalities = tables["URABA_MUNICIPALITIES"]
+    benefits = tables["BENEFITS_MAP"]
+
+    zone_keyword_map: Dict[str, str] = {}
+    for zone, keywords in municipalities.items():
+        for kw in keywords:
+            zone_keyword_map.setdefault(kw, zone)
+    benefit_keyword_map: Dict[str, str] = {}
+    for name, keywords in benefits.items():
+        for kw in keywords:
+            benefit_keyword_map.setdefault(kw, name)
+
+    relevance = (
+        list(tables["STRONG_RELEVANCE_KEYWORDS"])
+        + list(tables["MEDIUM_RELEVANCE_KEYWORDS"])
+        + list(tables["NEGATIVE_RELEVANCE_KEYWORDS"])
+    )
+    return CompiledConfig(
+        source=source,
+        digest=digest,
+        tables=tables,
+        municipalities=tuple((zone, prune_keywords(kws)) for zone, kws in municipalities.items()),
+        zone_priority={zone: i for i, zone in enumerate(municipalities)},
+        zone_keyword_map=zone_keyword_map,
+        region_keywords=prune_keywords(tables["REGION_KEYWORDS"]),
+        parent_keywords=prune_keywords(tables["PARENT_REGION_KEYWORDS"]),
+        generic_zone=tables["GENERIC_ZONE"],
+        parent_zone=tables["PARENT_ZONE"],
+        unknown_zone=tables["UNKNOWN_ZONE"],
+        gazetteer=Gazetteer.from_tables(
+            municipalities,
+            tables["URABA_PLACES"] or {},
+            tables["REGION_KEYWORDS"],
+            tables["PARENT_REGION_KEYWORDS"],
+            tables["GENERIC_ZONE"],
+            tables["PARENT_ZONE"],
+            tables["UNKNOWN_ZONE"],
+            extra_places,
+        ),
+        temporal_keywords=prune_keywords(tables["TEMPORAL_KEYWORDS"]),
+        permanent_keywords=prune_keywords(tables["PERMANENT_KEYWORDS"]),
+        benefits=tuple((name, prune_keywords(kws)) for name, kws in benefits.items()),
+        benefit_keyword_map=benefit_keyword_map,
+        strong_keywords=tuple(tables["STRONG_RELEVANCE_KEYWORDS"]),
+        medium_keywords=tuple(tables["MEDIUM_RELEVANCE_KEYWORDS"]),
+        negative_keywords=tuple(tables["NEGATIVE_RELEVANCE_KEYWORDS"]),
+        folded_relevance_tokens=frozenset(
+            tok for kw in relevance for tok in fold_accents(kw).split()
+        ),
+    )
+
+
+def _digest(path: Path, module: ModuleType, places_path: Optional[Path]) -> str:
+    """Hash of every file the compiled tables are read from."""
+    h = hashlib.sha256(f"{COMPILER_VERSION}:{path}:".encode() + path.read_bytes())
+    if module is not base_config and not all(hasattr(module, name) for name in REGION_TABLES + ("GAZETTEER_FILE",)):
+        h.update(Path(base_config.__file__).read_bytes())
+    if places_path is not None:
+        h.update(places_path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def load(path: Optional[Union[str, Path]] = None, use_cache: bool = True) -> CompiledConfig:
+    """Compile the config at ``path`` (default: config.py), via the on-disk cache."""
+    if path is None:
+        module, path = base_config, Path(base_config.__file__).resolve()
+    else:
+        path = Path(path).resolve()
+        module = _load_module(path)
+    places_path = _gazetteer_file(module, path)
+
+    digest = _digest(path, module, places_path)
+    cache_path = Path(base_config.CACHE_DIR) / f"compiled-config-{digest}.pickle"
+
+    if use_cache and cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                compiled = pickle.load(f)
+            if isinstance(compiled, CompiledConfig) and compiled.digest == digest:
+                return compiled
+        except (OSError, pickle.UnpicklingError, AttributeError, EOFError, ImportError) as exc:
+            logger.warning("Ignoring unreadable compiled config %s: %s", cache_path, exc)
+
+    extra_places = load_places_csv(places_path) if places_path is not None else ()
+    compiled = compile_tables(_tables(module), str(path), digest, extra_places)
+
+    if use_cache:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_name(cache_path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(cache_path)
+        except OSError as exc:
+            logger.warning("Could not cache compiled config: %s", exc)
+    return compiled
+
+
+# ── Active config ─────────────────────────────────────────────────
+_active: Optional[CompiledConfig] = None
+
+
+def activate(path: Optional[Union[str, Path]] = None) -> CompiledConfig:
+    """Make the config at ``path`` (or $URABA_CONFIG, or config.py) the active one."""
+    global _active
+    _active = load(path or os.environ.get("URABA_CONFIG") or None)
+    logger.info("Active config: %s (%s)", _active.source, _active.digest)
+    return _active
+
+
+def current() -> CompiledConfig:
+    return _active or activate()
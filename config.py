@@ -1,5 +1,7 @@
 """Configuration for the Urabá job scraper."""
 
+from pathlib import Path
+
 # ── Request Settings ──────────────────────────────────────────────
 REQUEST_TIMEOUT = 15
 RETRY_ATTEMPTS = 2
@@ -11,6 +13,48 @@ USER_AGENT = (
     "Chrome/120.0.0.0 Safari/537.36"
 )
 
+# ── Storage ───────────────────────────────────────────────────────
+DATA_DIR = Path(__file__).resolve().parent / "data"
+SEEN_INDEX_PATH = DATA_DIR / "seen.sqlite"   # Every fingerprint ever scraped
+BLOOM_CAPACITY = 1_000_000                   # Grows automatically when exceeded
+BLOOM_ERROR_RATE = 0.01
+ENRICHMENT_CACHE_PATH = DATA_DIR / "enrichment.sqlite"   # Per-stage cleaning results
+CACHE_DIR = DATA_DIR / "cache"               # Compiled config and other derived artifacts
+JOB_STORE_PATH = DATA_DIR / "jobs.sqlite"    # Every cleaned posting, upserted each run
+EXPORT_JSON = True                           # Also export this run's postings (skip with --no-json)
+EXPORT_FORMAT = "ndjson"                     # "ndjson" (streamed, one posting per line) | "json" (array)
+EXPORT_GZIP = False                          # ndjson only: write jobs.ndjson.gz
+EXPORT_KEEP = 3                              # Previous exports kept as jobs.1.ndjson, jobs.2.ndjson, …
+HISTORY_DIR = DATA_DIR / "history"           # Columnar run history, date=YYYY-MM-DD/ partitions
+EXPORT_HISTORY = True                        # Write a history partition each run (needs pyarrow)
+HISTORY_FORMAT = "parquet"                   # "parquet" | "arrow" (Arrow IPC / Feather v2)
+HISTORY_COMPRESSION = "zstd"
+ARCHIVE_PATH = DATA_DIR / "archive" / "postings"   # .rec/.idx/.fpt, appended each run
+EXPORT_ARCHIVE = True
+RAW_PAGES_DIR = DATA_DIR / "raw_pages"       # Fetched HTML by content hash, for audits/re-parsing
+ARCHIVE_RAW_PAGES = True
+RAW_PAGES_LEVEL = 9                          # zstd / zlib compression level (zlib caps at 9)
+RAW_PAGES_DICT_SAMPLES = 8                   # Pages stored per portal before its dictionary is built
+RAW_PAGES_DICT_SIZE = 64 * 1024              # zstd dictionary size (zlib presets are 32 KB)
+SEARCH_INDEX_DIR = DATA_DIR / "search"       # BM25 full-text index, updated each run
+BM25_K1 = 1.2                                # Term-frequency saturation
+BM25_B = 0.75                                # Document-length normalization
+SEARCH_TITLE_WEIGHT = 2                      # Title terms count this many times
+
+# ── Local API ─────────────────────────────────────────────────────
+API_HOST = "127.0.0.1"
+API_PORT = 8765
+API_CACHE_SIZE = 256                         # Encoded responses kept (LRU)
+API_DEFAULT_LIMIT = 50
+API_MAX_LIMIT = 500
+
+# ── Dashboard ─────────────────────────────────────────────────────
+DASHBOARD_GZIP_MIN_BYTES = 256 * 1024        # Embedded data chunks this large are gzip+base64 (None: never)
+DASHBOARD_CACHE_DIR = CACHE_DIR / "dashboard"   # Chart specs / data chunks by input hash (None: no cache)
+DASHBOARD_OUTPUT = "html"                    # "html" (self-contained dashboard.html) | "site" (sharded static dir)
+DASHBOARD_SITE_DIR = Path(__file__).resolve().parent / "dashboard_site"
+DASHBOARD_SHARD_BY = "month"                 # Site shards: "month" (of first_seen) | "zone"
+
 # ── Urabá Municipalities ─────────────────────────────────────────
 URABA_MUNICIPALITIES = {
     "Apartadó":           ["apartado", "apartadó", "apartad"],
@@ -27,6 +71,30 @@ URABA_MUNICIPALITIES = {
     "Dabeiba":            ["dabeiba"],
 }
 
+# Veredas / corregimientos, mapped to their parent municipality
+URABA_PLACES = {
+    "Apartadó":         ["san josé de apartadó", "el reposo", "churidó", "puerto girón"],
+    "Turbo":            ["currulao", "nueva colonia", "nueva antioquia", "bocas del atrato",
+                         "lomas aisladas", "san josé de mulatos"],
+    "Carepa":           ["piedras blancas", "zungo embarcadero", "zungo carretera"],
+    "Chigorodó":        ["barranquillita"],
+    "Necoclí":          ["mulatos", "el totumo"],
+    "Mutatá":           ["pavarandocito"],
+    "Dabeiba":          ["urama", "camparrusia"],
+    "Vigía del Fuerte": ["buchadó"],
+}
+
+# Optional CSV of extra places (columns: name, municipality), e.g. a full
+# Antioquia/Chocó list; places in untracked municipalities count as PARENT_ZONE
+GAZETTEER_FILE = None
+
+# Region-level fallbacks when no municipality matches
+REGION_KEYWORDS = ["urabá", "uraba"]
+PARENT_REGION_KEYWORDS = ["antioquia"]
+GENERIC_ZONE = "Urabá (General)"
+PARENT_ZONE = "Antioquia (Other)"
+UNKNOWN_ZONE = "Sin especificar"
+
 # ── Urabá-specific search terms for each portal ──────────────────
 SEARCH_LOCATIONS = [
     "apartado",
@@ -63,6 +131,25 @@ BENEFITS_MAP = {
     "Comisiones":       ["comisión", "comision", "comisiones", "variable"],
 }
 
+# ── Salary Parsing ────────────────────────────────────────────────
+SMMLV = 1_750_905          # Salario mínimo mensual legal vigente 2026 (COP)
+MONTHLY_HOURS = 210        # Hourly rate → monthly (42h/week legal maximum)
+MONTHLY_DAYS = 30          # Daily rate → monthly
+SALARY_CACHE_SIZE = 8192   # Distinct raw salary strings memoized per process
+
+# ── Deduplication ─────────────────────────────────────────────────
+NEAR_DUPLICATE_DETECTION = True
+NEAR_DUP_THRESHOLD = 0.7       # Estimated Jaccard similarity to merge two postings
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16                 # 16 bands × 4 rows
+LSH_MAX_BUCKET_CHECKS = 50     # Bucket members each posting is verified against
+SHINGLE_SIZE = 5               # Character shingles over title + company + description
+
+# Company names that carry no identity
+PLACEHOLDER_COMPANIES = {
+    "", "n/a", "na", "confidencial", "empresa confidencial", "importante empresa",
+}
+
 # ── Relevance Scoring ─────────────────────────────────────────────
 STRONG_RELEVANCE_KEYWORDS = [
     "apartadó", "apartado", "turbo", "urabá", "uraba",
@@ -79,3 +166,30 @@ NEGATIVE_RELEVANCE_KEYWORDS = [
     "bogotá", "bogota", "medellín", "medellin", "cali",
     "barranquilla", "cartagena", "bucaramanga",
 ]
+
+# "rules" reproduces the original step scoring with the thresholds below;
+# "weighted" scores a linear combination of the features with RELEVANCE_WEIGHTS
+RELEVANCE_MODE = "rules"
+
+RELEVANCE_RULES = {
+    "strong_one": 0.85,        # One strong keyword
+    "strong_two": 1.0,         # Two or more
+    "zone": 0.9,               # Zone is a municipality or the region
+    "medium": 0.5,             # Any medium keyword, when nothing stronger matched
+    "negative_step": 0.3,      # Penalty per negative keyword…
+    "negative_below": 0.8,     # …applied only to scores under this
+    "negative_min": 0.1,       # …never going below this
+    "floor": 0.3,              # Score when nothing matched at all
+}
+
+RELEVANCE_WEIGHTS = {
+    "bias": 0.3,
+    "strong": 0.3,             # Per strong keyword, up to strong_cap hits
+    "strong_cap": 2,
+    "medium": 0.1,             # Any medium keyword
+    "negative": -0.2,          # Per negative keyword
+    "zone": {"municipality": 0.4, "region": 0.3, "parent": 0.0, "unknown": 0.0},
+    "source": {},              # Per-portal adjustment, e.g. {"Comfama": 0.05}
+    "salary": 0.0,             # Posting states a salary
+    "min": 0.1,
+}
@@ -0,0 +1,202 @@
+"""Single-pass aggregation of everything the dashboard shows.
+
+``DashboardAggregates`` walks the postings once (a JobBatch column-wise, or
+any iterable of JobPosting) and keeps counters plus streaming numeric
+accumulators; the stat cards and every chart are derived from it, so
+building a dashboard needs neither pandas nor plotly.
+
+Distributions are summarized here too (box statistics, histogram bins), so
+chart specs stay the same size however many postings there are.
+"""
+
+import hashlib
+import math
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from data_schema import JobBatch, JobPosting
+
+MAX_OUTLIERS = 50       # Outlier points drawn per box (evenly spaced, extremes kept)
+RELEVANCE_BINS = 10     # Relevance histogram bins over [0, 1]
+
+
+def ranked(counter: Counter, n: Optional[int] = None) -> List[Tuple[str, int]]:
+    """``counter.most_common(n)`` with ties broken by key, so the order doesn't
+    depend on the order the postings were counted in."""
+    return sorted(counter.items(), key=lambda kv: (-kv[1], str(kv[0])))[:n]
+
+
+class ValueStats:
+    """Streaming count/mean/sd/min/max (Welford); with ``keep_values``, also the
+    values themselves for exact quantiles and box statistics."""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max", "values")
+
+    def __init__(self, keep_values: bool = True):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.values = array("d") if keep_values else None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if self.values is not None:
+            self.values.append(value)
+
+    def digest(self) -> str:
+        """Hash of the kept values as a multiset (the order they were added in doesn't matter)."""
+        return hashlib.blake2b(self._sorted().tobytes(), digest_size=16).hexdigest()
+
+    def _sorted(self) -> np.ndarray:
+        return np.sort(np.frombuffer(self.values, dtype=np.float64))
+
+    @property
+    def sd(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Exact, linearly interpolated quantiles."""
+        if not self.count:
+            return [math.nan] * len(qs)
+        return np.quantile(np.frombuffer(self.values, dtype=np.float64), qs).tolist()
+
+    def box(self, max_outliers: int = MAX_OUTLIERS) -> dict:
+        """Tukey box statistics: quartiles, fences (most extreme values within
+        1.5 IQR of the box), mean/sd and at most ``max_outliers`` outliers.
+
+        The result depends only on the values, not on the order they were added in.
+        """
+        values = self._sorted()
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75]).tolist()
+        iqr = q3 - q1
+        inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+        outliers = values[(values < inside[0]) | (values > inside[-1])]
+        if len(outliers) > max_outliers:
+            outliers = outliers[np.linspace(0, len(outliers) - 1, max_outliers).round().astype(int)]
+        return {
+            "q1": q1, "median": median, "q3": q3,
+            "lowerfence": float(inside[0]), "upperfence": float(inside[-1]),
+            # From the sorted values, so row order can't change the last digits
+            "mean": float(values.mean()), "sd": float(values.std(ddof=1)) if self.count > 1 else 0.0,
+            "count": self.count,
+            "outliers": outliers.tolist(),
+        }
+
+
+class Histogram:
+    """Fixed-width bin counts over [lo, hi]; values outside are clipped to the end bins."""
+
+    __slots__ = ("lo", "hi", "counts")
+
+    def __init__(self, bins: int, lo: float = 0.0, hi: float = 1.0):
+        self.lo, self.hi = lo, hi
+        self.counts = [0] * bins
+
+    def add(self, value: float) -> None:
+        bins = len(self.counts)
+        # The epsilon keeps e.g. 0.3 out of the [0.2, 0.3) bin despite float error
+        k = int((value - self.lo) / (self.hi - self.lo) * bins + 1e-9)
+        self.counts[min(max(k, 0), bins - 1)] += 1
+
+    @property
+    def width(self) -> float:
+        return (self.hi - self.lo) / len(self.counts)
+
+    @property
+    def centers(self) -> List[float]:
+        return [round(self.lo + (k + 0.5) * self.width, 10) for k in range(len(self.counts))]
+
+
+class DashboardAggregates:
+    """Counters and value stats for the stat cards and the six charts."""
+
+    def __init__(self):
+        self.total = 0
+        self.zones: Counter = Counter()
+        self.contracts: Counter = Counter()
+        self.sources: Counter = Counter()
+        self.companies: Counter = Counter()
+        self.salary_min = ValueStats(keep_values=False)         # Rows with a salary_min …
+        self.salary_max_paired = ValueStats(keep_values=False)  # … and their salary_max, if any
+        self.salary_by_zone: Dict[str, ValueStats] = {}
+        self.salary_zones: Counter = Counter()    # Rows with a salary_max, per zone
+        self.relevance = Histogram(RELEVANCE_BINS)
+
+    @classmethod
+    def from_jobs(cls, jobs: Union[JobBatch, Iterable[JobPosting]]) -> "DashboardAggregates":
+        agg = cls()
+        if isinstance(jobs, JobBatch):
+            agg.add_batch(jobs)
+        else:
+            for job in jobs:
+                agg.add(job.zone, job.contract_type, job.source, job.company,
+                        job.salary_min, job.salary_max, job.relevance_score)
+        return agg
+
+    def add_batch(self, batch: JobBatch) -> None:
+        """One pass over the batch's columns (no JobPosting per row)."""
+        columns = [batch.column(name) for name in (
+            "zone", "contract_type", "source", "company", "salary_min", "salary_max", "relevance_score",
+        )]
+        for row in zip(*columns):
+            self.add(*row)
+
+    def add(
+        self,
+        zone: str,
+        contract_type: str,
+        source: str,
+        company: str,
+        salary_min: Optional[float],
+        salary_max: Optional[float],
+        relevance: float,
+    ) -> None:
+        self.total += 1
+        self.zones[zone] += 1
+        self.contracts[contract_type] += 1
+        self.sources[source] += 1
+        self.companies[company] += 1
+        if salary_min is not None:
+            self.salary_min.add(salary_min)
+            if salary_max is not None:
+                self.salary_max_paired.add(salary_max)
+        if salary_max is not None:
+            self.salary_zones[zone] += 1
+            stats = self.salary_by_zone.get(zone)
+            if stats is None:
+                stats = self.salary_by_zone[zone] = ValueStats()
+            stats.add(salary_max)
+        self.relevance.add(relevance)
+
+    # ── Stat cards ────────────────────────────────────────────────
+    @property
+    def avg_salary(self) -> Optional[float]:
+        """Mean of the salary_min and salary_max means, over postings with a salary_min."""
+        if not self.salary_min.count:
+            return None
+        if not self.salary_max_paired.count:
+            return self.salary_min.mean
+        return (self.salary_min.mean + self.salary_max_paired.mean) / 2
+
+    def stats(self) -> dict:
+        return {
+            "total_jobs": self.total,
+            "zones": len(self.zones),
+            "companies": len(self.companies),
+            "permanent": self.contracts["permanente"],
+            "temporal": self.contracts["temporal"],
+            "avg_salary": self.avg_salary,
+            "sources": len(self.sources),
+        }
@@ -0,0 +1,80 @@
+"""Content-addressed cache of dashboard HTML fragments.
+
+Each fragment (a chart spec, an embedded data chunk) is stored under
+``<name>-<digest>`` where the digest hashes whatever the fragment is built
+from: a chart's input aggregate, a chunk's JSON text. When the input is
+unchanged the fragment is read back instead of rebuilt, so regenerating a
+dashboard over mostly identical data skips the chart building and, above all,
+re-gzipping the table.
+
+Only the latest fragment per name is kept.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Callable, Union
+
+import config
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2       # Bump when fragment builders change their output
+
+
+def _key_bytes(key) -> bytes:
+    if isinstance(key, (bytes, bytearray, memoryview)):
+        return bytes(key)
+    if isinstance(key, str):
+        return key.encode("utf-8")
+    return json.dumps(key, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class FragmentCache:
+    """Fragments on disk under ``root``, keyed by name and input digest."""
+
+    def __init__(self, root: Union[str, Path] = config.DASHBOARD_CACHE_DIR):
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(name: str, key) -> str:
+        h = hashlib.blake2b(f"{CACHE_VERSION}:{name}:".encode("utf-8"), digest_size=16)
+        h.update(_key_bytes(key))
+        return h.hexdigest()
+
+    def get(self, name: str, key, build: Callable[[], str]) -> str:
+        """The fragment ``name`` for input ``key``; ``build()`` runs only on a miss.
+
+        ``key`` is bytes, text, or anything JSON-serializable.
+        """
+        path = self.root / f"{name}-{self.digest(name, key)}"
+        try:
+            text = path.read_text(encoding="utf-8")
+            self.hits += 1
+            return text
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Ignoring unreadable dashboard fragment %s: %s", path, exc)
+
+        self.misses += 1
+        text = build()
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            for stale in self.root.glob(f"{name}-*"):
+                stale.unlink()
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(text, encoding="utf-8")
+            tmp.replace(path)
+        except OSError as exc:
+            logger.warning("Could not cache dashboard fragment %s: %s", name, exc)
+        return text
+
+    def clear(self) -> None:
+        if self.root.is_dir():
+            for path in self.root.iterdir():
+                path.unlink()
+
@@ -0,0 +1,58 @@
+"""Precomputed facet bitsets for the dashboard's client-side filters.
+
+For every zone, contract type and source value (and every relevance
+threshold) the page gets a bitset over row ids plus its count, so filtering
+is a word-wise AND and live option counts are popcounts; nothing is derived
+from the rows in the browser.
+
+Bitsets are little-endian uint32 words (row ``i`` is bit ``i % 32`` of word
+``i // 32``), base64-encoded.
+"""
+
+import base64
+from typing import Dict
+
+import numpy as np
+
+from data_schema import JobBatch
+
+FACET_FIELDS = ("zone", "contract_type", "source")
+RELEVANCE_THRESHOLDS = (0.5, 0.8, 0.9)      # The "Relevancia mín." options
+
+
+def encode_bitset(mask: np.ndarray) -> str:
+    """Boolean row mask → base64 of little-endian uint32 words."""
+    words = -(-len(mask) // 32)
+    packed = np.packbits(mask, bitorder="little")
+    buf = np.zeros(words * 4, dtype=np.uint8)
+    buf[:len(packed)] = packed
+    return base64.b64encode(buf.tobytes()).decode("ascii")
+
+
+def facet_index(batch: JobBatch) -> Dict[str, dict]:
+    """{facet: {"values": [...], "counts": [...], "bits": [base64, ...]}}.
+
+    Values are sorted as the dropdowns list them. ``relevance`` values are
+    the thresholds as strings, each bitset holding the rows scoring at least
+    that much.
+    """
+    index = {}
+    for name in FACET_FIELDS:
+        codes = np.frombuffer(batch.codes(name), dtype=np.int32) if len(batch) else np.empty(0, np.int32)
+        categories = batch.categories(name)
+        counts = np.bincount(codes, minlength=len(categories))
+        order = sorted((v, c) for c, v in enumerate(categories) if counts[c])
+        index[name] = {
+            "values": [v for v, _ in order],
+            "counts": [int(counts[c]) for _, c in order],
+            "bits": [encode_bitset(codes == c) for _, c in order],
+        }
+
+    scores = np.array(batch.column("relevance_score"), dtype=np.float64)
+    masks = [scores >= t for t in RELEVANCE_THRESHOLDS]
+    index["relevance"] = {
+        "values": [str(t) for t in RELEVANCE_THRESHOLDS],
+        "counts": [int(m.sum()) for m in masks],
+        "bits": [encode_bitset(m) for m in masks],
+    }
+    return index
@@ -2,13 +2,18 @@
 
 import json
 import logging
-from typing import List
-
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-
-from data_schema import JobPosting
+from pathlib import Path
+from typing import List, Optional, Union
+
+from data_schema import JobBatch, JobPosting
+from storage.archive import field_needle
+import config
+from .aggregates import DashboardAggregates, ranked
+from .cache import FragmentCache
+from .facets import facet_index
+from .payload import chunk_json, descriptions_payload, encode_chunk, script_safe, table_payload
+from .prefix_index import prefix_index
+from .site import SHARD_KEYS, remove_stale, shard_rows, shard_slug, write_static
 
 logger = logging.getLogger(__name__)
 
@@ -21,168 +26,263 @@ COLORS = {
     "danger": "#dc2626",
     "info": "#0284c7",
 }
-PALETTE = px.colors.qualitative.Set2
+# plotly.express.colors.qualitative.Set2
+PALETTE = [
+    "rgb(102,194,165)", "rgb(252,141,98)", "rgb(141,160,203)", "rgb(231,138,195)",
+    "rgb(166,216,84)", "rgb(255,217,47)", "rgb(229,196,148)", "rgb(179,179,179)",
+]
+MARGIN = {"l": 10, "r": 10, "t": 40, "b": 30}
+
+
+def _layout(title: str, **kwargs) -> dict:
+    return {"title": {"text": title}, "margin": MARGIN, "height": 400, **kwargs}
+
+
+CHARTS = ("jobs_by_zone", "contract_types", "salary_distribution", "sources", "relevance", "top_companies")
 
 
 class DashboardGenerator:
-    def __init__(self, jobs: List[JobPosting]):
-        self.jobs = jobs
-        self.df = pd.DataFrame([j.to_dict() for j in jobs])
+    def __init__(self, jobs: Union[List[JobPosting], JobBatch], cache: Union[FragmentCache, bool, None] = None):
+        """``cache`` defaults to a FragmentCache under config.DASHBOARD_CACHE_DIR
+        (none if that is None); pass ``False`` to build every fragment."""
+        self.batch = jobs if isinstance(jobs, JobBatch) else JobBatch.from_jobs(jobs)
+        self.aggregates = DashboardAggregates.from_jobs(self.batch)
+        if cache is None and config.DASHBOARD_CACHE_DIR is not None:
+            cache = FragmentCache()
+        self.cache = cache or None
+
+    @classmethod
+    def from_store(cls, store, **filters) -> "DashboardGenerator":
+        """Dashboard over the postings of a JobStore matching ``filters``."""
+        return cls(store.batch(**filters))
+
+    @classmethod
+    def from_archive(cls, archive, zone: Optional[str] = None) -> "DashboardGenerator":
+        """Dashboard over the latest record of each posting in a PostingArchive.
+
+        Only the selected records are decoded; with ``zone``, records of other
+        zones are skipped on their raw bytes.
+        """
+        view = archive.latest()
+        if zone is not None:
+            view = archive.select(
+                lambda job: job.zone == zone,
+                contains=[field_needle("zone", zone)],
+                within=view.ordinals,
+            )
+        return cls(view.to_batch())
 
     # ── Stats ─────────────────────────────────────────────────────
     def _stats(self) -> dict:
-        df = self.df
-        avg_sal = None
-        if not df.empty and "salary_min" in df.columns:
-            sal_data = df.dropna(subset=["salary_min"])
-            if not sal_data.empty:
-                avg_sal = sal_data[["salary_min", "salary_max"]].mean().mean()
+        return self.aggregates.stats()
 
+    # ── Charts ────────────────────────────────────────────────────
+    def _chart_inputs(self) -> dict:
+        """The part of the aggregates each chart is drawn from (its cache key)."""
+        agg = self.aggregates
         return {
-            "total_jobs": len(df),
-            "zones": int(df["zone"].nunique()) if not df.empty else 0,
-            "companies": int(df["company"].nunique()) if not df.empty else 0,
-            "permanent": int((df["contract_type"] == "permanente").sum()) if not df.empty else 0,
-            "temporal": int((df["contract_type"] == "temporal").sum()) if not df.empty else 0,
-            "avg_salary": avg_sal,
-            "sources": int(df["source"].nunique()) if not df.empty else 0,
+            "jobs_by_zone": ranked(agg.zones, 15),
+            "contract_types": ranked(agg.contracts),
+            "salary_distribution": [
+                (zone, agg.salary_by_zone[zone].digest()) for zone, _ in ranked(agg.salary_zones, 8)
+            ],
+            "sources": ranked(agg.sources),
+            "relevance": agg.relevance.counts,
+            "top_companies": ranked(agg.companies, 10),
         }
 
-    # ── Charts ────────────────────────────────────────────────────
-    def _chart_jobs_by_zone(self) -> str:
-        counts = self.df["zone"].value_counts().head(15)
-        fig = go.Figure(go.Bar(
-            x=counts.values,
-            y=counts.index,
-            orientation="h",
-            marker_color=COLORS["primary"],
-        ))
-        fig.update_layout(
-            title="Empleos por Municipio / Zona",
-            xaxis_title="Cantidad",
-            yaxis_title="",
-            yaxis=dict(autorange="reversed"),
-            margin=dict(l=10, r=10, t=40, b=30),
-            height=400,
-        )
-        return fig.to_json()
-
-    def _chart_contract_types(self) -> str:
-        counts = self.df["contract_type"].value_counts()
-        fig = go.Figure(go.Pie(
-            labels=counts.index,
-            values=counts.values,
-            hole=0.4,
-            marker_colors=PALETTE,
-        ))
-        fig.update_layout(
-            title="Tipo de Contrato",
-            margin=dict(l=10, r=10, t=40, b=30),
-            height=400,
-        )
-        return fig.to_json()
-
-    def _chart_salary_distribution(self) -> str:
-        sal = self.df.dropna(subset=["salary_max"])
-        if sal.empty:
-            fig = go.Figure()
-            fig.add_annotation(text="No hay datos de salario disponibles", showarrow=False)
-            fig.update_layout(title="Distribución Salarial por Zona", height=400)
-            return fig.to_json()
-
-        fig = go.Figure()
-        top_zones = sal["zone"].value_counts().head(8).index
-        for zone in top_zones:
-            zone_data = sal[sal["zone"] == zone]
-            fig.add_trace(go.Box(
-                y=zone_data["salary_max"],
-                name=zone,
-                boxmean="sd",
-            ))
-        fig.update_layout(
-            title="Distribución Salarial por Zona (COP)",
-            yaxis_title="Salario máximo (COP)",
-            margin=dict(l=10, r=10, t=40, b=30),
-            height=400,
-            showlegend=False,
-        )
-        return fig.to_json()
-
-    def _chart_sources(self) -> str:
-        counts = self.df["source"].value_counts()
-        fig = go.Figure(go.Bar(
-            x=counts.index,
-            y=counts.values,
-            marker_color=PALETTE[:len(counts)],
-        ))
-        fig.update_layout(
-            title="Empleos por Fuente",
-            xaxis_title="Portal",
-            yaxis_title="Cantidad",
-            margin=dict(l=10, r=10, t=40, b=30),
-            height=400,
-        )
-        return fig.to_json()
-
-    def _chart_relevance(self) -> str:
-        fig = go.Figure(go.Histogram(
-            x=self.df["relevance_score"],
-            nbinsx=10,
-            marker_color=COLORS["secondary"],
-        ))
-        fig.update_layout(
-            title="Distribución de Relevancia para Urabá",
-            xaxis_title="Puntaje de Relevancia",
-            yaxis_title="Cantidad",
-            margin=dict(l=10, r=10, t=40, b=30),
-            height=400,
-        )
-        return fig.to_json()
-
-    def _chart_top_companies(self) -> str:
-        counts = self.df["company"].value_counts().head(10)
-        fig = go.Figure(go.Bar(
-            x=counts.values,
-            y=counts.index,
-            orientation="h",
-            marker_color=COLORS["info"],
-        ))
-        fig.update_layout(
-            title="Top 10 Empresas con Más Vacantes",
-            xaxis_title="Cantidad",
-            yaxis=dict(autorange="reversed"),
-            margin=dict(l=10, r=10, t=40, b=30),
-            height=400,
-        )
-        return fig.to_json()
+    # Each returns a Plotly figure spec ({"data": [...], "layout": {...}})
+    def _chart_jobs_by_zone(self) -> dict:
+        counts = ranked(self.aggregates.zones, 15)
+        return {
+            "data": [{
+                "type": "bar", "orientation": "h",
+                "x": [n for _, n in counts], "y": [z for z, _ in counts],
+                "marker": {"color": COLORS["primary"]},
+            }],
+            "layout": _layout(
+                "Empleos por Municipio / Zona",
+                xaxis={"title": {"text": "Cantidad"}}, yaxis={"title": {"text": ""}, "autorange": "reversed"},
+            ),
+        }
+
+    def _chart_contract_types(self) -> dict:
+        counts = ranked(self.aggregates.contracts)
+        return {
+            "data": [{
+                "type": "pie", "hole": 0.4,
+                "labels": [c for c, _ in counts], "values": [n for _, n in counts],
+                "marker": {"colors": PALETTE},
+            }],
+            "layout": _layout("Tipo de Contrato"),
+        }
+
+    def _chart_salary_distribution(self) -> dict:
+        agg = self.aggregates
+        if not agg.salary_zones:
+            return {
+                "data": [],
+                "layout": {
+                    "title": {"text": "Distribución Salarial por Zona"}, "height": 400,
+                    "annotations": [{"text": "No hay datos de salario disponibles", "showarrow": False}],
+                },
+            }
+        # Boxes from precomputed statistics; outliers (capped) as one marker trace
+        traces, outlier_x, outlier_y = [], [], []
+        for zone, _ in ranked(agg.salary_zones, 8):
+            box = agg.salary_by_zone[zone].box()
+            traces.append({
+                "type": "box", "name": zone, "x": [zone],
+                **{key: [box[key]] for key in ("q1", "median", "q3", "lowerfence", "upperfence", "mean", "sd")},
+                "boxmean": "sd",
+            })
+            outlier_x += [zone] * len(box["outliers"])
+            outlier_y += box["outliers"]
+        if outlier_y:
+            traces.append({
+                "type": "scatter", "mode": "markers", "name": "Atípicos",
+                "x": outlier_x, "y": outlier_y, "marker": {"size": 5, "color": "#6b7280"},
+            })
+        return {
+            "data": traces,
+            "layout": _layout(
+                "Distribución Salarial por Zona (COP)",
+                yaxis={"title": {"text": "Salario máximo (COP)"}}, showlegend=False,
+            ),
+        }
+
+    def _chart_sources(self) -> dict:
+        counts = ranked(self.aggregates.sources)
+        return {
+            "data": [{
+                "type": "bar",
+                "x": [s for s, _ in counts], "y": [n for _, n in counts],
+                "marker": {"color": [PALETTE[i % len(PALETTE)] for i in range(len(counts))]},
+            }],
+            "layout": _layout(
+                "Empleos por Fuente",
+                xaxis={"title": {"text": "Portal"}}, yaxis={"title": {"text": "Cantidad"}},
+            ),
+        }
+
+    def _chart_relevance(self) -> dict:
+        hist = self.aggregates.relevance
+        return {
+            "data": [{
+                "type": "bar",
+                "x": hist.centers, "y": hist.counts, "width": hist.width,
+                "marker": {"color": COLORS["secondary"]},
+            }],
+            "layout": _layout(
+                "Distribución de Relevancia para Urabá",
+                xaxis={"title": {"text": "Puntaje de Relevancia"}}, yaxis={"title": {"text": "Cantidad"}},
+            ),
+        }
+
+    def _chart_top_companies(self) -> dict:
+        counts = ranked(self.aggregates.companies, 10)
+        return {
+            "data": [{
+                "type": "bar", "orientation": "h",
+                "x": [n for _, n in counts], "y": [c for c, _ in counts],
+                "marker": {"color": COLORS["info"]},
+            }],
+            "layout": _layout(
+                "Top 10 Empresas con Más Vacantes",
+                xaxis={"title": {"text": "Cantidad"}}, yaxis={"autorange": "reversed"},
+            ),
+        }
 
     # ── HTML Generation ───────────────────────────────────────────
+    def _fragment(self, name: str, key, build) -> str:
+        return build() if self.cache is None else self.cache.get(name, key, build)
+
+    def _chunk(self, chunk_id: str, data) -> str:
+        """Embedded data chunk, keyed by its JSON so an unchanged one isn't re-gzipped."""
+        text = chunk_json(data)
+        return self._fragment(f"chunk-{chunk_id}", text, lambda: encode_chunk(chunk_id, text))
+
+    def _charts_json(self) -> str:
+        """{"c1": spec, …} for the six charts, from cached fragments where unchanged."""
+        inputs = self._chart_inputs()
+        charts = [
+            self._fragment(
+                f"chart-{name}", inputs[name],
+                lambda name=name: json.dumps(getattr(self, f"_chart_{name}")(), ensure_ascii=False),
+            )
+            for name in CHARTS
+        ]
+        return "{\n" + ",\n".join(f'    "c{k}": {spec}' for k, spec in enumerate(charts, 1)) + "\n}"
+
     def generate(self, output_path: str):
-        """Build and write the complete dashboard HTML file."""
+        """Build and write the complete dashboard HTML file.
+
+        Charts and data chunks whose inputs are unchanged since the last run
+        are reused from the fragment cache.
+        """
         stats = self._stats()
-        charts = {
-            "jobs_by_zone": self._chart_jobs_by_zone(),
-            "contract_types": self._chart_contract_types(),
-            "salary_distribution": self._chart_salary_distribution(),
-            "sources": self._chart_sources(),
-            "relevance": self._chart_relevance(),
-            "top_companies": self._chart_top_companies(),
-        }
+        hits, misses = (self.cache.hits, self.cache.misses) if self.cache is not None else (0, 0)
+        charts = script_safe(self._charts_json())
 
-        # Prepare table data (JSON-serializable)
-        table_data = json.dumps(
-            [j.to_dict() for j in self.jobs],
-            ensure_ascii=False,
-            default=str,
-        )
+        # Table rows as compact column chunks; descriptions are decoded on
+        # demand, the search index by the page's search worker
+        data_chunks = "\n".join([
+            self._chunk("tableData", table_payload(self.batch)),
+            self._chunk("descriptions", descriptions_payload(self.batch)),
+            self._chunk("searchIndex", prefix_index(self.batch)),
+        ])
+        facets_data = script_safe(json.dumps(facet_index(self.batch), ensure_ascii=False))
 
-        html = self._build_html(stats, charts, table_data)
+        html = self._build_html(stats, charts, facets_data, data_chunks, site_json="null")
 
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(html)
-        logger.info("Dashboard written to %s", output_path)
+        if self.cache is not None:
+            logger.info("Dashboard written to %s (%d cached fragments reused, %d rebuilt)",
+                        output_path, self.cache.hits - hits, self.cache.misses - misses)
+        else:
+            logger.info("Dashboard written to %s", output_path)
+
+    def generate_site(self, output_dir: Union[str, Path], shard_by: str = config.DASHBOARD_SHARD_BY) -> Path:
+        """Write the dashboard as a static directory of sharded data (see
+        dashboard/site.py); returns the path of its index.html.
+
+        Only files whose content changed are rewritten (and re-compressed);
+        shards that no longer exist are removed.
+        """
+        output_dir = Path(output_dir)
+        shards, files = [], set()
+        for key, rows in shard_rows(self.batch, shard_by):
+            slug = shard_slug(key)
+            while f"{slug}.json" in files:
+                slug += "-"
+            shard = self.batch.take(rows)
+            table = table_payload(shard)
+            table["facets"] = facet_index(shard)
+            chunks = {
+                "tableData": (f"{slug}.json", table),
+                "descriptions": (f"{slug}.descriptions.json", descriptions_payload(shard)),
+                "searchIndex": (f"{slug}.search.json", prefix_index(shard)),
+            }
+            for name, data in chunks.values():
+                write_static(output_dir / "data" / name, chunk_json(data).encode("utf-8"))
+                files.add(name)
+            shards.append({
+                "label": key, "n": len(rows), **{chunk_id: f"data/{name}" for chunk_id, (name, _) in chunks.items()},
+            })
+        remove_stale(output_dir / "data", files)
+
+        write_static(output_dir / "charts.json", self._charts_json().encode("utf-8"))
+        site = {"charts": "charts.json", "label": SHARD_KEYS[shard_by], "shards": shards}
+        html = self._build_html(
+            self._stats(), "null", "null", "", site_json=script_safe(json.dumps(site, ensure_ascii=False)),
+        )
+        index_path = output_dir / "index.html"
+        write_static(index_path, html.encode("utf-8"))
+        logger.info("Dashboard site written to %s (%d %s shards)", output_dir, len(shards), shard_by)
+        return index_path
 
-    def _build_html(self, stats: dict, charts: dict, table_json: str) -> str:
+    def _build_html(self, stats: dict, charts_json: str, facets_json: str, data_chunks: str, site_json: str) -> str:
         avg_sal_display = "N/A"
         if stats["avg_salary"]:
             avg_sal_display = f"${stats['avg_salary']:,.0f}"
@@ -272,8 +372,19 @@ th {{
 th:hover {{ background: #f3f4f6; }}
 th .arrow {{ font-size: 0.7em; margin-left: 4px; opacity: 0.4; }}
 th.sorted .arrow {{ opacity: 1; color: #4f46e5; }}
-td {{ padding: 10px 14px; border-bottom: 1px solid #f3f4f6; }}
+td {{
+    padding: 10px 14px; border-bottom: 1px solid #f3f4f6; height: 44px;
+    white-space: nowrap; overflow: hidden; text-overflow: ellipsis; max-width: 340px;
+}}
 tr:hover {{ background: #faf5ff; }}
+.table-scroll {{ max-height: 70vh; overflow-y: auto; }}
+.table-scroll thead th {{ position: sticky; top: 0; z-index: 1; }}
+tr.spacer, tr.spacer:hover {{ background: none; }}
+tbody tr[data-row] {{ cursor: pointer; }}
+.detail {{ padding: 16px 20px; border-top: 1px solid #e5e7eb; background: #fafafa; }}
+.detail-head {{ display: flex; gap: 12px; align-items: center; }}
+.detail-head .meta {{ color: #6b7280; font-size: 0.9em; flex: 1; }}
+.detail p {{ margin-top: 10px; white-space: pre-line; line-height: 1.5; color: #374151; }}
 .badge {{
     display: inline-block; padding: 3px 8px; border-radius: 4px;
     font-size: 0.8em; font-weight: 600;
@@ -334,18 +445,17 @@ a.job-link:hover {{ text-decoration: underline; }}
 <!-- Filters -->
 <div class="filters">
     <div class="filter-row">
+        <div class="filter-group" id="shardGroup" style="display:none">
+            <label id="shardLabel"></label>
+            <select id="fShard"></select>
+        </div>
         <div class="filter-group">
             <label>Zona</label>
             <select id="fZone"><option value="">Todas</option></select>
         </div>
         <div class="filter-group">
             <label>Tipo Contrato</label>
-            <select id="fContract">
-                <option value="">Todos</option>
-                <option value="permanente">Permanente</option>
-                <option value="temporal">Temporal</option>
-                <option value="sin especificar">Sin especificar</option>
-            </select>
+            <select id="fContract"><option value="">Todos</option></select>
         </div>
         <div class="filter-group">
             <label>Fuente</label>
@@ -353,16 +463,11 @@ a.job-link:hover {{ text-decoration: underline; }}
         </div>
         <div class="filter-group">
             <label>Buscar</label>
-            <input type="text" id="fSearch" placeholder="Título, empresa...">
+            <input type="text" id="fSearch" placeholder="Título, empresa, descripción...">
         </div>
         <div class="filter-group">
             <label>Relevancia mín.</label>
-            <select id="fRelevance">
-                <option value="0">Cualquiera</option>
-                <option value="0.5">≥ 50%</option>
-                <option value="0.8">≥ 80%</option>
-                <option value="0.9">≥ 90%</option>
-            </select>
+            <select id="fRelevance"><option value="0">Cualquiera</option></select>
         </div>
         <button class="btn btn-outline" onclick="resetFilters()">Limpiar</button>
     </div>
@@ -374,132 +479,467 @@ a.job-link:hover {{ text-decoration: underline; }}
         <h2>Listado de Ofertas</h2>
         <span class="count" id="rowCount"></span>
     </div>
+    <div class="table-scroll" id="tableScroll">
     <table>
         <thead>
             <tr>
-                <th onclick="sortBy('title')">Cargo <span class="arrow">⇅</span></th>
-                <th onclick="sortBy('company')">Empresa <span class="arrow">⇅</span></th>
-                <th onclick="sortBy('zone')">Zona <span class="arrow">⇅</span></th>
-                <th onclick="sortBy('contract_type')">Contrato <span class="arrow">⇅</span></th>
-                <th onclick="sortBy('salary_max')">Salario <span class="arrow">⇅</span></th>
-                <th onclick="sortBy('relevance_score')">Relevancia <span class="arrow">⇅</span></th>
+                <th data-col="title" onclick="sortBy('title')">Cargo <span class="arrow">⇅</span></th>
+                <th data-col="company" onclick="sortBy('company')">Empresa <span class="arrow">⇅</span></th>
+                <th data-col="zone" onclick="sortBy('zone')">Zona <span class="arrow">⇅</span></th>
+                <th data-col="contract_type" onclick="sortBy('contract_type')">Contrato <span class="arrow">⇅</span></th>
+                <th data-col="salary_max" onclick="sortBy('salary_max')">Salario <span class="arrow">⇅</span></th>
+                <th data-col="relevance_score" onclick="sortBy('relevance_score')">Relevancia <span class="arrow">⇅</span></th>
                 <th>Fuente</th>
                 <th>Ver</th>
             </tr>
         </thead>
         <tbody id="tbody"></tbody>
     </table>
+    </div>
     <div class="empty-state" id="emptyState" style="display:none">No se encontraron resultados con los filtros aplicados.</div>
+    <div class="detail" id="detail" style="display:none">
+        <div class="detail-head">
+            <strong id="detailTitle"></strong>
+            <span class="meta" id="detailMeta"></span>
+            <button class="btn btn-outline" onclick="closeDetail()">Cerrar</button>
+        </div>
+        <p id="detailText"></p>
+    </div>
 </div>
 
 </div><!-- /container -->
 
+{data_chunks}
+<script id="searchEngine">
+// Chunk decoding and prefix search over the generator's word index
+// (dashboard/prefix_index.py). The page runs this same script in a Web
+// Worker, so searches never block rendering; where workers are unavailable
+// it calls searchIndex() directly.
+async function fetchJson(url) {{
+    const res = await fetch(url);
+    if (!res.ok) throw new Error(url + ': HTTP ' + res.status);
+    return res.json();
+}}
+
+async function decodeChunk(text, gzip) {{
+    if (!gzip) return JSON.parse(text);
+    const bytes = Uint8Array.from(atob(text), c => c.charCodeAt(0));
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    return JSON.parse(await new Response(stream).text());
+}}
+
+function loadIndex(data) {{
+    const b64 = s => Uint8Array.from(atob(s), c => c.charCodeAt(0));
+    return {{n: data.n, words: data.words, offsets: new Uint32Array(b64(data.offsets).buffer), postings: b64(data.postings)}};
+}}
+
+// Same folding as processing.text.fold_accents, same words as prefix_index.words
+function queryWords(text) {{
+    return text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '').match(/[a-z0-9]+/g) || [];
+}}
+
+// Bitset (bit i of word i >> 5) of the rows containing every query word as a
+// word prefix; null for a query without words.
+function searchIndex(index, query) {{
+    const terms = [...new Set(queryWords(query))].sort((a, b) => b.length - a.length);
+    if (!terms.length) return null;
+    const {{words, offsets, postings}} = index, size = Math.ceil(index.n / 32);
+    let out = null;
+    for (const term of terms) {{
+        let lo = 0, hi = words.length;
+        while (lo < hi) {{ const mid = (lo + hi) >>> 1; if (words[mid] < term) lo = mid + 1; else hi = mid; }}
+        const bits = new Uint32Array(size);
+        for (let k = lo; k < words.length && words[k].startsWith(term); k++) {{
+            let row = 0, shift = 0, delta = 0;
+            for (let p = offsets[k]; p < offsets[k + 1]; p++) {{
+                const byte = postings[p];
+                delta |= (byte & 0x7f) << shift;
+                if (byte & 0x80) {{ shift += 7; continue; }}
+                row += delta;
+                bits[row >>> 5] |= 1 << (row & 31);
+                delta = 0;
+                shift = 0;
+            }}
+        }}
+        if (out) for (let w = 0; w < size; w++) out[w] &= bits[w];
+        else out = bits;
+    }}
+    return out;
+}}
+
+// Worker side: {{type: 'load', url | text + gzip}} replaces the index,
+// {{type: 'search', id, query}} answers {{id, bits}} (bits transferred) or {{id, error}}.
+if (typeof WorkerGlobalScope !== 'undefined' && self instanceof WorkerGlobalScope) {{
+    let ready = Promise.resolve(null);
+    self.onmessage = async e => {{
+        const m = e.data;
+        if (m.type === 'load') {{
+            ready = (m.url ? fetchJson(m.url) : decodeChunk(m.text, m.gzip)).then(loadIndex);
+            return;
+        }}
+        try {{
+            const bits = searchIndex(await ready, m.query);
+            self.postMessage({{id: m.id, bits}}, bits ? [bits.buffer] : []);
+        }} catch (err) {{
+            self.postMessage({{id: m.id, error: String(err)}});
+        }}
+    }};
+}}
+</script>
 <script>
-const DATA = {table_json};
-const CHARTS = {{
-    c1: {charts['jobs_by_zone']},
-    c2: {charts['contract_types']},
-    c3: {charts['salary_distribution']},
-    c4: {charts['sources']},
-    c5: {charts['relevance']},
-    c6: {charts['top_companies']},
-}};
-
-let filtered = [...DATA];
+// Single-file output inlines CHARTS, FACETS and the data chunks. Site output
+// (dashboard/site.py) sets SITE instead: charts and the rows of each shard are
+// fetched, one shard at a time, with the facets inside each shard's table file.
+const SITE = {site_json};
+const CHARTS = {charts_json};
+let FACETS = {facets_json};
+
+// Table rows arrive column by column (dashboard/payload.py) and are addressed
+// by index. `order` holds every index in the current sort order; `view` is the
+// filtered subsequence of it. Only the rows scrolled into view are rendered,
+// between two spacer rows.
+const ROW_H = 44, OVERSCAN = 12, SEARCH_DELAY = 150;
+let N = 0, COLS = null, DESCRIPTIONS = null;
+let order = [], view = [];
 let sortCol = null, sortAsc = true;
+const sortKeys = {{}};
+
+// Facet bitsets from the generator: bit i of word i >> 5 is row i.
+let WORDS = 0;
+const FILTERS = [['fZone', 'zone'], ['fContract', 'contract_type'], ['fSource', 'source'], ['fRelevance', 'relevance']];
+let searchText = '', searchBits = null;
+
+// Data chunks are plain JSON, or gzip+base64 for large runs; on a site they
+// are the current shard's files
+let shard = null;
+async function readChunk(id) {{
+    if (SITE) return fetchJson(shard[id]);
+    const el = document.getElementById(id);
+    return decodeChunk(el.textContent, el.dataset.encoding === 'gzip');
+}}
+
+// Searches run in a worker built from the searchEngine script; each load of
+// the rows hands it the matching index. Replies to superseded queries are
+// dropped by applyFilters.
+let searchWorker = null, searchSource = null, searchSeq = 0, mainIndex = null;
+const pendingSearches = new Map();
+
+function loadSearchIndex() {{
+    if (SITE) searchSource = {{url: new URL(shard.searchIndex, location.href).href}};
+    else {{
+        const el = document.getElementById('searchIndex');
+        searchSource = {{text: el.textContent, gzip: el.dataset.encoding === 'gzip'}};
+    }}
+    if (searchWorker === null) {{
+        try {{
+            const src = new Blob([document.getElementById('searchEngine').textContent], {{type: 'text/javascript'}});
+            searchWorker = new Worker(URL.createObjectURL(src));
+            searchWorker.onmessage = e => {{
+                const [resolve, reject] = pendingSearches.get(e.data.id);
+                pendingSearches.delete(e.data.id);
+                if (e.data.error) reject(new Error(e.data.error));
+                else resolve(e.data.bits);
+            }};
+            searchWorker.onerror = () => {{
+                // e.g. blocked by a content security policy: search on this thread instead
+                searchWorker = false;
+                loadSearchIndex();
+                for (const [resolve, , query] of pendingSearches.values()) resolve(runSearch(query));
+                pendingSearches.clear();
+            }};
+        }} catch (err) {{
+            searchWorker = false;
+        }}
+    }}
+    if (searchWorker) searchWorker.postMessage({{type: 'load', ...searchSource}});
+    else {{
+        const s = searchSource;
+        mainIndex = (s.url ? fetchJson(s.url) : decodeChunk(s.text, s.gzip)).then(loadIndex);
+    }}
+}}
 
-function init() {{
+function runSearch(query) {{
+    if (!searchWorker) return mainIndex.then(index => searchIndex(index, query));
+    const id = ++searchSeq;
+    return new Promise((resolve, reject) => {{
+        pendingSearches.set(id, [resolve, reject, query]);
+        searchWorker.postMessage({{type: 'search', id, query}});
+    }});
+}}
+
+function cell(col, i) {{
+    const c = COLS[col];
+    return c.dict ? c.dict[c.codes[i]] : c[i];
+}}
+
+async function init() {{
     document.getElementById('ts').textContent = new Date().toLocaleString('es-CO');
 
     // Render charts
-    for (const [id, spec] of Object.entries(CHARTS)) {{
-        const s = typeof spec === 'string' ? JSON.parse(spec) : spec;
+    for (const [id, s] of Object.entries(CHARTS || await fetchJson(SITE.charts))) {{
         Plotly.newPlot(id, s.data, {{...s.layout, paper_bgcolor:'transparent', plot_bgcolor:'transparent'}}, {{responsive:true}});
     }}
 
-    // Populate filter dropdowns
-    const zones = [...new Set(DATA.map(j => j.zone))].sort();
-    const sources = [...new Set(DATA.map(j => j.source))].sort();
-    const zSel = document.getElementById('fZone');
-    zones.forEach(z => {{ const o = document.createElement('option'); o.value = z; o.textContent = z; zSel.appendChild(o); }});
-    const sSel = document.getElementById('fSource');
-    sources.forEach(s => {{ const o = document.createElement('option'); o.value = s; o.textContent = s; sSel.appendChild(o); }});
+    if (SITE) {{
+        const sel = document.getElementById('fShard');
+        SITE.shards.forEach((s, k) => sel.add(new Option(s.label + ' (' + s.n + ')', k)));
+        document.getElementById('shardLabel').textContent = SITE.label;
+        document.getElementById('shardGroup').style.display = '';
+        sel.addEventListener('change', () => loadShard(+sel.value));
+        shard = SITE.shards[0];
+    }}
+    if (!SITE || shard) await loadRows();
 
     // Listeners
     ['fZone','fContract','fSource','fRelevance'].forEach(id => document.getElementById(id).addEventListener('change', applyFilters));
-    document.getElementById('fSearch').addEventListener('input', applyFilters);
+    document.getElementById('fSearch').addEventListener('input', debounce(applyFilters, SEARCH_DELAY));
+    let frame = 0;
+    document.getElementById('tableScroll').addEventListener('scroll', () => {{
+        if (!frame) frame = requestAnimationFrame(() => {{ frame = 0; renderTable(); }});
+    }});
+    window.addEventListener('resize', () => renderTable());
+    document.getElementById('tbody').addEventListener('click', e => {{
+        const tr = e.target.closest('tr[data-row]');
+        if (tr && !e.target.closest('a')) showDetail(+tr.dataset.row);
+    }});
+
+    renderTable();
+}}
+
+async function loadShard(k) {{
+    shard = SITE.shards[k];
+    closeDetail();
+    await loadRows();
+    document.getElementById('tableScroll').scrollTop = 0;
+    renderTable();
+}}
+
+// (Re)load the table from the data chunks: columns, search text, facet bitsets
+// and dropdown options. Filters and sort order are reset.
+async function loadRows() {{
+    const payload = await readChunk('tableData');
+    if (SITE) FACETS = payload.facets;
+    N = payload.n;
+    COLS = payload.columns;
+    DESCRIPTIONS = null;
+    order = Array.from({{length: N}}, (_, i) => i);
+    view = order;
+    loadSearchIndex();
+    for (const col in sortKeys) delete sortKeys[col];
+    sortCol = null;
+    sortAsc = true;
+    document.querySelectorAll('th[data-col]').forEach(th => {{
+        th.classList.remove('sorted');
+        th.querySelector('.arrow').textContent = '⇅';
+    }});
+    searchText = '';
+    searchBits = null;
+    document.getElementById('fSearch').value = '';
+
+    WORDS = Math.ceil(N / 32);
+    for (const facet of Object.values(FACETS)) {{
+        facet.bits = facet.bits.map(b64 => {{
+            const bin = atob(b64), words = new Uint32Array(WORDS), bytes = new Uint8Array(words.buffer);
+            for (let k = 0; k < bin.length; k++) bytes[k] = bin.charCodeAt(k);
+            return words;
+        }});
+    }}
+
+    // Populate filter dropdowns from the facet index
+    for (const [id, name] of FILTERS) {{
+        const sel = document.getElementById(id);
+        sel.length = 1;
+        FACETS[name].values.forEach(v => {{
+            const o = document.createElement('option');
+            o.value = v;
+            o.dataset.label = name === 'relevance' ? '≥ ' + Math.round(v * 100) + '%'
+                : name === 'contract_type' ? v.charAt(0).toUpperCase() + v.slice(1) : v;
+            sel.appendChild(o);
+        }});
+    }}
+    updateCounts(FILTERS.map(() => null));
+}}
+
+// Descriptions are only decoded the first time a posting is opened
+async function showDetail(i) {{
+    if (!DESCRIPTIONS) DESCRIPTIONS = await readChunk('descriptions');
+    document.getElementById('detailTitle').textContent = COLS.title[i];
+    document.getElementById('detailMeta').textContent = [cell('company', i), cell('zone', i), cell('source', i)].join(' · ');
+    document.getElementById('detailText').textContent = DESCRIPTIONS[i] || 'Sin descripción.';
+    document.getElementById('detail').style.display = 'block';
+}}
+
+function closeDetail() {{
+    document.getElementById('detail').style.display = 'none';
+}}
+
+function debounce(fn, ms) {{
+    let timer;
+    return (...args) => {{ clearTimeout(timer); timer = setTimeout(() => fn(...args), ms); }};
+}}
+
+// AND of the given bitsets (nulls are "no filter"); null if none are set.
+function intersect(sets) {{
+    let out = null;
+    for (const bits of sets) {{
+        if (!bits) continue;
+        if (!out) {{ out = bits.slice(); continue; }}
+        for (let w = 0; w < WORDS; w++) out[w] &= bits[w];
+    }}
+    return out;
+}}
+
+function popcount(x) {{
+    x -= (x >>> 1) & 0x55555555;
+    x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+    return (((x + (x >>> 4)) & 0x0f0f0f0f) * 0x01010101) >>> 24;
+}}
+
+function countAnd(a, b) {{
+    let n = 0;
+    for (let w = 0; w < WORDS; w++) n += popcount(a[w] & b[w]);
+    return n;
+}}
 
-    renderTable(DATA);
+// Option labels show how many rows each value would leave, given the other filters
+function updateCounts(selected) {{
+    FILTERS.forEach(([id, name], k) => {{
+        const others = intersect([...selected.filter((_, m) => m !== k), searchBits]);
+        const facet = FACETS[name];
+        const options = document.getElementById(id).options;
+        for (const o of options) {{
+            const v = facet.values.indexOf(o.value);
+            if (v < 0) continue;
+            const n = others ? countAnd(facet.bits[v], others) : facet.counts[v];
+            o.textContent = o.dataset.label + ' (' + n + ')';
+        }}
+    }});
 }}
 
 function applyFilters() {{
-    const zone = document.getElementById('fZone').value;
-    const contract = document.getElementById('fContract').value;
-    const source = document.getElementById('fSource').value;
-    const search = document.getElementById('fSearch').value.toLowerCase();
-    const minRel = parseFloat(document.getElementById('fRelevance').value);
-
-    filtered = DATA.filter(j =>
-        (!zone || j.zone === zone) &&
-        (!contract || j.contract_type === contract) &&
-        (!source || j.source === source) &&
-        (j.relevance_score >= minRel) &&
-        (!search || (j.title + ' ' + j.company).toLowerCase().includes(search))
-    );
-    renderTable(filtered);
+    const search = document.getElementById('fSearch').value;
+    if (search !== searchText) {{
+        searchText = search;
+        if (search) {{
+            // Filter once the search answers, unless a newer query came in meanwhile
+            runSearch(search).then(bits => {{
+                if (search !== searchText) return;
+                searchBits = bits;
+                filterRows();
+            }}).catch(err => {{
+                document.getElementById('rowCount').textContent = 'Error en la búsqueda: ' + err;
+            }});
+            return;
+        }}
+        searchBits = null;
+    }}
+    filterRows();
+}}
+
+function filterRows() {{
+    const selected = FILTERS.map(([id, name]) => {{
+        const v = FACETS[name].values.indexOf(document.getElementById(id).value);
+        return v < 0 ? null : FACETS[name].bits[v];
+    }});
+    const mask = intersect([...selected, searchBits]);
+
+    view = mask ? order.filter(i => mask[i >>> 5] & (1 << (i & 31))) : order;
+    updateCounts(selected);
+    document.getElementById('tableScroll').scrollTop = 0;
+    renderTable();
 }}
 
 function resetFilters() {{
-    ['fZone','fContract','fSource','fRelevance'].forEach(id => document.getElementById(id).value = '');
+    ['fZone','fContract','fSource'].forEach(id => document.getElementById(id).value = '');
+    document.getElementById('fRelevance').value = '0';
     document.getElementById('fSearch').value = '';
-    filtered = [...DATA];
-    renderTable(DATA);
+    applyFilters();
+}}
+
+// One numeric key per row and column, built on the first sort by that column:
+// strings become their rank in a collated list of distinct values, missing
+// values become NaN (always sorted last).
+function sortKey(col) {{
+    if (!sortKeys[col]) {{
+        const c = COLS[col], keys = new Float64Array(N);
+        const collator = new Intl.Collator('es', {{sensitivity: 'base'}});
+        if (c.dict) {{
+            // Dictionary columns: collate the distinct values once, then look codes up
+            const rank = new Float64Array(c.dict.length);
+            c.dict.map((_, k) => k).sort((a, b) => collator.compare(c.dict[a] || '', c.dict[b] || ''))
+                .forEach((k, r) => {{ rank[k] = r; }});
+            for (let i = 0; i < N; i++) keys[i] = rank[c.codes[i]];
+        }} else if (typeof c.find(v => v != null) === 'string') {{
+            const rank = new Map([...new Set(c.map(v => v || ''))].sort(collator.compare).map((v, r) => [v, r]));
+            for (let i = 0; i < N; i++) keys[i] = rank.get(c[i] || '');
+        }} else {{
+            for (let i = 0; i < N; i++) keys[i] = c[i] == null ? NaN : c[i];
+        }}
+        sortKeys[col] = keys;
+    }}
+    return sortKeys[col];
 }}
 
 function sortBy(col) {{
     if (sortCol === col) sortAsc = !sortAsc;
     else {{ sortCol = col; sortAsc = true; }}
-    filtered.sort((a, b) => {{
-        let av = a[col], bv = b[col];
-        if (av == null) av = sortAsc ? Infinity : -Infinity;
-        if (bv == null) bv = sortAsc ? Infinity : -Infinity;
-        if (typeof av === 'string') return sortAsc ? av.localeCompare(bv) : bv.localeCompare(av);
-        return sortAsc ? av - bv : bv - av;
+    const keys = sortKey(col), dir = sortAsc ? 1 : -1;
+    order.sort((a, b) => {{
+        const ka = keys[a], kb = keys[b];
+        if (ka !== ka) return kb !== kb ? a - b : 1;
+        if (kb !== kb) return -1;
+        return (ka - kb) * dir || a - b;
     }});
-    renderTable(filtered);
+    document.querySelectorAll('th[data-col]').forEach(th => {{
+        const on = th.dataset.col === col;
+        th.classList.toggle('sorted', on);
+        th.querySelector('.arrow').textContent = on ? (sortAsc ? '▲' : '▼') : '⇅';
+    }});
+    applyFilters();
+}}
+
+function rowHtml(i) {{
+    const title = COLS.title[i], contract = cell('contract_type', i);
+    const salary = COLS.salary_max[i], relevance = COLS.relevance_score[i], url = COLS.url[i];
+    return `<tr data-row="${{i}}">
+            <td title="${{esc(title)}}"><strong>${{esc(title)}}</strong></td>
+            <td>${{esc(cell('company', i))}}</td>
+            <td>${{esc(cell('zone', i))}}</td>
+            <td><span class="badge badge-${{contract === 'permanente' ? 'permanente' : contract === 'temporal' ? 'temporal' : 'sin'}}">${{esc(contract)}}</span></td>
+            <td class="salary">${{salary ? fmtSal(salary) : 'N/A'}}</td>
+            <td><span class="badge badge-${{relevance >= 0.8 ? 'high' : relevance >= 0.5 ? 'medium' : 'low'}}">${{Math.round(relevance * 100)}}%</span></td>
+            <td>${{esc(cell('source', i))}}</td>
+            <td>${{url ? `<a class="job-link" href="${{esc(url)}}" target="_blank" rel="noopener">Abrir →</a>` : '—'}}</td>
+        </tr>`;
 }}
 
-function renderTable(data) {{
+function renderTable() {{
     const tbody = document.getElementById('tbody');
-    const empty = document.getElementById('emptyState');
-    document.getElementById('rowCount').textContent = data.length + ' ofertas';
-
-    if (!data.length) {{ tbody.innerHTML = ''; empty.style.display = 'block'; return; }}
-    empty.style.display = 'none';
-
-    tbody.innerHTML = data.map(j => `
-        <tr>
-            <td><strong>${{esc(j.title)}}</strong></td>
-            <td>${{esc(j.company)}}</td>
-            <td>${{esc(j.zone)}}</td>
-            <td><span class="badge badge-${{j.contract_type === 'permanente' ? 'permanente' : j.contract_type === 'temporal' ? 'temporal' : 'sin'}}">${{esc(j.contract_type)}}</span></td>
-            <td class="salary">${{j.salary_max ? fmtSal(j.salary_max) : 'N/A'}}</td>
-            <td><span class="badge badge-${{j.relevance_score >= 0.8 ? 'high' : j.relevance_score >= 0.5 ? 'medium' : 'low'}}">${{Math.round(j.relevance_score * 100)}}%</span></td>
-            <td>${{esc(j.source)}}</td>
-            <td>${{j.url ? `<a class="job-link" href="${{j.url}}" target="_blank" rel="noopener">Abrir →</a>` : '—'}}</td>
-        </tr>
-    `).join('');
+    const scroller = document.getElementById('tableScroll');
+    document.getElementById('rowCount').textContent = view.length + ' ofertas';
+    document.getElementById('emptyState').style.display = view.length ? 'none' : 'block';
+
+    const top = scroller.scrollTop, height = scroller.clientHeight || 600;
+    const first = Math.max(0, Math.floor(top / ROW_H) - OVERSCAN);
+    const last = Math.min(view.length, Math.ceil((top + height) / ROW_H) + OVERSCAN);
+    let html = `<tr class="spacer" style="height:${{first * ROW_H}}px"></tr>`;
+    for (let k = first; k < last; k++) html += rowHtml(view[k]);
+    html += `<tr class="spacer" style="height:${{(view.length - last) * ROW_H}}px"></tr>`;
+    tbody.innerHTML = html;
 }}
 
+const SAL_FMT = new Intl.NumberFormat('es-CO', {{maximumFractionDigits:0}});
 function fmtSal(v) {{
-    return '$' + new Intl.NumberFormat('es-CO', {{maximumFractionDigits:0}}).format(v);
+    return '$' + SAL_FMT.format(v);
 }}
+const ESC = {{'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}};
 function esc(t) {{
-    if (!t) return '';
-    const d = document.createElement('div'); d.textContent = t; return d.innerHTML;
+    return t ? String(t).replace(/[&<>"']/g, c => ESC[c]) : '';
 }}
 
-window.addEventListener('load', init);
+window.addEventListener('load', () => init().catch(err => {{
+    document.getElementById('rowCount').textContent = 'No se pudieron cargar los datos: ' + err;
+}}));
 </script>
 </body>
 </html>"""
@@ -0,0 +1,75 @@
+"""Compact table payload embedded in dashboard.html.
+
+Rows are sent column by column. Repeated strings (zone, source, contract
+type, company) are dictionary encoded as ``{"dict": [...], "codes": [...]}``;
+the other columns are plain arrays. Descriptions, which the table only shows
+on demand, go in a separate chunk the page decodes the first time a posting
+is opened.
+
+Chunks are embedded as ``<script type="application/json">`` blocks that the
+browser does not parse on load. Chunks larger than ``gzip_min_bytes`` are
+gzipped and base64-encoded instead, and decoded with ``DecompressionStream``.
+"""
+
+import base64
+import gzip
+import json
+from typing import Dict, List, Optional
+
+from data_schema import CATEGORICAL_FIELDS, JobBatch
+import config
+
+TABLE_COLUMNS = (
+    "title", "company", "zone", "contract_type", "salary_max", "relevance_score", "source", "url",
+)
+DICT_COLUMNS = ("company",)      # Repetitive, but not categorical in JobBatch
+
+
+def _encode_values(values: List[str]) -> dict:
+    codes: Dict[str, int] = {}
+    column = [codes.setdefault(v, len(codes)) for v in values]
+    return {"dict": list(codes), "codes": column}
+
+
+def table_payload(batch: JobBatch) -> dict:
+    """{"n": rows, "columns": {name: array | {"dict", "codes"}}}."""
+    columns = {}
+    for name in TABLE_COLUMNS:
+        if name in CATEGORICAL_FIELDS:
+            columns[name] = {"dict": batch.categories(name), "codes": list(batch.codes(name))}
+        elif name in DICT_COLUMNS:
+            columns[name] = _encode_values(batch.column(name))
+        else:
+            columns[name] = batch.column(name)
+    return {"n": len(batch), "columns": columns}
+
+
+def descriptions_payload(batch: JobBatch) -> List[str]:
+    return batch.column("description")
+
+
+def chunk_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def script_safe(text: str) -> str:
+    """JSON ``text`` made safe to inline in a ``<script>`` element.
+
+    "</script" would end the element early; "\\u003c" is the same JSON string.
+    Every JSON blob written into the page goes through this.
+    """
+    return text.replace("<", "\\u003c")
+
+
+def script_chunk(chunk_id: str, data, gzip_min_bytes: Optional[int] = config.DASHBOARD_GZIP_MIN_BYTES) -> str:
+    """``<script>`` block carrying ``data`` as JSON, or gzip+base64 when it is large."""
+    return encode_chunk(chunk_id, chunk_json(data), gzip_min_bytes)
+
+
+def encode_chunk(chunk_id: str, text: str, gzip_min_bytes: Optional[int] = config.DASHBOARD_GZIP_MIN_BYTES) -> str:
+    """``script_chunk`` for already serialized JSON ``text``."""
+    raw = text.encode("utf-8")
+    if gzip_min_bytes is not None and len(raw) >= gzip_min_bytes:
+        body = base64.b64encode(gzip.compress(raw, compresslevel=9, mtime=0)).decode("ascii")
+        return f'<script type="application/octet-stream" id="{chunk_id}" data-encoding="gzip">{body}</script>'
+    return f'<script type="application/json" id="{chunk_id}">{script_safe(text)}</script>'
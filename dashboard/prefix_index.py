@@ -0,0 +1,64 @@
+"""Word-prefix index for the dashboard's free-text search.
+
+Title, company and description of every row are accent-folded and split
+into ``[a-z0-9]+`` words (the page tokenizes queries the same way). The
+index is the sorted vocabulary plus, per word, the ascending row ids that
+contain it, delta- and varint-encoded. A query word matches every vocabulary
+word it is a prefix of, a contiguous range found by binary search; a query
+matches the rows containing all of its words.
+
+    {"n": rows, "words": [...], "offsets": base64 uint32, "postings": base64 bytes}
+
+``offsets`` has ``len(words) + 1`` little-endian entries: word ``k``'s
+postings are ``postings[offsets[k]:offsets[k + 1]]``.
+"""
+
+import base64
+import re
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+from data_schema import JobBatch
+from processing.text import fold_accents
+
+INDEXED_FIELDS = ("title", "company", "description")
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def words(text: str) -> List[str]:
+    return _WORD.findall(fold_accents(text)) if text else []
+
+
+def _varints(values) -> bytearray:
+    out = bytearray()
+    for v in values:
+        while v >= 0x80:
+            out.append((v & 0x7F) | 0x80)
+            v >>= 7
+        out.append(v)
+    return out
+
+
+def prefix_index(batch: JobBatch) -> Dict[str, object]:
+    postings: Dict[str, List[int]] = defaultdict(list)
+    columns = [batch.column(name) for name in INDEXED_FIELDS]
+    for row, texts in enumerate(zip(*columns)):
+        for word in set(w for text in texts for w in words(text)):
+            postings[word].append(row)
+
+    vocabulary = sorted(postings)
+    offsets = np.zeros(len(vocabulary) + 1, dtype="<u4")
+    encoded = bytearray()
+    for k, word in enumerate(vocabulary):
+        rows = postings[word]
+        encoded += _varints([rows[0]] + [b - a for a, b in zip(rows, rows[1:])])
+        offsets[k + 1] = len(encoded)
+    return {
+        "n": len(batch),
+        "words": vocabulary,
+        "offsets": base64.b64encode(offsets.tobytes()).decode("ascii"),
+        "postings": base64.b64encode(bytes(encoded)).decode("ascii"),
+    }
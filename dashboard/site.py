@@ -0,0 +1,90 @@
+"""Sharded, static-site output of the dashboard.
+
+Instead of one self-contained HTML file, ``DashboardGenerator.generate_site``
+writes a directory:
+
+    index.html                  stat cards, charts, filters, table
+    charts.json                 the six chart specs
+    data/<shard>.json           table columns + facet bitsets of one shard
+    data/<shard>.descriptions.json
+
+Rows are split into shards by zone or by month; the page lists the shards
+and fetches one at a time, so opening it costs the same however large the
+store grows. Every file gets pre-compressed ``.gz`` (and, with the optional
+``brotli`` package, ``.br``) siblings for servers that serve them directly
+(nginx ``gzip_static``/``brotli_static``, most CDNs).
+"""
+
+import gzip
+import logging
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import List, Tuple, Union
+
+from data_schema import JobBatch
+from processing.text import fold_accents
+
+try:
+    import brotli
+except ImportError:  # .br siblings are skipped
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+SHARD_KEYS = {"zone": "Zona", "month": "Mes"}      # shard_by → selector label
+
+
+def shard_slug(key: str) -> str:
+    """File-name-safe form of a shard key ("Urabá (General)" → "uraba-general")."""
+    return re.sub(r"[^a-z0-9]+", "-", fold_accents(key).lower()).strip("-") or "sin-dato"
+
+
+def shard_rows(batch: JobBatch, by: str) -> List[Tuple[str, List[int]]]:
+    """[(key, row indices)] per shard.
+
+    Zones are ordered by size, largest first; months (of ``first_seen``, else
+    ``scraped_at``) newest first, so the page opens on the latest postings;
+    undated rows come last.
+    """
+    if by not in SHARD_KEYS:
+        raise ValueError(f"shard_by must be one of {sorted(SHARD_KEYS)}, not {by!r}")
+    groups = defaultdict(list)
+    if by == "zone":
+        for i, zone in enumerate(batch.column("zone")):
+            groups[zone or "Sin zona"].append(i)
+        return sorted(groups.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+    for i, (first_seen, scraped_at) in enumerate(zip(batch.column("first_seen"), batch.column("scraped_at"))):
+        groups[(first_seen or scraped_at or "")[:7]].append(i)
+    undated = groups.pop("", None)
+    shards = sorted(groups.items(), reverse=True)
+    return shards + [("Sin fecha", undated)] if undated else shards
+
+
+def write_static(path: Union[str, Path], data: bytes) -> bool:
+    """Write ``data`` and its compressed siblings; False if the file was already identical."""
+    path = Path(path)
+    try:
+        if path.read_bytes() == data and path.with_name(path.name + ".gz").exists():
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    variants = [(path, data), (path.with_name(path.name + ".gz"), gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append((path.with_name(path.name + ".br"), brotli.compress(data)))
+    for target, body in variants:
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_bytes(body)
+        tmp.replace(target)
+    return True
+
+
+def remove_stale(directory: Path, keep: set) -> None:
+    """Delete files in ``directory`` (and their siblings) not named in ``keep``."""
+    if not directory.is_dir():
+        return
+    for path in directory.iterdir():
+        base = path.name[:-3] if path.name.endswith((".gz", ".br")) else path.name
+        if base not in keep:
+            path.unlink()
@@ -1,33 +1,320 @@
 """Unified data schema for job postings across all sources."""
 
-from dataclasses import dataclass, field, asdict
+import sys
+from array import array
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
-from typing import Optional, List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+# Low-cardinality string fields; values are interned so every posting shares them
+CATEGORICAL_FIELDS = ("zone", "source", "contract_type", "salary_currency")
 
+# ── Shared values ─────────────────────────────────────────────────
+_TUPLE_POOL: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+_run_timestamp: Optional[str] = None
+
+
+def intern_tuple(values: Iterable[str]) -> Tuple[str, ...]:
+    """Return the pooled tuple for this combination of strings (one object per distinct tuple)."""
+    key = tuple(sys.intern(v) for v in values)
+    return _TUPLE_POOL.setdefault(key, key)
+
+
+def intern_benefits(benefits: Iterable[str]) -> Tuple[str, ...]:
+    return intern_tuple(benefits)
+
+
+def start_run(timestamp: Optional[str] = None) -> str:
+    """Fix the scrape timestamp shared by every posting created from now on."""
+    global _run_timestamp
+    _run_timestamp = timestamp or datetime.now().isoformat()
+    return _run_timestamp
+
+
+def run_timestamp() -> str:
+    return _run_timestamp or start_run()
+
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ (``dataclass(slots=True)`` needs Python 3.10+)."""
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        k: v for k, v in cls.__dict__.items()
+        if k not in names and k not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class JobPosting:
     title: str
     company: str
     location: str                          # Raw location text
-    zone: str = ""                         # Normalized municipality
+    zone: str = ""                         # Normalized municipality (first mentioned)
+    secondary_zones: Tuple[str, ...] = ()  # Other municipalities mentioned, pooled
     salary_raw: str = ""                   # Original salary text
     salary_min: Optional[float] = None     # Extracted min (COP)
     salary_max: Optional[float] = None     # Extracted max (COP)
     salary_currency: str = "COP"
     contract_type: str = "unknown"         # temporal | permanent | unknown
     is_temporal: bool = False
-    benefits: List[str] = field(default_factory=list)
+    benefits: Tuple[str, ...] = ()         # Pooled, see intern_tuple()
     description: str = ""
     url: str = ""
     source: str = ""                       # Portal name
     date_posted: Optional[str] = None      # ISO format string
     relevance_score: float = 0.0           # 0-1
-    scraped_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    scraped_at: str = field(default_factory=run_timestamp)
+    fingerprint: str = ""                  # Hash of normalized (title, company, location)
+    first_seen: Optional[str] = None       # ISO timestamp of the first run that saw it
+    last_seen: Optional[str] = None        # ISO timestamp of the latest run that saw it
+    raw_hash: str = ""                     # Hash of the scraped fields
+    rules_version: str = ""                # Hash of the config tables used to enrich it
+
+    def __post_init__(self):
+        for name in CATEGORICAL_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+        # One timestamp per scrape run, so interning collapses it across an archive
+        self.scraped_at = sys.intern(self.scraped_at)
+        self.benefits = intern_tuple(self.benefits)
+        self.secondary_zones = intern_tuple(self.secondary_zones)
+
+    # to_dict()/from_dict() are generated below, once the field list is known
+
+
+# ── Generated codec ───────────────────────────────────────────────
+# Straight-line to_dict/from_dict over the field tuple, the same way
+# dataclasses generates __init__: no asdict() recursion or deep copies,
+# no per-record filtered dict.
+_SEQUENCE_FIELDS = ("secondary_zones", "benefits")
+
+
+def _build_codec(cls) -> None:
+    names = [f.name for f in fields(cls)]
+    encode = ", ".join(
+        f"{n!r}: list(self.{n})" if n in _SEQUENCE_FIELDS else f"{n!r}: self.{n}"
+        for n in names
+    )
+
+    namespace = {"_MISSING": MISSING}
+    args = []
+    for f in fields(cls):
+        n = f.name
+        if f.default is not MISSING:
+            namespace[f"_dflt_{n}"] = f.default
+            args.append(f"{n}=get({n!r}, _dflt_{n})")
+        elif f.default_factory is not MISSING:
+            namespace[f"_fact_{n}"] = f.default_factory
+            args.append(f"{n}=data[{n!r}] if {n!r} in data else _fact_{n}()")
+        else:
+            args.append(f"{n}=data[{n!r}]")
+
+    source = (
+        f"def to_dict(self):\n"
+        f"    return {{{encode}}}\n"
+        f"def from_dict(cls, data):\n"
+        f"    get = data.get\n"
+        f"    try:\n"
+        f"        return cls({', '.join(args)})\n"
+        f"    except KeyError as exc:\n"
+        f"        raise TypeError(f'missing required field {{exc}}') from None\n"
+    )
+    exec(source, namespace)
+    namespace["to_dict"].__doc__ = "Plain dict of every field (tuple fields as lists)."
+    namespace["from_dict"].__doc__ = "Build a posting from a dict; unknown keys are ignored."
+    cls.to_dict = namespace["to_dict"]
+    cls.from_dict = classmethod(namespace["from_dict"])
+    cls.FIELD_NAMES = tuple(names)
+
+
+_build_codec(JobPosting)
+
 
-    def to_dict(self) -> dict:
-        return asdict(self)
+# ── Columnar batch ────────────────────────────────────────────────
+_FLOAT_FIELDS = ("salary_min", "salary_max", "relevance_score")
+_BOOL_FIELDS = ("is_temporal",)
+_NAN = float("nan")
+
+
+class JobBatch:
+    """Column-oriented collection of postings.
+
+    Numeric fields live in ``array.array`` buffers (missing values as NaN),
+    categorical fields as int32 codes plus a category list, the rest as plain
+    lists. ``to_pandas()``/``to_arrow()`` wrap the buffers without building a
+    dict per row; while such a view is alive the batch cannot grow (``append``
+    raises ``BufferError``).
+    """
+
+    FIELDS = JobPosting.FIELD_NAMES
+
+    def __init__(self):
+        self._columns: Dict[str, object] = {}
+        self._categories: Dict[str, List[str]] = {}
+        self._codes: Dict[str, Dict[str, int]] = {}
+        for name in self.FIELDS:
+            if name in _FLOAT_FIELDS:
+                self._columns[name] = array("d")
+            elif name in _BOOL_FIELDS:
+                self._columns[name] = array("b")
+            elif name in CATEGORICAL_FIELDS:
+                self._columns[name] = array("i")
+                self._categories[name] = []
+                self._codes[name] = {}
+            else:
+                self._columns[name] = []
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'JobPosting':
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+    def from_jobs(cls, jobs: Iterable[JobPosting]) -> "JobBatch":
+        batch = cls()
+        batch.extend(jobs)
+        return batch
+
+    # ── Building ──────────────────────────────────────────────────
+    def _code(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._categories[name])
+            self._categories[name].append(value)
+        return code
+
+    def append(self, job: JobPosting) -> None:
+        for name in self.FIELDS:
+            value = getattr(job, name)
+            column = self._columns[name]
+            if name in _FLOAT_FIELDS:
+                column.append(_NAN if value is None else value)
+            elif name in _BOOL_FIELDS:
+                column.append(bool(value))
+            elif name in CATEGORICAL_FIELDS:
+                column.append(self._code(name, value))
+            else:
+                column.append(value)
+
+    def extend(self, jobs: Iterable[JobPosting]) -> None:
+        for job in jobs:
+            self.append(job)
+
+    # ── Access ────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return len(self._columns["title"])
+
+    def column(self, name: str) -> list:
+        """Decoded column values (None for missing numbers)."""
+        column = self._columns[name]
+        if name in _FLOAT_FIELDS:
+            return [None if v != v else v for v in column]
+        if name in _BOOL_FIELDS:
+            return [bool(v) for v in column]
+        if name in CATEGORICAL_FIELDS:
+            categories = self._categories[name]
+            return [categories[c] for c in column]
+        return list(column)
+
+    def categories(self, name: str) -> List[str]:
+        return list(self._categories[name])
+
+    def codes(self, name: str) -> array:
+        """Raw int32 codes of a categorical column (indexes into ``categories(name)``)."""
+        return self._columns[name]
+
+    def _value(self, name: str, i: int):
+        value = self._columns[name][i]
+        if name in _FLOAT_FIELDS:
+            return None if value != value else value
+        if name in _BOOL_FIELDS:
+            return bool(value)
+        if name in CATEGORICAL_FIELDS:
+            return self._categories[name][value]
+        return value
+
+    def row(self, i: int) -> JobPosting:
+        return JobPosting(**{name: self._value(name, i) for name in self.FIELDS})
+
+    def __iter__(self) -> Iterator[JobPosting]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[JobPosting, "JobBatch"]:
+        if isinstance(key, slice):
+            return self.take(range(len(self))[key])
+        return self.row(range(len(self))[key])
+
+    # ── Selection ─────────────────────────────────────────────────
+    def take(self, indices: Iterable[int]) -> "JobBatch":
+        """New batch with the given rows; categories are narrowed to the values still in use."""
+        indices = list(indices)
+        out = JobBatch()
+        for name in self.FIELDS:
+            column = self._columns[name]
+            if name in CATEGORICAL_FIELDS:
+                categories = self._categories[name]
+                out._columns[name] = array("i", (out._code(name, categories[column[i]]) for i in indices))
+            elif isinstance(column, array):
+                out._columns[name] = array(column.typecode, (column[i] for i in indices))
+            else:
+                out._columns[name] = [column[i] for i in indices]
+        return out
+
+    def filter(self, mask: Union[Sequence[bool], Callable[[JobPosting], bool]]) -> "JobBatch":
+        """Keep rows where ``mask`` is true (a boolean sequence or a per-posting predicate)."""
+        if callable(mask):
+            mask = [mask(job) for job in self]
+        return self.take(i for i, keep in enumerate(mask) if keep)
+
+    # ── Export ────────────────────────────────────────────────────
+    def to_records(self) -> List[dict]:
+        """Row dicts in ``JobPosting.to_dict()`` shape."""
+        columns = {name: self.column(name) for name in self.FIELDS}
+        for name in _SEQUENCE_FIELDS:
+            columns[name] = [list(v) for v in columns[name]]
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def to_pandas(self):
+        """DataFrame over the batch buffers (numeric columns are not copied)."""
+        import numpy as np
+        import pandas as pd
+
+        data = {}
+        for name in self.FIELDS:
+            column = self._columns[name]
+            if name in _FLOAT_FIELDS:
+                data[name] = np.frombuffer(column, dtype=np.float64) if column else np.empty(0)
+            elif name in _BOOL_FIELDS:
+                data[name] = np.frombuffer(column, dtype=np.int8).view(np.bool_) if column else np.empty(0, bool)
+            elif name in CATEGORICAL_FIELDS:
+                codes = np.frombuffer(column, dtype=np.int32) if column else np.empty(0, np.int32)
+                data[name] = pd.Categorical.from_codes(codes, categories=self._categories[name])
+            else:
+                data[name] = column
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self):
+        """pyarrow Table; categorical columns become dictionary arrays."""
+        import numpy as np
+        import pyarrow as pa
+
+        arrays, names = [], []
+        for name in self.FIELDS:
+            column = self._columns[name]
+            if name in _FLOAT_FIELDS:
+                values = np.frombuffer(column, dtype=np.float64) if column else np.empty(0)
+                arrays.append(pa.array(values, mask=np.isnan(values)))
+            elif name in _BOOL_FIELDS:
+                arrays.append(pa.array([bool(v) for v in column], type=pa.bool_()))
+            elif name in CATEGORICAL_FIELDS:
+                codes = np.frombuffer(column, dtype=np.int32) if column else np.empty(0, np.int32)
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(codes), pa.array(self._categories[name], type=pa.string()),
+                ))
+            elif name in _SEQUENCE_FIELDS:
+                arrays.append(pa.array([list(v) for v in column], type=pa.list_(pa.string())))
+            else:
+                arrays.append(pa.array(column, type=pa.string()))
+            names.append(name)
+        return pa.Table.from_arrays(arrays, names=names)
@@ -7,9 +7,12 @@ processes the data, and generates an interactive HTML dashboard.
 
 Usage:
     python main.py
+    python main.py --no-json      # skip the jobs.ndjson / jobs.json export
+    python main.py --dashboard-only   # rebuild dashboard.html from the job store, no scraping
+    python main.py --dashboard-only --all   # … from every stored posting, not just the latest run
 """
 
-import json
+import argparse
 import logging
 import sys
 from datetime import datetime
@@ -27,8 +30,13 @@ from scrapers import (
     ComfamaScraper,
     JoobleScraper,
 )
-from processing import DataCleaner
+from data_schema import JobBatch, start_run
+import config
+import serialization
+from processing import DataCleaner, EnrichmentCache
+from search import SearchIndex
 from dashboard import DashboardGenerator
+from storage import FingerprintStore, JobStore, PostingArchive, RawPageStore, history
 
 # ── Logging ───────────────────────────────────────────────────────
 logging.basicConfig(
@@ -41,8 +49,52 @@ logger = logging.getLogger("main")
 OUTPUT_DIR = PROJECT_DIR
 
 
+def write_dashboard(gen: DashboardGenerator) -> Path:
+    """dashboard.html, or the sharded site when DASHBOARD_OUTPUT = "site"."""
+    if config.DASHBOARD_OUTPUT == "site":
+        return gen.generate_site(config.DASHBOARD_SITE_DIR)
+    dashboard_path = OUTPUT_DIR / "dashboard.html"
+    gen.generate(str(dashboard_path))
+    return dashboard_path
+
+
+def regenerate_dashboard(all_postings: bool = False) -> None:
+    """Rebuild the dashboard from the job store.
+
+    By default only the postings of the latest run (the store's newest
+    ``last_seen``) are used, the same set a normal run builds its dashboard
+    from; with ``all_postings`` every posting ever stored is. A store no run
+    has stamped (e.g. one filled by seed_data.py) is used whole.
+
+    Charts and data chunks that did not change since the last build come
+    from the dashboard fragment cache.
+    """
+    if not config.JOB_STORE_PATH.exists():
+        logger.error("No job store at %s; run a scrape (or seed_data.py) first", config.JOB_STORE_PATH)
+        sys.exit(1)
+    with JobStore(config.JOB_STORE_PATH, readonly=True) as store:
+        last_run = None if all_postings else store.last_run()
+        gen = DashboardGenerator.from_store(store, last_seen=last_run)
+    dashboard_path = write_dashboard(gen)
+    logger.info("Dashboard saved → %s (%d jobs%s)", dashboard_path, len(gen.batch),
+                f", run of {last_run}" if last_run else ", all stored")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Scrape Urabá job postings and build the dashboard.")
+    parser.add_argument("--no-json", action="store_true", help="don't write the JSON export")
+    parser.add_argument("--dashboard-only", action="store_true",
+                        help="regenerate the dashboard from the job store without scraping")
+    parser.add_argument("--all", action="store_true",
+                        help="with --dashboard-only, include every stored posting, not just the latest run's")
+    args = parser.parse_args()
+
+    if args.dashboard_only:
+        regenerate_dashboard(all_postings=args.all)
+        return
+
     start = datetime.now()
+    start_run(start.isoformat())
     logger.info("=" * 60)
     logger.info("  Urabá Job Market Scraper  —  %s", start.strftime("%Y-%m-%d %H:%M"))
     logger.info("=" * 60)
@@ -60,6 +112,10 @@ def main():
     all_jobs = []
     results_summary = []
 
+    raw_store = RawPageStore() if config.ARCHIVE_RAW_PAGES else None
+    for scraper in scrapers:
+        scraper.raw_store = raw_store
+
     for scraper in scrapers:
         logger.info("─── %s ───", scraper.name)
         try:
@@ -71,30 +127,48 @@ def main():
             results_summary.append((scraper.name, 0, f"FAILED: {exc}"))
 
     logger.info("Raw jobs collected: %d", len(all_jobs))
+    if raw_store is not None:
+        stats = raw_store.stats()
+        logger.info(
+            "Raw page archive: %d fetches, %d distinct pages, %.1f MB → %.1f MB stored",
+            stats["fetches"], stats["blobs"], stats["raw_bytes"] / 1e6, stats["stored_bytes"] / 1e6,
+        )
+        raw_store.close()
 
     if not all_jobs:
         logger.warning("No jobs were scraped from any source. The dashboard will be empty.")
 
     # ── 2. Clean & Process ────────────────────────────────────────
     logger.info("Cleaning and processing data...")
-    cleaned = DataCleaner.clean_all(all_jobs)
-
-    # ── 3. Save JSON ──────────────────────────────────────────────
-    json_path = OUTPUT_DIR / "jobs.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(
-            [j.to_dict() for j in cleaned],
-            f,
-            ensure_ascii=False,
-            indent=2,
-            default=str,
-        )
-    logger.info("Data saved → %s (%d jobs)", json_path, len(cleaned))
+    with FingerprintStore() as seen_index, EnrichmentCache() as cache:
+        cleaned = DataCleaner.clean_all(all_jobs, seen_index, cache)
+    with SearchIndex() as search_index:
+        search_index.add(cleaned)
+    batch = JobBatch.from_jobs(cleaned)
+
+    # ── 3. Store (+ optional JSON export) ─────────────────────────
+    with JobStore() as store:
+        store.upsert(cleaned)
+        stored = len(store)
+    logger.info("Data stored → %s (%d jobs this run, %d total)", config.JOB_STORE_PATH, len(cleaned), stored)
+
+    if config.EXPORT_ARCHIVE:
+        with PostingArchive() as archive:
+            archive.append(cleaned)
+
+    if config.EXPORT_HISTORY:
+        try:
+            history.write_partition(batch, start)
+        except ImportError as exc:
+            logger.warning("Skipping history partition: %s", exc)
+
+    json_path = None
+    if config.EXPORT_JSON and not args.no_json:
+        json_path = serialization.export_jobs(cleaned, OUTPUT_DIR)
+        logger.info("Data exported → %s", json_path)
 
     # ── 4. Generate Dashboard ─────────────────────────────────────
-    dashboard_path = OUTPUT_DIR / "dashboard.html"
-    gen = DashboardGenerator(cleaned)
-    gen.generate(str(dashboard_path))
+    dashboard_path = write_dashboard(DashboardGenerator(batch))
     logger.info("Dashboard saved → %s", dashboard_path)
 
     # ── 5. Summary ────────────────────────────────────────────────
@@ -104,6 +178,7 @@ def main():
     print("=" * 60)
     print(f"\n  Time elapsed:  {elapsed:.1f}s")
     print(f"  Total jobs:    {len(cleaned)}")
+    print(f"  New postings:  {sum(1 for j in cleaned if j.first_seen == j.last_seen)}")
     print()
     print("  Source Results:")
     for name, count, status in results_summary:
@@ -128,7 +203,9 @@ def main():
         print()
 
     print(f"  Output files:")
-    print(f"    Data:      {json_path}")
+    print(f"    Store:     {config.JOB_STORE_PATH} ({stored} jobs)")
+    if json_path:
+        print(f"    Data:      {json_path}")
     print(f"    Dashboard: {dashboard_path}")
     print("=" * 60)
 
@@ -1,5 +1,17 @@
 from .cleaner import DataCleaner
 from .categorizer import ZoneCategorizer
 from .relevance import RelevanceScorer
+from .dedup import NearDuplicateDetector
+from .enrichment_cache import EnrichmentCache
+from .salary import SalaryParser
+from .gazetteer import Gazetteer
 
-__all__ = ["DataCleaner", "ZoneCategorizer", "RelevanceScorer"]
+__all__ = [
+    "DataCleaner",
+    "ZoneCategorizer",
+    "RelevanceScorer",
+    "NearDuplicateDetector",
+    "EnrichmentCache",
+    "SalaryParser",
+    "Gazetteer",
+]
@@ -1,8 +1,8 @@
 """Map raw location strings to Urabá municipalities."""
 
 import logging
-from data_schema import JobPosting
-import config
+from data_schema import JobPosting, intern_tuple
+import compiled_config
 
 logger = logging.getLogger(__name__)
 
@@ -12,19 +12,9 @@ class ZoneCategorizer:
 
     @classmethod
     def categorize(cls, job: JobPosting) -> JobPosting:
-        text = (job.location + " " + job.title + " " + job.description).lower()
-
-        for municipality, keywords in config.URABA_MUNICIPALITIES.items():
-            if any(kw in text for kw in keywords):
-                job.zone = municipality
-                return job
-
-        # Generic Urabá mention
-        if "urabá" in text or "uraba" in text:
-            job.zone = "Urabá (General)"
-        elif "antioquia" in text:
-            job.zone = "Antioquia (Other)"
-        else:
-            job.zone = "Sin especificar"
-
+        """Primary zone from the first place mentioned (location, then title, then
+        description); any other municipalities go to ``secondary_zones``."""
+        gazetteer = compiled_config.current().gazetteer
+        job.zone, secondary = gazetteer.locate(job.location, job.title, job.description)
+        job.secondary_zones = intern_tuple(secondary)
         return job
@@ -1,17 +1,26 @@
 """Data cleaning pipeline: salary parsing, contract detection, benefits extraction."""
 
-import re
 import logging
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 
-from data_schema import JobPosting
+from data_schema import JobBatch, JobPosting, intern_benefits, intern_tuple
+from storage import FingerprintStore, posting_fingerprint
 from .categorizer import ZoneCategorizer
-from .relevance import RelevanceScorer
+from .dedup import NearDuplicateDetector
+from .enrichment_cache import EnrichmentCache, raw_content_hash, rules_version, stage_versions
+from .relevance import RelevanceFeatures, RelevanceScorer
+from .salary import SalaryParser
+import compiled_config
 import config
 
 logger = logging.getLogger(__name__)
 
 
+def _set_pair(job: JobPosting, first: str, second: str, values) -> None:
+    setattr(job, first, values[0])
+    setattr(job, second, values[1])
+
+
 class DataCleaner:
     """Full cleaning + enrichment pipeline."""
 
@@ -19,54 +28,18 @@ class DataCleaner:
     @staticmethod
     def parse_salary(raw: str) -> Tuple[Optional[float], Optional[float]]:
         """Extract (min, max) salary in COP from free-text salary strings."""
-        if not raw:
-            return None, None
-
-        text = raw.lower().replace(".", "").replace(",", ".")
-
-        # Pattern: "$1.500.000" or "1500000" or "1.5M"
-        # Colombian salaries: dots as thousands separator
-        numbers = re.findall(r'(\d[\d.]*)', text)
-        if not numbers:
-            return None, None
-
-        parsed: List[float] = []
-        for num_str in numbers:
-            try:
-                val = float(num_str.replace(".", ""))
-                # If value is suspiciously small, multiply
-                if val < 100:
-                    val *= 1_000_000  # e.g. "1.5" → 1,500,000
-                elif val < 10_000:
-                    val *= 1_000      # e.g. "1500" → 1,500,000
-                parsed.append(val)
-            except ValueError:
-                continue
-
-        if not parsed:
-            return None, None
-
-        # Filter out unreasonable values (< min wage ~1.3M or > 50M)
-        reasonable = [v for v in parsed if 1_000_000 <= v <= 50_000_000]
-        if not reasonable:
-            # Try raw values without filtering
-            reasonable = sorted(parsed)
-
-        if len(reasonable) >= 2:
-            return min(reasonable), max(reasonable)
-        elif len(reasonable) == 1:
-            return reasonable[0], reasonable[0]
-        return None, None
+        return SalaryParser.parse(raw)
 
     # ── Contract Type Detection ───────────────────────────────────
     @staticmethod
     def detect_contract_type(job: JobPosting) -> JobPosting:
         text = (job.title + " " + job.description + " " + job.salary_raw).lower()
 
-        if any(kw in text for kw in config.TEMPORAL_KEYWORDS):
+        cfg = compiled_config.current()
+        if any(kw in text for kw in cfg.temporal_keywords):
             job.contract_type = "temporal"
             job.is_temporal = True
-        elif any(kw in text for kw in config.PERMANENT_KEYWORDS):
+        elif any(kw in text for kw in cfg.permanent_keywords):
             job.contract_type = "permanente"
             job.is_temporal = False
         else:
@@ -80,57 +53,128 @@ class DataCleaner:
     def extract_benefits(job: JobPosting) -> JobPosting:
         text = (job.description + " " + job.salary_raw).lower()
         found = []
-        for benefit_name, keywords in config.BENEFITS_MAP.items():
+        for benefit_name, keywords in compiled_config.current().benefits:
             if any(kw in text for kw in keywords):
                 found.append(benefit_name)
-        job.benefits = found
+        job.benefits = intern_benefits(found)
         return job
 
     # ── Deduplication ─────────────────────────────────────────────
     @staticmethod
-    def deduplicate(jobs: List[JobPosting]) -> List[JobPosting]:
-        """Remove duplicate postings based on (title, company, location) tuple."""
+    def deduplicate(
+        jobs: List[JobPosting], seen_index: Optional[FingerprintStore] = None,
+    ) -> List[JobPosting]:
+        """Remove exact (title, company, location) duplicates, then merge near-duplicates.
+
+        With a ``seen_index``, every surviving posting is stamped with
+        first_seen/last_seen before near-duplicates are merged.
+        """
         seen = set()
         unique = []
         for job in jobs:
-            key = (
-                job.title.lower().strip(),
-                job.company.lower().strip(),
-                job.location.lower().strip(),
-            )
-            if key not in seen:
-                seen.add(key)
+            job.fingerprint = posting_fingerprint(job)
+            if job.fingerprint not in seen:
+                seen.add(job.fingerprint)
                 unique.append(job)
         logger.info("Deduplication: %d → %d jobs", len(jobs), len(unique))
+
+        if seen_index is not None:
+            seen_index.observe(unique)
+
+        if config.NEAR_DUPLICATE_DETECTION:
+            unique = NearDuplicateDetector().deduplicate(unique)
         return unique
 
-    # ── Full Pipeline ─────────────────────────────────────────────
+    # ── Enrichment stages ─────────────────────────────────────────
+    # (run, snapshot the result, restore a cached result), in pipeline order.
+    # Relevance is not listed: its keyword hits are cached, the scores come
+    # from one batch pass over all postings.
     @classmethod
-    def clean_all(cls, jobs: List[JobPosting]) -> List[JobPosting]:
-        """Run the entire cleaning + enrichment pipeline."""
-        logger.info("Starting data cleaning pipeline on %d jobs", len(jobs))
+    def _stages(cls) -> dict:
+        return {
+            "salary": (
+                lambda job: _set_pair(job, "salary_min", "salary_max", cls.parse_salary(job.salary_raw)),
+                lambda job: [job.salary_min, job.salary_max],
+                lambda job, r: _set_pair(job, "salary_min", "salary_max", r),
+            ),
+            "zone": (
+                ZoneCategorizer.categorize,
+                lambda job: [job.zone, list(job.secondary_zones)],
+                lambda job, r: _set_pair(job, "zone", "secondary_zones", [r[0], intern_tuple(r[1])]),
+            ),
+            "contract": (
+                cls.detect_contract_type,
+                lambda job: [job.contract_type, job.is_temporal],
+                lambda job, r: _set_pair(job, "contract_type", "is_temporal", r),
+            ),
+            "benefits": (
+                cls.extract_benefits,
+                lambda job: list(job.benefits),
+                lambda job, r: setattr(job, "benefits", intern_benefits(r)),
+            ),
+        }
 
-        cleaned = []
-        for job in jobs:
-            # Parse salary
-            job.salary_min, job.salary_max = cls.parse_salary(job.salary_raw)
+    @classmethod
+    def enrich(cls, jobs: List[JobPosting], cache: Optional[EnrichmentCache] = None) -> None:
+        """Run every enrichment stage, reusing cached results whose raw hash and stage version match."""
+        versions = stage_versions()
+        combined = rules_version(versions)
+        stages = cls._stages()
 
-            # Categorize zone
-            ZoneCategorizer.categorize(job)
+        for job in jobs:
+            job.raw_hash = raw_content_hash(job)
+            job.rules_version = combined
+        cached = cache.get_many(job.raw_hash for job in jobs) if cache is not None else {}
 
-            # Detect contract type
-            cls.detect_contract_type(job)
+        fresh = []
+        reused = 0
+        keyword_hits = []
+        for job in jobs:
+            entries = cached.get(job.raw_hash, {})
+            for stage, (run, snapshot, restore) in stages.items():
+                entry = entries.get(stage)
+                if entry is not None and entry[0] == versions[stage]:
+                    restore(job, entry[1])
+                    reused += 1
+                else:
+                    run(job)
+                    fresh.append((job.raw_hash, stage, versions[stage], snapshot(job)))
+
+            entry = entries.get("relevance")
+            if entry is not None and entry[0] == versions["relevance"]:
+                keyword_hits.append(entry[1])
+                reused += 1
+            else:
+                row = RelevanceFeatures.keyword_hits(job)
+                keyword_hits.append(row)
+                fresh.append((job.raw_hash, "relevance", versions["relevance"], row))
+
+        RelevanceScorer.score_all(jobs, keyword_hits)
+
+        if cache is not None:
+            cache.put_many(fresh)
+            logger.info("Enrichment cache: %d stage results reused, %d recomputed", reused, len(fresh))
 
-            # Extract benefits
-            cls.extract_benefits(job)
+    # ── Full Pipeline ─────────────────────────────────────────────
+    @classmethod
+    def clean_all(
+        cls,
+        jobs: Union[List[JobPosting], JobBatch],
+        seen_index: Optional[FingerprintStore] = None,
+        cache: Optional[EnrichmentCache] = None,
+    ) -> Union[List[JobPosting], JobBatch]:
+        """Run the entire cleaning + enrichment pipeline. A JobBatch in gives a JobBatch out."""
+        if isinstance(jobs, JobBatch):
+            return JobBatch.from_jobs(cls.clean_all(list(jobs), seen_index, cache))
 
-            # Score relevance
-            RelevanceScorer.score(job)
+        logger.info("Starting data cleaning pipeline on %d jobs", len(jobs))
 
-            cleaned.append(job)
+        # Salary, zone, contract type, benefits, relevance
+        cleaned = list(jobs)
+        cls.enrich(cleaned, cache)
 
         # Deduplicate
-        cleaned = cls.deduplicate(cleaned)
+        cleaned = cls.deduplicate(cleaned, seen_index)
 
         logger.info("Cleaning complete: %d jobs", len(cleaned))
         return cleaned
@@ -0,0 +1,211 @@
+"""Near-duplicate detection across portals: MinHash signatures + LSH banding."""
+
+import logging
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+from data_schema import JobPosting, intern_benefits, intern_tuple
+from .text import normalize
+import compiled_config
+import config
+
+logger = logging.getLogger(__name__)
+
+_SIGNATURE_CHUNK_SHINGLES = 1 << 16     # Shingles hashed per chunk (× num_perm uint64 temporaries)
+
+
+class _UnionFind:
+    """Disjoint sets of postings, tracking each set's specific (non-generic) zones."""
+
+    def __init__(self, zones: List[str], generic: frozenset):
+        self.parent = list(range(len(zones)))
+        self.zones = [set() if zone in generic else {zone} for zone in zones]
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def compatible(self, a: int, b: int) -> bool:
+        """Same vacancy text in two different municipalities is two vacancies,
+        also when a generic-zone posting would chain them together."""
+        ra, rb = self.find(a), self.find(b)
+        return ra == rb or len(self.zones[ra] | self.zones[rb]) <= 1
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            root, child = min(ra, rb), max(ra, rb)
+            self.parent[child] = root
+            self.zones[root] |= self.zones[child]
+            self.zones[child] = set()
+
+
+class NearDuplicateDetector:
+    """Cluster postings whose shingled title+company+description are near-identical.
+
+    Each posting gets a MinHash signature of ``num_perm`` values; signatures are
+    split into ``bands`` bands and only postings sharing a band bucket are
+    compared, so cost grows with the number of postings, not its square.
+    """
+
+    def __init__(
+        self,
+        threshold: float = config.NEAR_DUP_THRESHOLD,
+        num_perm: int = config.MINHASH_PERMUTATIONS,
+        bands: int = config.LSH_BANDS,
+        shingle_size: int = config.SHINGLE_SIZE,
+        seed: int = 1,
+    ):
+        if not 1 <= shingle_size <= 8:
+            raise ValueError("shingle_size must be between 1 and 8 bytes")
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+    # ── Signatures ────────────────────────────────────────────────
+    def shingles(self, job: JobPosting) -> np.ndarray:
+        """Distinct character k-shingles of the posting, packed into uint64 ids."""
+        company = "" if job.company.strip().lower() in config.PLACEHOLDER_COMPANIES else job.company
+        text = normalize(" ".join((job.title, company, job.description))).encode("utf-8")
+        buf = np.frombuffer(text, dtype=np.uint8).astype(np.uint64)
+        k = self.shingle_size
+        if len(buf) <= k:
+            return np.array([int.from_bytes(text, "little")], dtype=np.uint64)
+        n = len(buf) - k + 1
+        ids = buf[:n].copy()
+        for j in range(1, k):
+            ids |= buf[j:j + n] << np.uint64(8 * j)
+        return np.unique(ids)
+
+    def signatures(self, jobs: List[JobPosting]) -> np.ndarray:
+        """MinHash signature matrix (one row per posting).
+
+        Postings are hashed in chunks of at most ``_SIGNATURE_CHUNK_SHINGLES``
+        shingles (a longer posting is a chunk on its own), which bounds the
+        ``num_perm × shingles`` temporary whatever the description lengths.
+        """
+        sigs = np.empty((len(jobs), self.num_perm), dtype=np.uint32)
+        start, parts, size = 0, [], 0
+        for i, job in enumerate(jobs):
+            part = self.shingles(job)
+            if parts and size + len(part) > _SIGNATURE_CHUNK_SHINGLES:
+                self._hash_chunk(parts, sigs[start:i])
+                start, parts, size = i, [], 0
+            parts.append(part)
+            size += len(part)
+        if parts:
+            self._hash_chunk(parts, sigs[start:])
+        return sigs
+
+    def _hash_chunk(self, parts: List[np.ndarray], out: np.ndarray) -> None:
+        offsets = np.cumsum([0] + [len(p) for p in parts[:-1]])
+        flat = np.concatenate(parts)
+        # Multiply-shift hashing: high 32 bits of (a·x + b) mod 2⁶⁴, no division
+        phv = (np.outer(self._a, flat) + self._b[:, None]) >> np.uint64(32)
+        out[:] = np.minimum.reduceat(phv, offsets, axis=1).T
+
+    # ── Clustering ────────────────────────────────────────────────
+    def clusters(self, jobs: List[JobPosting]) -> List[List[int]]:
+        """Group indices of near-duplicate postings (singletons included)."""
+        n = len(jobs)
+        if n == 0:
+            return []
+        sigs = self.signatures(jobs)
+        uf = _UnionFind([job.zone for job in jobs], compiled_config.current().generic_zones)
+        min_agree = self.threshold * self.num_perm
+
+        for band in range(self.bands):
+            for members in self._band_buckets(sigs, band):
+                # Verify the bucket against successive heads, vectorized; the number
+                # of heads is bounded so a huge bucket cannot go quadratic.
+                pending = members
+                for _ in range(config.LSH_MAX_BUCKET_CHECKS):
+                    if len(pending) < 2:
+                        break
+                    head, rest = pending[0], pending[1:]
+                    agree = np.count_nonzero(sigs[rest] == sigs[head], axis=1)
+                    merged = np.zeros(len(rest), dtype=bool)
+                    for k in np.flatnonzero(agree >= min_agree):
+                        if uf.compatible(int(head), int(rest[k])):
+                            uf.union(int(head), int(rest[k]))
+                            merged[k] = True
+                    pending = rest[~merged]
+
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for i in range(n):
+            groups[uf.find(i)].append(i)
+        return list(groups.values())
+
+    def _band_buckets(self, sigs: np.ndarray, band: int) -> List[np.ndarray]:
+        """Index arrays of postings that share this band's signature slice (size ≥ 2)."""
+        rows = np.ascontiguousarray(sigs[:, band * self.rows:(band + 1) * self.rows])
+        keys = rows.view(np.dtype((np.void, rows.dtype.itemsize * self.rows))).ravel()
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        order = np.argsort(inverse, kind="stable")
+        ends = np.cumsum(counts)
+        return [order[ends[i] - counts[i]:ends[i]] for i in np.flatnonzero(counts > 1)]
+
+    # ── Canonical merge ───────────────────────────────────────────
+    @staticmethod
+    def richness(job: JobPosting) -> int:
+        generic = compiled_config.current().generic_zones
+        score = len(job.description) // 50
+        score += job.company.strip().lower() not in config.PLACEHOLDER_COMPANIES
+        score += 2 * (job.salary_max is not None)
+        score += job.zone not in generic
+        score += job.contract_type not in ("unknown", "sin especificar")
+        score += bool(job.url) + bool(job.date_posted) + len(job.benefits)
+        return score
+
+    @classmethod
+    def merge(cls, group: List[JobPosting]) -> JobPosting:
+        """Keep the richest posting and fill its gaps from the others."""
+        generic = compiled_config.current().generic_zones
+        ranked = sorted(group, key=cls.richness, reverse=True)
+        canon = ranked[0]
+        for other in ranked[1:]:
+            if canon.company.strip().lower() in config.PLACEHOLDER_COMPANIES and \
+                    other.company.strip().lower() not in config.PLACEHOLDER_COMPANIES:
+                canon.company = other.company
+            if len(other.description) > len(canon.description):
+                canon.description = other.description
+            if canon.salary_max is None and other.salary_max is not None:
+                canon.salary_raw = other.salary_raw
+                canon.salary_min, canon.salary_max = other.salary_min, other.salary_max
+            if canon.zone in generic and other.zone not in generic:
+                canon.zone = other.zone
+            canon.secondary_zones = intern_tuple(
+                z for z in dict.fromkeys(canon.secondary_zones + (other.zone,) + other.secondary_zones)
+                if z != canon.zone and z not in generic
+            )
+            if canon.contract_type in ("unknown", "sin especificar") and \
+                    other.contract_type not in ("unknown", "sin especificar"):
+                canon.contract_type, canon.is_temporal = other.contract_type, other.is_temporal
+            if not canon.url:
+                canon.url = other.url
+            if other.date_posted and (not canon.date_posted or other.date_posted < canon.date_posted):
+                canon.date_posted = other.date_posted
+            canon.benefits = intern_benefits(dict.fromkeys(canon.benefits + other.benefits))
+            canon.relevance_score = max(canon.relevance_score, other.relevance_score)
+            if other.first_seen and (not canon.first_seen or other.first_seen < canon.first_seen):
+                canon.first_seen = other.first_seen
+        return canon
+
+    def deduplicate(self, jobs: List[JobPosting]) -> List[JobPosting]:
+        """Collapse near-duplicate clusters into canonical records, preserving input order."""
+        groups = self.clusters(jobs)
+        groups.sort(key=lambda g: g[0])
+        merged = [self.merge([jobs[i] for i in g]) if len(g) > 1 else jobs[g[0]] for g in groups]
+        logger.info("Near-duplicate merge: %d → %d jobs", len(jobs), len(merged))
+        return merged
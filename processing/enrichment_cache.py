@@ -0,0 +1,121 @@
+"""Persisted per-stage enrichment results keyed by raw-content hash and rules version."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+
+from data_schema import JobPosting
+import compiled_config
+import config
+
+logger = logging.getLogger(__name__)
+
+# Bump when a stage's code changes in a way that alters its output
+STAGE_CODE_VERSIONS = {
+    "salary": 1,
+    "zone": 2,
+    "contract": 1,
+    "benefits": 1,
+    "relevance": 2,
+}
+
+# Scraped fields; any change here means the posting must be re-cleaned
+RAW_FIELDS = (
+    "title", "company", "location", "salary_raw", "description", "url", "source", "date_posted",
+)
+
+_QUERY_CHUNK = 500
+
+
+def _digest(payload) -> str:
+    text = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def raw_content_hash(job: JobPosting) -> str:
+    return _digest([getattr(job, name) for name in RAW_FIELDS])
+
+
+def stage_versions() -> Dict[str, str]:
+    """Version hash per stage, derived from the config tables that stage reads."""
+    cfg = compiled_config.current()
+    tables = cfg.tables
+    zone = _digest([STAGE_CODE_VERSIONS["zone"], cfg.gazetteer.digest])
+    return {
+        "salary": _digest([
+            STAGE_CODE_VERSIONS["salary"],
+            config.SMMLV, config.MONTHLY_HOURS, config.MONTHLY_DAYS,
+        ]),
+        "zone": zone,
+        "contract": _digest([
+            STAGE_CODE_VERSIONS["contract"],
+            tables["TEMPORAL_KEYWORDS"], tables["PERMANENT_KEYWORDS"],
+        ]),
+        "benefits": _digest([STAGE_CODE_VERSIONS["benefits"], tables["BENEFITS_MAP"]]),
+        # Cached relevance results are keyword hits; zone, source and weights
+        # enter at scoring time, which always reruns
+        "relevance": _digest([
+            STAGE_CODE_VERSIONS["relevance"],
+            tables["STRONG_RELEVANCE_KEYWORDS"],
+            tables["MEDIUM_RELEVANCE_KEYWORDS"],
+            tables["NEGATIVE_RELEVANCE_KEYWORDS"],
+        ]),
+        # Not a cached stage; part of rules_version so scores record their weights
+        "scoring": _digest([
+            config.RELEVANCE_MODE, config.RELEVANCE_RULES, config.RELEVANCE_WEIGHTS,
+        ]),
+    }
+
+
+def rules_version(versions: Dict[str, str]) -> str:
+    return _digest(sorted(versions.items()))
+
+
+class EnrichmentCache:
+    """SQLite table of (raw_hash, stage) → (version, JSON result)."""
+
+    def __init__(self, path: Union[str, Path] = config.ENRICHMENT_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS enrichment ("
+            " raw_hash TEXT NOT NULL, stage TEXT NOT NULL, version TEXT NOT NULL,"
+            " result TEXT NOT NULL, PRIMARY KEY (raw_hash, stage)"
+            ") WITHOUT ROWID"
+        )
+
+    def get_many(self, raw_hashes: Iterable[str]) -> Dict[str, Dict[str, Tuple[str, object]]]:
+        """{raw_hash: {stage: (version, result)}} for every cached entry."""
+        keys = list(set(raw_hashes))
+        found: Dict[str, Dict[str, Tuple[str, object]]] = {}
+        for i in range(0, len(keys), _QUERY_CHUNK):
+            chunk = keys[i:i + _QUERY_CHUNK]
+            rows = self.conn.execute(
+                "SELECT raw_hash, stage, version, result FROM enrichment WHERE raw_hash IN (%s)"
+                % ",".join("?" * len(chunk)),
+                chunk,
+            )
+            for raw_hash, stage, version, result in rows:
+                found.setdefault(raw_hash, {})[stage] = (version, json.loads(result))
+        return found
+
+    def put_many(self, entries: List[Tuple[str, str, str, object]]) -> None:
+        """Store (raw_hash, stage, version, result) rows, replacing older versions."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO enrichment VALUES (?, ?, ?, ?)",
+                [(h, s, v, json.dumps(r, ensure_ascii=False)) for h, s, v, r in entries],
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "EnrichmentCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,184 @@
+"""Token-indexed gazetteer: place-name mentions → zones."""
+
+import csv
+import hashlib
+import logging
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+from .text import fold_accents
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Match levels, most specific first
+MUNICIPALITY = 0   # A municipality, or a vereda/corregimiento mapped to one
+REGION = 1         # The region itself ("Urabá")
+PARENT = 2         # The parent region, or a known place outside the region
+
+
+def tokenize(text: str) -> List[str]:
+    """Accent-folded word tokens: "Apartadó-Antioquia" → ["apartado", "antioquia"]."""
+    return _TOKEN.findall(fold_accents(text))
+
+
+def load_places_csv(path: Union[str, Path]) -> List[Tuple[str, str]]:
+    """(name, municipality) rows from a CSV with ``name`` and ``municipality`` columns."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [
+            (row["name"].strip(), row["municipality"].strip())
+            for row in csv.DictReader(f)
+            if row.get("name", "").strip() and row.get("municipality", "").strip()
+        ]
+
+
+def drop_truncated_aliases(names: Iterable[str]) -> List[str]:
+    """Fold names and drop those that are another one cut mid-word ("apartad" of "apartado").
+
+    Truncated aliases exist so substring matching catches both spellings; once
+    accents are folded the full name covers them, and as whole tokens they
+    would never match anything.
+    """
+    folded = list(dict.fromkeys(tuple(tokenize(name)) for name in names))
+    return [
+        " ".join(name) for name in folded
+        if name and not any(_truncates(name, other) for other in folded)
+    ]
+
+
+def _truncates(name: Tuple[str, ...], other: Tuple[str, ...]) -> bool:
+    """True if ``name`` is ``other`` cut mid-word: earlier tokens equal, the last one a strict prefix."""
+    k = len(name) - 1
+    return (
+        len(other) > k and other[:k] == name[:k]
+        and other[k] != name[k] and other[k].startswith(name[k])
+    )
+
+
+class Gazetteer:
+    """Hash index from folded token n-grams to (zone, level).
+
+    Lookup scans the text's tokens once. Only tokens that start some place
+    name (``starts``, which also records the longest such name) try n-grams,
+    longest first, so the cost per token is bounded by the longest place name
+    and does not grow with the number of places.
+    """
+
+    def __init__(self, generic_zone: str, parent_zone: str, unknown_zone: str):
+        self.generic_zone = generic_zone
+        self.parent_zone = parent_zone
+        self.unknown_zone = unknown_zone
+        self.index: Dict[Tuple[str, ...], Tuple[str, int]] = {}
+        self.starts: Dict[str, int] = {}
+
+    @classmethod
+    def from_tables(
+        cls,
+        municipalities: Mapping[str, Sequence[str]],
+        places: Mapping[str, Sequence[str]],
+        region_keywords: Sequence[str],
+        parent_keywords: Sequence[str],
+        generic_zone: str,
+        parent_zone: str,
+        unknown_zone: str,
+        extra_places: Sequence[Tuple[str, str]] = (),
+    ) -> "Gazetteer":
+        """Build from the config tables; earlier entries win on a name clash."""
+        gaz = cls(generic_zone, parent_zone, unknown_zone)
+        for zone, names in municipalities.items():
+            gaz.add_many(drop_truncated_aliases(names), zone, MUNICIPALITY)
+        for zone, names in places.items():
+            gaz.add_many(drop_truncated_aliases(names), zone, MUNICIPALITY)
+        gaz.add_many(drop_truncated_aliases(region_keywords), generic_zone, REGION)
+        gaz.add_many(drop_truncated_aliases(parent_keywords), parent_zone, PARENT)
+
+        # Place lists cover whole departments; only municipalities we track become zones
+        by_folded_name = {fold_accents(zone): zone for zone in municipalities}
+        outside = 0
+        for name, municipality in extra_places:
+            zone = by_folded_name.get(fold_accents(municipality))
+            if zone is None:
+                outside += 1
+                gaz.add(name, parent_zone, PARENT)
+            else:
+                gaz.add(name, zone, MUNICIPALITY)
+        if extra_places:
+            logger.info(
+                "Gazetteer: %d extra places (%d outside the region)", len(extra_places), outside,
+            )
+        return gaz
+
+    def add(self, name: str, zone: str, level: int = MUNICIPALITY) -> None:
+        key = tuple(tokenize(name))
+        if not key:
+            return
+        self.index.setdefault(key, (zone, level))
+        self.starts[key[0]] = max(self.starts.get(key[0], 0), len(key))
+
+    def add_many(self, names: Iterable[str], zone: str, level: int = MUNICIPALITY) -> None:
+        for name in names:
+            self.add(name, zone, level)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def digest(self) -> str:
+        """Hash of the index contents, for cache versioning."""
+        h = hashlib.blake2b(digest_size=8)
+        for key in sorted(self.index):
+            zone, level = self.index[key]
+            h.update(f"{' '.join(key)}\t{zone}\t{level}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    # ── Lookup ────────────────────────────────────────────────────
+    def matches(self, text: str) -> List[Tuple[str, int]]:
+        """(zone, level) for every place mention in ``text``, in order of appearance."""
+        tokens = tokenize(text)
+        index, starts = self.index, self.starts
+        found = []
+        i, n_tokens = 0, len(tokens)
+        while i < n_tokens:
+            max_n = starts.get(tokens[i])
+            if max_n is None:
+                i += 1
+                continue
+            for n in range(min(max_n, n_tokens - i), 0, -1):
+                hit = index.get(tuple(tokens[i:i + n]))
+                if hit is not None:
+                    found.append(hit)
+                    i += n
+                    break
+            else:
+                i += 1
+        return found
+
+    def locate(self, *texts: str) -> Tuple[str, Tuple[str, ...]]:
+        """Primary zone and secondary municipalities for texts given in priority order.
+
+        The primary zone is the first municipality mentioned (location before
+        title before description); other municipalities become secondary. With
+        no municipality, a region or parent-region mention gives the generic
+        label.
+        """
+        zones: List[str] = []
+        best_level = None
+        for text in texts:
+            if not text:
+                continue
+            for zone, level in self.matches(text):
+                if level == MUNICIPALITY:
+                    if zone not in zones:
+                        zones.append(zone)
+                elif best_level is None or level < best_level:
+                    best_level = level
+
+        if zones:
+            return zones[0], tuple(zones[1:])
+        if best_level == REGION:
+            return self.generic_zone, ()
+        if best_level == PARENT:
+            return self.parent_zone, ()
+        return self.unknown_zone, ()
@@ -1,48 +1,156 @@
 """Score how relevant each job posting is to the Urabá region."""
 
 import logging
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
 from data_schema import JobPosting
+import compiled_config
 import config
 
 logger = logging.getLogger(__name__)
 
+# Zone classes, in feature order
+ZONE_CLASSES = ("municipality", "region", "parent", "unknown")
+_MUNICIPALITY, _REGION, _PARENT, _UNKNOWN = range(4)
 
-class RelevanceScorer:
-    """Heuristic relevance scoring (0.0 – 1.0)."""
+MODES = ("rules", "weighted")
 
-    @classmethod
-    def score(cls, job: JobPosting) -> float:
+
+class RelevanceFeatures:
+    """Relevance inputs for a batch of postings, one NumPy column per feature.
+
+    Keyword hits are the expensive part (substring scans over the text), so
+    they can be passed in precomputed; everything else comes from fields.
+    Scoring the same features with different weights is a few array ops.
+    """
+
+    def __init__(
+        self,
+        hits: np.ndarray,
+        zone_class: np.ndarray,
+        source: np.ndarray,
+        sources: List[str],
+        has_salary: np.ndarray,
+    ):
+        self.strong = hits[:, 0]
+        self.medium = hits[:, 1]
+        self.negative = hits[:, 2]
+        self.zone_class = zone_class
+        self.source = source
+        self.sources = sources
+        self.has_salary = has_salary
+
+    def __len__(self) -> int:
+        return len(self.zone_class)
+
+    @staticmethod
+    def keyword_hits(job: JobPosting) -> List[int]:
+        """[strong, medium, negative] keyword counts for one posting."""
+        cfg = compiled_config.current()
         text = (
             job.title + " " + job.location + " " + job.company + " " + job.description
         ).lower()
+        return [
+            sum(1 for kw in cfg.strong_keywords if kw in text),
+            sum(1 for kw in cfg.medium_keywords if kw in text),
+            sum(1 for kw in cfg.negative_keywords if kw in text),
+        ]
 
-        score = 0.0
+    @classmethod
+    def from_jobs(
+        cls, jobs: Sequence[JobPosting], hits: Optional[Sequence[Sequence[int]]] = None,
+    ) -> "RelevanceFeatures":
+        cfg = compiled_config.current()
+        zone_codes = {cfg.generic_zone: _REGION, cfg.parent_zone: _PARENT, cfg.unknown_zone: _UNKNOWN, "": _UNKNOWN}
+        if hits is None:
+            hits = [cls.keyword_hits(job) for job in jobs]
+        source_codes: Dict[str, int] = {}
+        return cls(
+            hits=np.array(hits, dtype=np.int16).reshape(len(jobs), 3),
+            zone_class=np.fromiter(
+                (zone_codes.get(job.zone, _MUNICIPALITY) for job in jobs), dtype=np.int8, count=len(jobs),
+            ),
+            source=np.fromiter(
+                (source_codes.setdefault(job.source, len(source_codes)) for job in jobs),
+                dtype=np.int32, count=len(jobs),
+            ),
+            sources=list(source_codes),
+            has_salary=np.fromiter(
+                (job.salary_min is not None or job.salary_max is not None for job in jobs),
+                dtype=bool, count=len(jobs),
+            ),
+        )
 
-        # Strong Urabá indicators → 0.8 – 1.0
-        strong_hits = sum(1 for kw in config.STRONG_RELEVANCE_KEYWORDS if kw in text)
-        if strong_hits >= 2:
-            score = 1.0
-        elif strong_hits == 1:
-            score = 0.85
+    # ── Scoring ───────────────────────────────────────────────────
+    def scores(self, mode: Optional[str] = None, params: Optional[dict] = None) -> np.ndarray:
+        """Scores rounded to 2 decimals, under ``mode`` (default config.RELEVANCE_MODE)."""
+        mode = mode or config.RELEVANCE_MODE
+        if mode == "rules":
+            raw = self._rules(params or config.RELEVANCE_RULES)
+        elif mode == "weighted":
+            raw = self._weighted(params or config.RELEVANCE_WEIGHTS)
+        else:
+            raise ValueError(f"Unknown relevance mode {mode!r}; choose from {MODES}")
+        return np.round(raw, 2)
 
-        # Zone already mapped to a Urabá municipality
-        if job.zone and job.zone not in ("Sin especificar", "Antioquia (Other)"):
-            score = max(score, 0.9)
+    def _rules(self, r: dict) -> np.ndarray:
+        """The original step rules, branch for branch."""
+        score = np.where(self.strong >= 2, r["strong_two"], np.where(self.strong == 1, r["strong_one"], 0.0))
+        in_region = self.zone_class <= _REGION
+        score = np.where(in_region, np.maximum(score, r["zone"]), score)
+        score = np.where((score < r["medium"]) & (self.medium > 0), r["medium"], score)
+        penalize = (self.negative > 0) & (score < r["negative_below"])
+        score = np.where(
+            penalize,
+            np.maximum(r["negative_min"], score - r["negative_step"] * self.negative),
+            score,
+        )
+        return np.where(score == 0.0, r["floor"], score)
 
-        # Medium indicators
-        if score < 0.5:
-            medium_hits = sum(1 for kw in config.MEDIUM_RELEVANCE_KEYWORDS if kw in text)
-            if medium_hits:
-                score = max(score, 0.5)
+    def _weighted(self, w: dict) -> np.ndarray:
+        zone = np.array([w["zone"].get(name, 0.0) for name in ZONE_CLASSES])
+        source = np.array([w["source"].get(name, 0.0) for name in self.sources] or [0.0])
+        score = (
+            w["bias"]
+            + w["strong"] * np.minimum(self.strong, w["strong_cap"])
+            + w["medium"] * (self.medium > 0)
+            + w["negative"] * self.negative
+            + zone[self.zone_class]
+            + source[self.source]
+            + w["salary"] * self.has_salary
+        )
+        return np.clip(score, w["min"], 1.0)
 
-        # Negative indicators (other cities) → penalize
-        neg_hits = sum(1 for kw in config.NEGATIVE_RELEVANCE_KEYWORDS if kw in text)
-        if neg_hits and score < 0.8:
-            score = max(0.1, score - 0.3 * neg_hits)
 
-        # Floor
-        if score == 0.0:
-            score = 0.3  # At least partial relevance since we searched regionally
+class RelevanceScorer:
+    """Heuristic relevance scoring (0.0 – 1.0)."""
 
-        job.relevance_score = round(score, 2)
+    @classmethod
+    def score(cls, job: JobPosting) -> float:
+        job.relevance_score = float(RelevanceFeatures.from_jobs([job]).scores()[0])
         return job.relevance_score
+
+    @classmethod
+    def score_all(
+        cls,
+        jobs: Sequence[JobPosting],
+        hits: Optional[Sequence[Sequence[int]]] = None,
+        mode: Optional[str] = None,
+        params: Optional[dict] = None,
+    ) -> RelevanceFeatures:
+        """Score a batch in one vectorized pass; returns the features for re-scoring."""
+        features = RelevanceFeatures.from_jobs(jobs, hits)
+        for job, value in zip(jobs, features.scores(mode, params).tolist()):
+            job.relevance_score = value
+        return features
+
+    @staticmethod
+    def rescore(
+        jobs: Iterable[JobPosting], features: RelevanceFeatures,
+        mode: Optional[str] = None, params: Optional[dict] = None,
+    ) -> None:
+        """Apply new weights to postings whose features are already extracted."""
+        for job, value in zip(jobs, features.scores(mode, params).tolist()):
+            job.relevance_score = value
@@ -0,0 +1,190 @@
+"""Salary parsing engine: precompiled patterns + LRU memo keyed by the raw string."""
+
+import re
+import logging
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+SalaryRange = Tuple[Optional[float], Optional[float]]
+
+# ── Compiled patterns ─────────────────────────────────────────────
+# "2 SMMLV", "1,5 x smmlv", "salario mínimo legal vigente"
+_SMMLV = re.compile(
+    r"(?:(?P<mult>\d+(?:[.,]\d+)?)\s*(?:x\s*)?)?"
+    r"(?:s\.?\s?m\.?\s?m\.?\s?l\.?\s?v\.?|smlmv|smmv|smlv"
+    r"|salarios? m[ií]nimos?(?: legal(?:es)?)?(?: mensual(?:es)?)?(?: vigentes?)?)"
+)
+
+# A number with optional currency prefix and magnitude suffix.
+# "m/cte" (moneda corriente) must not be read as "millones".
+_AMOUNT = re.compile(
+    r"(?P<cur>\$|cop\b)?\s*"
+    r"(?P<num>\d+(?:[.,'’]\d+)*)"
+    r"(?:\s*(?P<unit>millones|mill[oó]n|mill|mm|m(?![a-z/])|mil(?![a-z])|k(?![a-z])))?"
+    r"(?P<cop>\s*cop\b)?"
+)
+
+# Text allowed between the two ends of a range: "2 a 3", "entre 2 y 3", "2 - 3".
+_RANGE_GAP = re.compile(r"^\s*(?:-|–|—|a|y|hasta|al)\s*\$?\s*$")
+
+_HOURLY = re.compile(r"(?:por|la|/|x|cada|valor)\s*hora\b")
+_DAILY = re.compile(r"(?:por|al|/|x|cada)\s*d[ií]a\b|\bdiari[oa]s?\b|\bjornal\b")
+
+# Text allowed between an amount and its period phrase: "$8.000 por hora",
+# "valor hora: $8.000", "jornal de $60.000"
+_PERIOD_GAP = re.compile(r"^[\s:=,]*(?:de\s*)?(?:cop\s*)?$")
+
+_UNIT_SCALE = {
+    "millones": 1_000_000, "millón": 1_000_000, "millon": 1_000_000,
+    "mill": 1_000_000, "mm": 1_000_000, "m": 1_000_000,
+    "mil": 1_000, "k": 1_000,
+}
+
+# Plausible monthly salary band (COP)
+_REASONABLE_MIN = 1_000_000
+_REASONABLE_MAX = 50_000_000
+
+
+def _to_number(num: str) -> float:
+    """Read Colombian-formatted numbers: dots/commas as thousands, 1–2 trailing digits as decimals."""
+    groups = re.split(r"[.,'’]", num)
+    if len(groups) == 1:
+        return float(num)
+    head, tail = groups[:-1], groups[-1]
+    if len(tail) == 3 and all(len(g) == 3 for g in head[1:]):
+        return float("".join(groups))
+    return float("".join(head) + "." + tail)
+
+
+class _Token:
+    """A candidate amount. ``scale`` is the explicit magnitude (unit or SMMLV), if any."""
+
+    __slots__ = ("start", "end", "value", "accepted", "scale")
+
+    def __init__(self, start: int, end: int, value: float, accepted: bool, scale: Optional[float]):
+        self.start = start
+        self.end = end
+        self.value = value
+        self.accepted = accepted
+        self.scale = scale
+
+
+def _tokenize(text: str) -> List[_Token]:
+    tokens: List[_Token] = []
+
+    # SMMLV multiples first; blank them out so their multipliers aren't read as amounts
+    for m in _SMMLV.finditer(text):
+        mult = _to_number(m.group("mult")) if m.group("mult") else 1.0
+        tokens.append(_Token(m.start(), m.end(), mult * config.SMMLV, True, config.SMMLV))
+    if tokens:
+        chars = list(text)
+        for tok in tokens:
+            chars[tok.start:tok.end] = " " * (tok.end - tok.start)
+        text = "".join(chars)
+
+    for m in _AMOUNT.finditer(text):
+        num = m.group("num")
+        try:
+            value = _to_number(num)
+        except ValueError:
+            continue
+        unit = m.group("unit")
+        if unit:
+            scale = _UNIT_SCALE[unit]
+            tokens.append(_Token(m.start(), m.end(), value * scale, True, scale))
+            continue
+        # Bare small numbers ("4 primas", "95 días") are not amounts
+        accepted = bool(m.group("cur") or m.group("cop") or not num.isdigit() or value >= 1_000)
+        tokens.append(_Token(m.start(), m.end(), value, accepted, None))
+
+    tokens.sort(key=lambda t: t.start)
+    return tokens
+
+
+def _resolve_ranges(text: str, tokens: List[_Token]) -> None:
+    """Let the right end of "2 a 3 millones" / "1 a 2 SMMLV" lend its magnitude to the left end."""
+    for left, right in zip(tokens, tokens[1:]):
+        if left.scale is not None or right.scale is None or left.value >= 1_000:
+            continue
+        if not _RANGE_GAP.match(text[left.end:right.start]):
+            continue
+        left.value *= right.scale
+        left.scale = right.scale
+        left.accepted = True
+
+
+def _period(text: str, tok: _Token, periods: List[Tuple[int, int, int]]) -> int:
+    """Hours/days per month if ``tok`` is an hourly/daily rate, else 0.
+
+    Only amounts right next to a "por hora"/"diario" phrase count; SMMLV
+    multiples and amounts already in the monthly band never do ("8 horas
+    diarias $1.500.000" is a monthly salary).
+    """
+    if tok.scale == config.SMMLV or tok.value >= _REASONABLE_MIN:
+        return 0
+    for start, end, period in periods:
+        gap = text[tok.end:start] if start >= tok.end else text[end:tok.start] if end <= tok.start else None
+        if gap is not None and _PERIOD_GAP.match(gap):
+            return period
+    return 0
+
+
+@lru_cache(maxsize=config.SALARY_CACHE_SIZE)
+def _parse(raw: str) -> SalaryRange:
+    text = raw.lower()
+    tokens = _tokenize(text)
+    if not tokens:
+        return None, None
+    _resolve_ranges(text, tokens)
+    periods = (
+        [(m.start(), m.end(), config.MONTHLY_HOURS) for m in _HOURLY.finditer(text)]
+        + [(m.start(), m.end(), config.MONTHLY_DAYS) for m in _DAILY.finditer(text)]
+    )
+
+    parsed: List[float] = []
+    for tok in tokens:
+        if not tok.accepted:
+            continue
+        val = tok.value
+        period = _period(text, tok, periods)
+        if period:
+            val *= period
+        elif tok.scale is None:
+            # Abbreviated amounts: "$1.5" → 1,500,000 ; "$1.500" → 1,500,000
+            if val < 100:
+                val *= 1_000_000
+            elif val < 10_000:
+                val *= 1_000
+        parsed.append(val)
+
+    if not parsed:
+        return None, None
+
+    # Filter out unreasonable values (< ~min wage or > 50M)
+    reasonable = [v for v in parsed if _REASONABLE_MIN <= v <= _REASONABLE_MAX]
+    if not reasonable:
+        reasonable = parsed
+    return min(reasonable), max(reasonable)
+
+
+class SalaryParser:
+    """Memoized parser for free-text Colombian salary strings."""
+
+    @staticmethod
+    def parse(raw: str) -> SalaryRange:
+        """Extract (min, max) monthly salary in COP. Returns (None, None) when no amount is found."""
+        if not raw:
+            return None, None
+        return _parse(raw)
+
+    @staticmethod
+    def cache_info():
+        return _parse.cache_info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        _parse.cache_clear()
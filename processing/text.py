@@ -0,0 +1,21 @@
+"""Text normalization helpers shared by the matching/dedup stages."""
+
+import re
+import unicodedata
+
+_WS = re.compile(r"\s+")
+_NON_WORD = re.compile(r"[^\w\s]")
+_COMBINING = re.compile(r"[\u0300-\u036f]")
+
+
+def fold_accents(text: str) -> str:
+    """Lowercase and strip diacritics: "Apartadó" → "apartado" (ñ → n)."""
+    text = text.lower()
+    if text.isascii():
+        return text
+    return _COMBINING.sub("", unicodedata.normalize("NFKD", text))
+
+
+def normalize(text: str) -> str:
+    """Accent-fold, drop punctuation and collapse whitespace."""
+    return _WS.sub(" ", _NON_WORD.sub(" ", fold_accents(text))).strip()
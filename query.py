@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Query the local job store (or the posting archive) without loading every posting.
+
+Usage:
+    python query.py --zone Turbo --limit 20
+    python query.py --source Computrabajo --since 2026-02-01 --count
+    python query.py --facet zone
+    python query.py --min-relevance 0.8 --json > high.json
+    python query.py --text "auxiliar bodega Apartadó" --contract temporal   # BM25-ranked
+    python query.py --archive --fingerprint 3f2a…     # one archived record
+    python query.py --archive --ordinal 1200 --limit 10
+    python query.py --archive --zone Turbo --all-versions
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import config
+from search import SearchIndex
+from storage import JobStore, PostingArchive
+from storage.archive import field_needle
+from storage.sqlite_store import FACETS, ORDERABLE
+
+
+def print_jobs(jobs, total: int, as_json: bool) -> None:
+    if as_json:
+        print(json.dumps([job.to_dict() for job in jobs], ensure_ascii=False, indent=2))
+        return
+    for job in jobs:
+        salary = f"${job.salary_max:,.0f}" if job.salary_max else "—"
+        print(f"  {job.first_seen or '':19.19s}  {job.zone:20.20s}  {salary:>12s}  "
+              f"{job.title[:50]:50s}  {job.company[:30]}")
+    print(f"\n  {len(jobs)} of {total} matches")
+
+
+def query_archive(args) -> None:
+    """Archive lookups decode only the records they return."""
+    with PostingArchive(args.archive_path) as archive:
+        if args.fingerprint:
+            job = archive.find(args.fingerprint)
+            if job is None:
+                sys.exit(f"No archived posting with fingerprint {args.fingerprint}")
+            print_jobs([job], 1, args.json)
+            return
+        if args.ordinal is not None:
+            view = archive[args.ordinal:args.ordinal + args.limit]
+            print_jobs(list(view), len(archive), args.json)
+            return
+
+        view = archive[:] if args.all_versions else archive.latest()
+        needles, checks = [], []
+        for name, value in (("zone", args.zone), ("source", args.source), ("contract_type", args.contract_type)):
+            if value is not None:
+                needles.append(field_needle(name, value))
+                checks.append(lambda job, name=name, value=value: getattr(job, name) == value)
+        if args.min_relevance is not None:
+            checks.append(lambda job: job.relevance_score >= args.min_relevance)
+        if args.search:
+            needle = args.search.lower()
+            checks.append(lambda job: needle in job.title.lower() or needle in job.company.lower())
+        if needles or checks:
+            view = archive.select(
+                lambda job: all(check(job) for check in checks), needles, within=view.ordinals,
+            )
+        if args.count:
+            print(len(view))
+            return
+        print_jobs(list(view[args.offset:args.offset + args.limit]), len(view), args.json)
+
+
+def query_text(args) -> None:
+    """Rank with the search index, then load only the returned postings from the store."""
+    index = SearchIndex(args.index_dir)
+    hits = index.search(
+        args.text, limit=None,
+        zone=args.zone, contract_type=args.contract_type, source=args.source,
+    )
+    if args.count:
+        print(len(hits))
+        return
+    page = hits[args.offset:args.offset + args.limit]
+    with JobStore(args.db, readonly=True) as store:
+        jobs = store.get_many([fp for fp, _ in page])
+    print_jobs(jobs, len(hits), args.json)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--db", default=str(config.JOB_STORE_PATH), help="job store path")
+    ap.add_argument("--zone")
+    ap.add_argument("--source")
+    ap.add_argument("--contract", dest="contract_type", help="permanente | temporal | …")
+    ap.add_argument("--since", dest="posted_since", help="date_posted on or after (ISO date)")
+    ap.add_argument("--seen-since", help="first seen on or after (ISO date)")
+    ap.add_argument("--min-relevance", type=float)
+    ap.add_argument("--search", help="substring of title or company")
+    ap.add_argument("--text", help="full-text query, BM25-ranked (zone/source/contract filters apply)")
+    ap.add_argument("--index-dir", default=str(config.SEARCH_INDEX_DIR), help="search index directory")
+    ap.add_argument("--order-by", default="first_seen", choices=ORDERABLE)
+    ap.add_argument("--asc", action="store_true", help="ascending order")
+    ap.add_argument("--limit", type=int, default=50)
+    ap.add_argument("--offset", type=int, default=0)
+    ap.add_argument("--count", action="store_true", help="print the number of matches only")
+    ap.add_argument("--facet", choices=FACETS, help="print match counts per value of a column")
+    ap.add_argument("--json", action="store_true", help="print matches as a JSON array")
+    ap.add_argument("--archive", action="store_true", help="query the mmap posting archive instead")
+    ap.add_argument("--archive-path", default=str(config.ARCHIVE_PATH))
+    ap.add_argument("--ordinal", type=int, help="archive: records from this ordinal on")
+    ap.add_argument("--fingerprint", help="archive: the latest record with this fingerprint")
+    ap.add_argument("--all-versions", action="store_true",
+                    help="archive: include every run's copy, not just the latest")
+    args = ap.parse_args()
+
+    if args.archive:
+        query_archive(args)
+        return
+
+    if not Path(args.db).exists():
+        sys.exit(f"No job store at {args.db}; run main.py or seed_data.py first.")
+    if args.text:
+        query_text(args)
+        return
+
+    filters = {
+        "zone": args.zone,
+        "source": args.source,
+        "contract_type": args.contract_type,
+        "posted_since": args.posted_since,
+        "seen_since": args.seen_since,
+        "min_relevance": args.min_relevance,
+        "search": args.search,
+    }
+    with JobStore(args.db, readonly=True) as store:
+        if args.count:
+            print(store.count(**filters))
+            return
+        if args.facet:
+            for value, n in store.facet_counts(args.facet, **filters).items():
+                print(f"  {value or '—':30s} {n:6d}")
+            return
+
+        jobs = store.query(
+            order_by=args.order_by, descending=not args.asc,
+            limit=args.limit, offset=args.offset, **filters,
+        )
+        print_jobs(jobs, store.count(**filters), args.json)
+
+
+if __name__ == "__main__":
+    main()
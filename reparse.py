@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Re-parse archived raw pages with the current scrapers, without fetching anything.
+
+Useful after fixing a parser: every distinct page fetched in the date range
+goes through the portal's parse_listings again, then through the cleaning
+pipeline.
+
+Usage:
+    python reparse.py --since 2026-01-01 --until 2026-02-01
+    python reparse.py --portal Computrabajo --out computrabajo.ndjson
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from scrapers import (
+    ComputrabajoScraper,
+    ElempleoScraper,
+    IndeedScraper,
+    Magneto365Scraper,
+    ComfamaScraper,
+    JoobleScraper,
+)
+from data_schema import start_run
+from processing import DataCleaner, EnrichmentCache
+from storage import RawPageStore
+from storage.ndjson import write_jobs
+import config
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s  %(name)-18s  %(levelname)-7s  %(message)s",
+    datefmt="%H:%M:%S",
+)
+logger = logging.getLogger("reparse")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--since", help="first fetch date to include (ISO)")
+    ap.add_argument("--until", help="fetch date to stop before (ISO)")
+    ap.add_argument("--portal", help="only this portal (scraper name)")
+    ap.add_argument("--out", default="jobs.reparsed.ndjson", help="NDJSON output path")
+    args = ap.parse_args()
+
+    if not Path(config.RAW_PAGES_DIR).exists():
+        sys.exit(f"No raw page archive at {config.RAW_PAGES_DIR}")
+
+    start_run()
+    scrapers = [
+        ComputrabajoScraper(),
+        ElempleoScraper(),
+        Magneto365Scraper(),
+        JoobleScraper(),
+        ComfamaScraper(),
+        IndeedScraper(),
+    ]
+    jobs = []
+    with RawPageStore() as store:
+        for scraper in scrapers:
+            if args.portal and scraper.name != args.portal:
+                continue
+            jobs.extend(scraper.reparse(store, args.since, args.until))
+
+    with EnrichmentCache() as cache:
+        cleaned = DataCleaner.clean_all(jobs, cache=cache)
+    written = write_jobs(cleaned, args.out, keep=0)
+    print(f"  {len(jobs)} parsed → {written} cleaned postings → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
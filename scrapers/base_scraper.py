@@ -1,6 +1,7 @@
 """Abstract base scraper with retry logic and session management."""
 
 import logging
+import sqlite3
 import time
 from abc import ABC, abstractmethod
 from typing import List, Optional
@@ -9,6 +10,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from data_schema import JobPosting
+from storage.raw_pages import RawPageStore
 import config
 
 logger = logging.getLogger(__name__)
@@ -17,8 +19,9 @@ logger = logging.getLogger(__name__)
 class BaseScraper(ABC):
     """Base class for all job portal scrapers."""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, raw_store: Optional[RawPageStore] = None):
         self.name = name
+        self.raw_store = raw_store   # When set, every fetched page is archived
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": config.USER_AGENT,
@@ -33,6 +36,7 @@ class BaseScraper(ABC):
             try:
                 resp = self.session.get(url, timeout=config.REQUEST_TIMEOUT, **kwargs)
                 resp.raise_for_status()
+                self._archive(url, resp.content)
                 return BeautifulSoup(resp.content, "lxml")
             except requests.RequestException as exc:
                 wait = 2 ** attempt
@@ -45,6 +49,15 @@ class BaseScraper(ABC):
         logger.error("%s  gave up on %s", self.name, url)
         return None
 
+    def _archive(self, url: str, body: bytes) -> None:
+        """Store the fetched page in ``raw_store``; a failed write never loses the page."""
+        if self.raw_store is None:
+            return
+        try:
+            self.raw_store.put(self.name, url, body)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("%s  could not archive %s: %s", self.name, url, exc)
+
     def fetch_json(self, url: str, **kwargs) -> Optional[dict]:
         """Fetch a URL expecting JSON response."""
         for attempt in range(config.RETRY_ATTEMPTS):
@@ -101,6 +114,18 @@ class BaseScraper(ABC):
         logger.info("%s  finished: %d jobs total", self.name, len(all_jobs))
         return all_jobs
 
+    def reparse(
+        self, store: RawPageStore, since: Optional[str] = None, until: Optional[str] = None,
+    ) -> List[JobPosting]:
+        """Run ``parse_listings`` over this portal's archived pages (each distinct page once)."""
+        all_jobs: List[JobPosting] = []
+        pages = 0
+        for url, _, body in store.iter_pages(self.name, since, until):
+            all_jobs.extend(self.parse_listings(BeautifulSoup(body, "lxml"), url))
+            pages += 1
+        logger.info("%s  re-parsed %d archived page(s) → %d jobs", self.name, pages, len(all_jobs))
+        return all_jobs
+
     # ── Helpers ───────────────────────────────────────────────────
     @staticmethod
     def clean_text(text: Optional[str]) -> str:
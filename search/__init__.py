@@ -0,0 +1,8 @@
+from .analyzer import analyze, stem
+from .index import SearchIndex
+
+__all__ = [
+    "SearchIndex",
+    "analyze",
+    "stem",
+]
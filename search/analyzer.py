@@ -0,0 +1,41 @@
+"""Spanish analyzer: accent folding, stopwords, light stemming."""
+
+import re
+from typing import List
+
+from processing.text import fold_accents
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_VOWELS = set("aeiou")
+
+# Folded, so "más"/"mas" and "también"/"tambien" are one entry
+STOPWORDS = frozenset("""
+a al algo algunas algunos ante antes como con contra cual cuando de del desde donde durante
+e el ella ellas ellos en entre era es esa esas ese eso esos esta estan estar estas este esto
+estos fue ha hay hasta la las le les lo los mas me mi muy nada ni no nos o otra otras otro
+otros para pero poco por porque que quien quienes se sea ser si sin sobre su sus tambien
+tanto te tiene tienen todo todos tu u un una uno unos y ya yo
+""".split())
+
+
+def stem(word: str) -> str:
+    """Light stemmer: strip plural then final gender vowel.
+
+    "auxiliares" → "auxiliar", "bodegas"/"bodega" → "bodeg",
+    "vendedora"/"vendedores" → "vendedor".
+    """
+    if len(word) > 5 and word.endswith("es") and word[-3] not in _VOWELS:
+        word = word[:-2]
+    elif len(word) > 4 and word.endswith("s"):
+        word = word[:-1]
+    if len(word) > 4 and word[-1] in "aeo":
+        word = word[:-1]
+    return word
+
+
+def analyze(text: str) -> List[str]:
+    """Index/query terms for ``text``, in order (duplicates kept)."""
+    return [
+        stem(tok) for tok in _TOKEN.findall(fold_accents(text))
+        if tok not in STOPWORDS and len(tok) > 1
+    ]
@@ -0,0 +1,349 @@
+"""Persistent BM25 inverted index over posting titles, companies, locations and descriptions.
+
+Postings are numbered in insertion order, so every posting list is sorted by
+doc id and new postings only ever append to it. On disk the index is one
+``.npz`` file: the vocabulary, CSR posting lists (term offsets, doc ids,
+term frequencies) and per-doc columns (fingerprint, raw hash, length, facet
+codes). Postings added since loading sit in a pending segment that is
+folded into the CSR arrays before a search or a save.
+
+A posting whose text changed (new ``raw_hash``) is re-added under a new doc
+id and its old doc tombstoned; ``save()`` compacts tombstones away once
+they make up a large share of the index. Tombstoned docs are left out of
+the document count, document frequencies and average length, so scores
+are the same before and after compaction. One whose text is unchanged but
+whose zone, contract type or source was re-derived (new enrichment rules)
+only has its facet codes updated in place.
+"""
+
+import logging
+import math
+import os
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from data_schema import JobPosting
+from storage.fingerprints import posting_fingerprint
+from .analyzer import analyze
+import config
+
+logger = logging.getLogger(__name__)
+
+FACETS = ("zone", "contract_type", "source")
+FacetFilter = Union[None, str, Sequence[str]]
+
+_MAX_TF = np.iinfo(np.uint16).max
+_COMPACT_RATIO = 0.2        # Compact on save once this share of docs is tombstoned
+
+
+class SearchIndex:
+    """BM25-ranked full-text search with zone/contract/source filters."""
+
+    FILENAME = "index.npz"
+
+    def __init__(
+        self,
+        root: Union[str, Path] = config.SEARCH_INDEX_DIR,
+        k1: float = config.BM25_K1,
+        b: float = config.BM25_B,
+        title_weight: int = config.SEARCH_TITLE_WEIGHT,
+    ):
+        self.root = Path(root)
+        self.path = self.root / self.FILENAME
+        self.k1, self.b, self.title_weight = k1, b, title_weight
+
+        # Per doc
+        self.fingerprints: List[str] = []
+        self.raw_hashes: List[str] = []
+        self.lengths = array("I")
+        self.deleted = bytearray()
+        self.facet_values: Dict[str, List[str]] = {name: [] for name in FACETS}
+        self.facet_codes: Dict[str, array] = {name: array("I") for name in FACETS}
+        self._doc_of: Dict[str, int] = {}
+        self._facet_code_of: Dict[str, Dict[str, int]] = {name: {} for name in FACETS}
+
+        # Posting lists: CSR arrays + the pending segment (row, doc, tf triplets)
+        self.terms: List[str] = []
+        self._term_row: Dict[str, int] = {}
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._doc_ids = np.zeros(0, dtype=np.uint32)
+        self._tfs = np.zeros(0, dtype=np.uint16)
+        self._pending = (array("I"), array("I"), array("H"))
+
+        self._facet_lists: Dict[Tuple[str, str], np.ndarray] = {}
+        self._lengths_np: Optional[np.ndarray] = None
+        self._deleted_np: Optional[np.ndarray] = None
+        self.dirty = False
+
+        if self.path.exists():
+            self._load()
+
+    # ── Persistence ───────────────────────────────────────────────
+    def _load(self) -> None:
+        with np.load(self.path, allow_pickle=False) as data:
+            self.fingerprints = data["fingerprints"].tolist()
+            self.raw_hashes = data["raw_hashes"].tolist()
+            self.lengths = array("I", data["lengths"].tobytes())
+            self.deleted = bytearray(data["deleted"].tobytes())
+            for name in FACETS:
+                self.facet_values[name] = data[f"{name}_values"].tolist()
+                self.facet_codes[name] = array("I", data[f"{name}_codes"].astype(np.uint32).tobytes())
+            self.terms = data["terms"].tolist()
+            self._offsets = data["offsets"]
+            self._doc_ids = data["doc_ids"]
+            self._tfs = data["tfs"]
+        self._doc_of = {fp: i for i, fp in enumerate(self.fingerprints) if not self.deleted[i]}
+        self._term_row = {term: i for i, term in enumerate(self.terms)}
+        for name in FACETS:
+            self._facet_code_of[name] = {v: i for i, v in enumerate(self.facet_values[name])}
+        logger.info("Search index: %d docs, %d terms from %s", len(self._doc_of), len(self.terms), self.path)
+
+    def save(self) -> Path:
+        """Write the index atomically (temp file + rename)."""
+        self._merge_pending()
+        if self.deleted.count(1) > _COMPACT_RATIO * len(self.deleted):
+            self.compact()
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{self.FILENAME}.{os.getpid()}.tmp"
+        arrays = {
+            "fingerprints": np.array(self.fingerprints, dtype=str),
+            "raw_hashes": np.array(self.raw_hashes, dtype=str),
+            "lengths": np.frombuffer(self.lengths, dtype=np.uint32),
+            "deleted": np.frombuffer(bytes(self.deleted), dtype=np.bool_),
+            "terms": np.array(self.terms, dtype=str),
+            "offsets": self._offsets,
+            "doc_ids": self._doc_ids,
+            "tfs": self._tfs,
+        }
+        for name in FACETS:
+            arrays[f"{name}_values"] = np.array(self.facet_values[name], dtype=str)
+            arrays[f"{name}_codes"] = np.frombuffer(self.facet_codes[name], dtype=np.uint32)
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        tmp.replace(self.path)
+        self.dirty = False
+        logger.info("Search index: %d docs, %d terms → %s", len(self), len(self.terms), self.path)
+        return self.path
+
+    # ── Indexing ──────────────────────────────────────────────────
+    def _term_counts(self, job: JobPosting) -> Counter:
+        counts = Counter(analyze(job.title))
+        for term in counts:
+            counts[term] *= self.title_weight
+        counts.update(analyze(f"{job.company} {job.location} {job.description}"))
+        return counts
+
+    def _facet_code(self, name: str, value: str) -> int:
+        codes = self._facet_code_of[name]
+        if value not in codes:
+            codes[value] = len(self.facet_values[name])
+            self.facet_values[name].append(value)
+        return codes[value]
+
+    def _update_facets(self, doc: int, job: JobPosting) -> bool:
+        """Point ``doc``'s facet codes at ``job``'s values; True if any changed."""
+        changed = False
+        for name in FACETS:
+            code = self._facet_code(name, getattr(job, name))
+            if self.facet_codes[name][doc] != code:
+                self.facet_codes[name][doc] = code
+                changed = True
+        return changed
+
+    def add(self, jobs: Iterable[JobPosting]) -> int:
+        """Index new postings; unchanged ones are skipped. Returns the number indexed."""
+        rows, docs, tfs = self._pending
+        added = refaceted = 0
+        for job in jobs:
+            fp = job.fingerprint or posting_fingerprint(job)
+            old = self._doc_of.get(fp)
+            if old is not None:
+                if self.raw_hashes[old] == job.raw_hash:
+                    # Same text; the facets may still come from newer enrichment rules
+                    refaceted += self._update_facets(old, job)
+                    continue
+                self.deleted[old] = 1
+
+            doc = len(self.fingerprints)
+            counts = self._term_counts(job)
+            for term, tf in counts.items():
+                row = self._term_row.get(term)
+                if row is None:
+                    row = self._term_row[term] = len(self.terms)
+                    self.terms.append(term)
+                rows.append(row)
+                docs.append(doc)
+                tfs.append(min(tf, _MAX_TF))
+
+            self.fingerprints.append(fp)
+            self.raw_hashes.append(job.raw_hash)
+            self.lengths.append(sum(counts.values()))
+            self.deleted.append(0)
+            for name in FACETS:
+                self.facet_codes[name].append(self._facet_code(name, getattr(job, name)))
+            self._doc_of[fp] = doc
+            added += 1
+
+        if added or refaceted:
+            self.dirty = True
+            self._facet_lists.clear()
+            self._lengths_np = self._deleted_np = None
+            logger.info("Search index: %d postings indexed, %d re-faceted", added, refaceted)
+        return added
+
+    def _merge_pending(self) -> None:
+        """Fold the pending segment into the CSR arrays.
+
+        Pending doc ids are all larger than the stored ones, so a stable sort
+        by term row keeps every posting list sorted by doc id.
+        """
+        rows, docs, tfs = self._pending
+        if not rows:
+            return
+        n_terms = len(self.terms)
+        base_rows = np.repeat(np.arange(len(self._offsets) - 1, dtype=np.uint32), np.diff(self._offsets))
+        all_rows = np.concatenate([base_rows, np.frombuffer(rows, dtype=np.uint32)])
+        order = np.argsort(all_rows, kind="stable")
+        self._doc_ids = np.concatenate([self._doc_ids, np.frombuffer(docs, dtype=np.uint32)])[order]
+        self._tfs = np.concatenate([self._tfs, np.frombuffer(tfs, dtype=np.uint16)])[order]
+        self._offsets = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(np.bincount(all_rows, minlength=n_terms), out=self._offsets[1:])
+        self._pending = (array("I"), array("I"), array("H"))
+
+    def compact(self) -> None:
+        """Drop tombstoned docs and renumber the rest (order is preserved)."""
+        self._merge_pending()
+        deleted = np.frombuffer(bytes(self.deleted), dtype=np.bool_)
+        if not deleted.any():
+            return
+        live = ~deleted
+        new_id = np.cumsum(live, dtype=np.int64) - 1
+        keep = live[self._doc_ids]
+        rows = np.repeat(np.arange(len(self.terms)), np.diff(self._offsets))[keep]
+        self._doc_ids = new_id[self._doc_ids[keep]].astype(np.uint32)
+        self._tfs = self._tfs[keep]
+        self._offsets = np.zeros(len(self.terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self.terms)), out=self._offsets[1:])
+
+        live_ids = np.flatnonzero(live)
+        self.fingerprints = [self.fingerprints[i] for i in live_ids]
+        self.raw_hashes = [self.raw_hashes[i] for i in live_ids]
+        self.lengths = array("I", np.frombuffer(self.lengths, dtype=np.uint32)[live].tobytes())
+        for name in FACETS:
+            codes = np.frombuffer(self.facet_codes[name], dtype=np.uint32)[live]
+            self.facet_codes[name] = array("I", codes.tobytes())
+        self.deleted = bytearray(len(live_ids))
+        self._doc_of = {fp: i for i, fp in enumerate(self.fingerprints)}
+        self._facet_lists.clear()
+        self._lengths_np = self._deleted_np = None
+        self.dirty = True
+        logger.info("Search index: compacted %d tombstoned docs", int(deleted.sum()))
+
+    # ── Search ────────────────────────────────────────────────────
+    def postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(doc ids, term frequencies) for an analyzed term."""
+        row = self._term_row.get(term)
+        if row is None:
+            return self._doc_ids[:0], self._tfs[:0]
+        start, end = self._offsets[row], self._offsets[row + 1]
+        return self._doc_ids[start:end], self._tfs[start:end]
+
+    def facet_postings(self, name: str, value: str) -> np.ndarray:
+        """Sorted doc ids whose ``name`` facet equals ``value``."""
+        key = (name, value)
+        if key not in self._facet_lists:
+            code = self._facet_code_of[name].get(value)
+            if code is None:
+                ids = np.zeros(0, dtype=np.uint32)
+            else:
+                codes = np.frombuffer(self.facet_codes[name], dtype=np.uint32)
+                ids = np.flatnonzero(codes == code).astype(np.uint32)
+            self._facet_lists[key] = ids
+        return self._facet_lists[key]
+
+    def _candidates(self, **facets: FacetFilter) -> Optional[np.ndarray]:
+        """Intersection of the facet posting lists (None when nothing is filtered)."""
+        result = None
+        for name, wanted in facets.items():
+            if wanted is None:
+                continue
+            values = [wanted] if isinstance(wanted, str) else list(wanted)
+            ids = (
+                self.facet_postings(name, values[0]) if len(values) == 1
+                else np.unique(np.concatenate([self.facet_postings(name, v) for v in values]))
+            )
+            result = ids if result is None else np.intersect1d(result, ids, assume_unique=True)
+        return result
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 20,
+        zone: FacetFilter = None,
+        contract_type: FacetFilter = None,
+        source: FacetFilter = None,
+    ) -> List[Tuple[str, float]]:
+        """(fingerprint, BM25 score) pairs for ``query``, best first.
+
+        Any query term may match (OR semantics); postings matching more, and
+        rarer, terms rank higher. Facet filters accept one value or several.
+        """
+        self._merge_pending()
+        terms = Counter(analyze(query))
+        if not terms or not self._doc_of:
+            return []
+        if self._lengths_np is None:
+            self._lengths_np = np.frombuffer(self.lengths, dtype=np.uint32).astype(np.float32)
+            self._deleted_np = np.frombuffer(bytes(self.deleted), dtype=np.bool_)
+        lengths, deleted = self._lengths_np, self._deleted_np
+        n_docs = len(self._doc_of)
+        avgdl = float(lengths[~deleted].mean())
+        allowed = self._candidates(zone=zone, contract_type=contract_type, source=source)
+
+        hit_ids, hit_scores = [], []
+        for term, qtf in terms.items():
+            ids, tfs = self.postings(term)
+            live = ~deleted[ids]
+            if not live.all():      # Tombstoned docs don't count towards df
+                ids, tfs = ids[live], tfs[live]
+            if not len(ids):
+                continue
+            idf = math.log(1 + (n_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+            if allowed is not None:
+                ids, idx, _ = np.intersect1d(ids, allowed, assume_unique=True, return_indices=True)
+                tfs = tfs[idx]
+            tf = tfs.astype(np.float32)
+            norm = self.k1 * (1 - self.b + self.b * lengths[ids] / avgdl)
+            hit_ids.append(ids)
+            hit_scores.append(qtf * idf * tf * (self.k1 + 1) / (tf + norm))
+        if not hit_ids:
+            return []
+
+        docs, inverse = np.unique(np.concatenate(hit_ids), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(hit_scores))
+        if limit is not None and limit < len(docs):
+            top = np.argpartition(-scores, limit)[:limit]
+            docs, scores = docs[top], scores[top]
+        order = np.lexsort((docs, -scores))
+        return [(self.fingerprints[docs[i]], round(float(scores[i]), 4)) for i in order]
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._doc_of
+
+    def close(self) -> None:
+        if self.dirty:
+            self.save()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
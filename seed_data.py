@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 """
-Seed jobs.json with real job data collected from web search results.
+Seed the job store (and the JSON export) with real job data collected from web search results.
 Run this when direct HTTP scraping is blocked (e.g., sandbox/proxy environments).
 The main scrapers (main.py) are the primary method for your own machine.
 """
 
-import json
+import argparse
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from data_schema import JobPosting
+from data_schema import JobBatch, JobPosting, start_run
+import config
+import serialization
 from processing import DataCleaner
 from dashboard import DashboardGenerator
+from search import SearchIndex
+from storage import JobStore
 
 # ── Real job data extracted from web search results (Feb 2026) ────
 
@@ -629,7 +633,12 @@ RAW_JOBS = [
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Build the dashboard from the bundled seed data.")
+    parser.add_argument("--no-json", action="store_true", help="don't write the JSON export")
+    args = parser.parse_args()
+
     print("Seeding job data from web search results...")
+    start_run()
 
     jobs = []
     for raw in RAW_JOBS:
@@ -652,24 +661,23 @@ def main():
 
     # Run through cleaning pipeline
     cleaned = DataCleaner.clean_all(jobs)
+    with SearchIndex() as search_index:
+        search_index.add(cleaned)
+    batch = JobBatch.from_jobs(cleaned)
     print(f"  After cleaning: {len(cleaned)}")
 
-    # Save JSON
+    # Store (+ optional JSON export)
     output_dir = Path(__file__).resolve().parent
-    json_path = output_dir / "jobs.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(
-            [j.to_dict() for j in cleaned],
-            f,
-            ensure_ascii=False,
-            indent=2,
-            default=str,
-        )
-    print(f"  Saved → {json_path}")
+    with JobStore() as store:
+        store.upsert(cleaned)
+    print(f"  Stored → {config.JOB_STORE_PATH}")
+    if config.EXPORT_JSON and not args.no_json:
+        json_path = serialization.export_jobs(cleaned, output_dir)
+        print(f"  Saved → {json_path}")
 
     # Generate dashboard
     dashboard_path = output_dir / "dashboard.html"
-    gen = DashboardGenerator(cleaned)
+    gen = DashboardGenerator(batch)
     gen.generate(str(dashboard_path))
     print(f"  Dashboard → {dashboard_path}")
 
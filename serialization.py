@@ -0,0 +1,97 @@
+"""Bulk JobPosting encode/decode with optional orjson / msgpack backends."""
+
+import json
+from pathlib import Path
+from typing import Iterable, List, Union
+
+from data_schema import JobPosting
+from storage import ndjson
+import config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional backend
+    msgpack = None
+
+BACKENDS = ("orjson", "msgpack", "json")
+
+
+def default_backend() -> str:
+    return "orjson" if orjson is not None else "json"
+
+
+def _check(backend: str) -> str:
+    if backend == "auto":
+        return default_backend()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; choose from {BACKENDS}")
+    if backend == "orjson" and orjson is None or backend == "msgpack" and msgpack is None:
+        raise ImportError(f"{backend} is not installed")
+    return backend
+
+
+# ── Records ───────────────────────────────────────────────────────
+def encode_jobs(jobs: Iterable[JobPosting]) -> List[dict]:
+    to_dict = JobPosting.to_dict
+    return [to_dict(job) for job in jobs]
+
+
+def decode_jobs(records: Iterable[dict]) -> List[JobPosting]:
+    from_dict = JobPosting.from_dict
+    return [from_dict(record) for record in records]
+
+
+# ── Bytes ─────────────────────────────────────────────────────────
+def dumps(jobs: Iterable[JobPosting], backend: str = "auto", indent: bool = False) -> bytes:
+    """Serialize postings to a JSON array (or a msgpack array)."""
+    backend = _check(backend)
+    if backend == "orjson":
+        # orjson walks (slotted) dataclasses natively, no intermediate dicts
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(list(jobs), option=option)
+    if backend == "msgpack":
+        return msgpack.packb(encode_jobs(jobs), use_bin_type=True)
+    return json.dumps(
+        encode_jobs(jobs), ensure_ascii=False, indent=2 if indent else None, default=str,
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str], backend: str = "auto") -> List[JobPosting]:
+    backend = _check(backend)
+    if backend == "orjson":
+        return decode_jobs(orjson.loads(data))
+    if backend == "msgpack":
+        return decode_jobs(msgpack.unpackb(data, raw=False))
+    return decode_jobs(json.loads(data))
+
+
+# ── Files ─────────────────────────────────────────────────────────
+def dump_json(jobs: Iterable[JobPosting], path: Union[str, Path], indent: bool = True) -> None:
+    """Write postings as a JSON array (what jobs.json consumers expect), atomically."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(dumps(jobs, backend="orjson" if orjson else "json", indent=indent))
+    tmp.replace(path)
+
+
+def load_json(path: Union[str, Path]) -> List[JobPosting]:
+    return loads(Path(path).read_bytes(), backend="orjson" if orjson else "json")
+
+
+def export_jobs(jobs: Iterable[JobPosting], output_dir: Union[str, Path]) -> Path:
+    """Write a run's export in config.EXPORT_FORMAT and return its path."""
+    output_dir = Path(output_dir)
+    if config.EXPORT_FORMAT == "ndjson":
+        path = output_dir / ("jobs.ndjson.gz" if config.EXPORT_GZIP else "jobs.ndjson")
+        ndjson.write_jobs(jobs, path)
+    elif config.EXPORT_FORMAT == "json":
+        path = output_dir / "jobs.json"
+        dump_json(jobs, path, indent=False)
+    else:
+        raise ValueError(f"Unknown EXPORT_FORMAT {config.EXPORT_FORMAT!r}; use 'ndjson' or 'json'")
+    return path
@@ -0,0 +1,18 @@
+from .archive import ArchiveView, PostingArchive
+from .bloom import BloomFilter
+from .fingerprints import FingerprintStore, posting_fingerprint
+from .ndjson import NDJSONWriter, iter_jobs
+from .raw_pages import RawPageStore
+from .sqlite_store import JobStore
+
+__all__ = [
+    "ArchiveView",
+    "BloomFilter",
+    "FingerprintStore",
+    "JobStore",
+    "NDJSONWriter",
+    "PostingArchive",
+    "RawPageStore",
+    "iter_jobs",
+    "posting_fingerprint",
+]
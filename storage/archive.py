@@ -0,0 +1,320 @@
+"""Append-only posting archive read through mmap.
+
+Three files share a base path:
+
+``<base>.rec``  length-prefixed records: ``u32 length`` + compact JSON of ``to_dict()``
+``<base>.idx``  header + one fixed-width entry per record: ``u64 offset, u32 length, 16-byte fingerprint``
+``<base>.fpt``  open-addressing hash table on disk: ``16-byte fingerprint, u64 ordinal + 1`` per slot
+
+Ordinal lookup is one index read; fingerprint lookup is a short linear probe
+in the table. Records are only copied out of the mapping and decoded when
+asked for, and ``select`` prefilters on raw bytes in place, so scanning or
+slicing never touches unrelated records. Payloads are returned as ``bytes``,
+never as views into the mapping, so ``refresh()``/``close()`` cannot be
+blocked by a view a caller still holds.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+
+from data_schema import JobBatch, JobPosting
+from .fingerprints import posting_fingerprint
+import config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_IDX_HEADER = struct.Struct("<4sIQ")       # magic, version, record count
+_IDX_ENTRY = struct.Struct("<QI16s")       # offset, length, fingerprint
+_FPT_HEADER = struct.Struct("<4sIQQ")      # magic, version, capacity, used slots
+_FPT_SLOT = struct.Struct("<16sQ")         # fingerprint, ordinal + 1 (0 = empty)
+_LENGTH = struct.Struct("<I")
+_IDX_MAGIC, _FPT_MAGIC, _VERSION = b"UJIX", b"UJFT", 1
+_MIN_CAPACITY = 1024
+
+
+def _encode(job: JobPosting) -> bytes:
+    record = job.to_dict()
+    if orjson is not None:
+        return orjson.dumps(record)
+    # Same compact layout as orjson, so raw-byte prefilters work with either
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _decode(payload: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def field_needle(name: str, value) -> bytes:
+    """Raw bytes a record contains when ``name == value`` (for ``select(contains=...)``)."""
+    return json.dumps({name: value}, ensure_ascii=False, separators=(",", ":"))[1:-1].encode("utf-8")
+
+
+def _fp_bytes(fingerprint: str) -> bytes:
+    return bytes.fromhex(fingerprint)
+
+
+def _map(path: Path, writable: bool = False) -> Optional[mmap.mmap]:
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+    with open(path, "r+b" if writable else "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+
+class PostingArchive:
+    """Random-access archive of cleaned postings (see module docstring for the layout)."""
+
+    def __init__(self, base: Union[str, Path] = config.ARCHIVE_PATH):
+        self.base = Path(base)
+        self.rec_path = self.base.with_suffix(".rec")
+        self.idx_path = self.base.with_suffix(".idx")
+        self.fpt_path = self.base.with_suffix(".fpt")
+        self._rec = self._idx = self._fpt = None
+        self._count = 0
+        self._capacity = 0
+        self.refresh()
+
+    # ── Mapping lifecycle ─────────────────────────────────────────
+    def refresh(self) -> None:
+        """(Re)map the files, picking up records appended since the last call."""
+        self.close()
+        self._idx = _map(self.idx_path)
+        if self._idx is None:
+            self._count = 0
+            return
+        magic, version, self._count = _IDX_HEADER.unpack_from(self._idx, 0)
+        if magic != _IDX_MAGIC or version != _VERSION:
+            raise ValueError(f"{self.idx_path} is not a posting archive index")
+        self._rec = _map(self.rec_path)
+        self._fpt = _map(self.fpt_path)
+        if self._fpt is not None:
+            magic, _, self._capacity, _ = _FPT_HEADER.unpack_from(self._fpt, 0)
+            if magic != _FPT_MAGIC:
+                raise ValueError(f"{self.fpt_path} is not a fingerprint table")
+
+    def close(self) -> None:
+        for m in (self._rec, self._idx, self._fpt):
+            if m is not None:
+                m.close()
+        self._rec = self._idx = self._fpt = None
+
+    def __enter__(self) -> "PostingArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ── Random access ─────────────────────────────────────────────
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, i: int):
+        if not 0 <= i < self._count:
+            raise IndexError(f"archive ordinal {i} out of range ({self._count} records)")
+        return _IDX_ENTRY.unpack_from(self._idx, _IDX_HEADER.size + i * _IDX_ENTRY.size)
+
+    def raw(self, i: int) -> bytes:
+        """Record ``i``'s JSON payload, unparsed."""
+        offset, length, _ = self._entry(i)
+        start = offset + _LENGTH.size
+        return self._rec[start:start + length]
+
+    def fingerprint_at(self, i: int) -> str:
+        return self._entry(i)[2].hex()
+
+    def get(self, i: int) -> JobPosting:
+        return JobPosting.from_dict(_decode(self.raw(i)))
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[JobPosting, "ArchiveView"]:
+        if isinstance(key, slice):
+            return ArchiveView(self, range(self._count)[key])
+        return self.get(range(self._count)[key])
+
+    def __iter__(self) -> Iterator[JobPosting]:
+        return iter(ArchiveView(self, range(self._count)))
+
+    def ordinal(self, fingerprint: str) -> Optional[int]:
+        """Ordinal of the latest record with this fingerprint, or None."""
+        if self._fpt is None or self._capacity == 0:
+            return None
+        fp = _fp_bytes(fingerprint)
+        mask = self._capacity - 1
+        slot = int.from_bytes(fp[:8], "little") & mask
+        while True:
+            stored, ordinal = _FPT_SLOT.unpack_from(self._fpt, _FPT_HEADER.size + slot * _FPT_SLOT.size)
+            if ordinal == 0:
+                return None
+            if stored == fp:
+                return ordinal - 1 if ordinal - 1 < self._count else None
+            slot = (slot + 1) & mask
+
+    def find(self, fingerprint: str) -> Optional[JobPosting]:
+        i = self.ordinal(fingerprint)
+        return None if i is None else self.get(i)
+
+    def latest(self) -> "ArchiveView":
+        """One ordinal per fingerprint: its most recent record (reads only the index)."""
+        fps = self._idx[_IDX_HEADER.size:_IDX_HEADER.size + self._count * _IDX_ENTRY.size] if self._count else b""
+        newest = {}
+        for i, (_, _, fp) in enumerate(_IDX_ENTRY.iter_unpack(fps)):
+            newest[fp] = i
+        return ArchiveView(self, sorted(newest.values()))
+
+    def select(
+        self,
+        predicate: Optional[Callable[[JobPosting], bool]] = None,
+        contains: Iterable[bytes] = (),
+        within: Optional[Iterable[int]] = None,
+    ) -> "ArchiveView":
+        """Ordinals (of ``within``, default all) whose record satisfies ``predicate``.
+
+        ``contains`` are byte strings that must all occur in a matching raw
+        record (see ``field_needle``); records without them are skipped
+        before being parsed.
+        """
+        needles = list(contains)
+        rec = self._rec
+        hits = []
+        for i in range(self._count) if within is None else within:
+            offset, length, _ = self._entry(i)
+            start, end = offset + _LENGTH.size, offset + _LENGTH.size + length
+            # mmap.find searches the mapping in place
+            if any(rec.find(n, start, end) < 0 for n in needles):
+                continue
+            if predicate is None or predicate(self.get(i)):
+                hits.append(i)
+        return ArchiveView(self, hits)
+
+    # ── Appending ─────────────────────────────────────────────────
+    def append(self, jobs: Iterable[JobPosting]) -> int:
+        """Append postings; returns how many were written.
+
+        Records and index entries are written first and the index header's
+        count last, so a concurrent reader never sees a partial record.
+        """
+        self.close()
+        self.base.parent.mkdir(parents=True, exist_ok=True)
+        count = 0
+        if self.idx_path.exists() and self.idx_path.stat().st_size >= _IDX_HEADER.size:
+            with open(self.idx_path, "rb") as f:
+                _, _, count = _IDX_HEADER.unpack(f.read(_IDX_HEADER.size))
+        start_count = count
+
+        entries = []
+        with open(self.rec_path, "ab") as rec:
+            offset = rec.tell()
+            for job in jobs:
+                if not job.fingerprint:
+                    job.fingerprint = posting_fingerprint(job)
+                payload = _encode(job)
+                rec.write(_LENGTH.pack(len(payload)))
+                rec.write(payload)
+                entries.append(_IDX_ENTRY.pack(offset, len(payload), _fp_bytes(job.fingerprint)))
+                offset += _LENGTH.size + len(payload)
+            rec.flush()
+            os.fsync(rec.fileno())
+
+        mode = "r+b" if self.idx_path.exists() else "w+b"
+        with open(self.idx_path, mode) as idx:
+            if mode == "w+b":
+                idx.write(_IDX_HEADER.pack(_IDX_MAGIC, _VERSION, 0))
+            idx.seek(_IDX_HEADER.size + start_count * _IDX_ENTRY.size)
+            idx.write(b"".join(entries))
+            idx.flush()
+            os.fsync(idx.fileno())
+            idx.seek(0)
+            idx.write(_IDX_HEADER.pack(_IDX_MAGIC, _VERSION, start_count + len(entries)))
+
+        self._index_fingerprints(start_count, entries)
+        self.refresh()
+        logger.info("Archive: %d postings appended (%d total)", len(entries), len(self))
+        return len(entries)
+
+    def _index_fingerprints(self, start: int, entries: List[bytes]) -> None:
+        fpt = _map(self.fpt_path, writable=True)
+        capacity = used = 0
+        if fpt is not None:
+            _, _, capacity, used = _FPT_HEADER.unpack_from(fpt, 0)
+        if fpt is None or 2 * (used + len(entries)) > capacity:
+            if fpt is not None:
+                fpt.close()
+            self._rebuild_table(start + len(entries))
+            return
+
+        mask = capacity - 1
+        for n, entry in enumerate(entries):
+            fp = _IDX_ENTRY.unpack(entry)[2]
+            used += self._insert(fpt, mask, fp, start + n + 1)
+        _FPT_HEADER.pack_into(fpt, 0, _FPT_MAGIC, _VERSION, capacity, used)
+        fpt.flush()
+        fpt.close()
+
+    @staticmethod
+    def _insert(table, mask: int, fp: bytes, value: int) -> int:
+        """Set fp → value; returns 1 if a new slot was used."""
+        slot = int.from_bytes(fp[:8], "little") & mask
+        while True:
+            pos = _FPT_HEADER.size + slot * _FPT_SLOT.size
+            stored, ordinal = _FPT_SLOT.unpack_from(table, pos)
+            if ordinal == 0 or stored == fp:
+                _FPT_SLOT.pack_into(table, pos, fp, value)
+                return int(ordinal == 0)
+            slot = (slot + 1) & mask
+
+    def _rebuild_table(self, count: int) -> None:
+        """Rewrite the fingerprint table from the index at ≤ 50% load."""
+        capacity = _MIN_CAPACITY
+        while capacity < 4 * count:
+            capacity *= 2
+        table = bytearray(_FPT_HEADER.size + capacity * _FPT_SLOT.size)
+        used = 0
+        with open(self.idx_path, "rb") as f:
+            idx = f.read()
+        for i in range(count):
+            _, _, fp = _IDX_ENTRY.unpack_from(idx, _IDX_HEADER.size + i * _IDX_ENTRY.size)
+            used += self._insert(table, capacity - 1, fp, i + 1)
+        _FPT_HEADER.pack_into(table, 0, _FPT_MAGIC, _VERSION, capacity, used)
+        tmp = self.fpt_path.with_name(self.fpt_path.name + ".tmp")
+        tmp.write_bytes(table)
+        tmp.replace(self.fpt_path)
+        logger.info("Archive fingerprint table rebuilt: %d slots, %d fingerprints", capacity, used)
+
+
+class ArchiveView:
+    """A lazy selection of archive ordinals; records are decoded on iteration."""
+
+    def __init__(self, archive: PostingArchive, ordinals: Union[range, List[int]]):
+        self.archive = archive
+        self.ordinals = ordinals
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[JobPosting, "ArchiveView"]:
+        if isinstance(key, slice):
+            return ArchiveView(self.archive, self.ordinals[key])
+        return self.archive.get(self.ordinals[key])
+
+    def __iter__(self) -> Iterator[JobPosting]:
+        get = self.archive.get
+        for i in self.ordinals:
+            yield get(i)
+
+    def iter_raw(self) -> Iterator[bytes]:
+        raw = self.archive.raw
+        for i in self.ordinals:
+            yield raw(i)
+
+    def to_batch(self) -> JobBatch:
+        return JobBatch.from_jobs(self)
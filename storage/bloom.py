@@ -0,0 +1,66 @@
+"""Compact Bloom filter for fast negative membership checks."""
+
+import hashlib
+import math
+import struct
+from pathlib import Path
+from typing import Union
+
+_MAGIC = b"BLM1"
+_HEADER = struct.Struct("<4sQdQIQ")   # magic, capacity, error rate, bits, hashes, count
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over bytes keys (double hashing on a BLAKE2b digest)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: bytes):
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: bytes) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def saturated(self) -> bool:
+        return self.count > self.capacity
+
+    # ── Persistence ───────────────────────────────────────────────
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(
+                _MAGIC, self.capacity, self.error_rate, self.num_bits, self.num_hashes, self.count,
+            ))
+            f.write(self.bits)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BloomFilter":
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size or header[:4] != _MAGIC:
+                raise ValueError(f"{path} is not a Bloom filter file")
+            _, capacity, error_rate, num_bits, num_hashes, count = _HEADER.unpack(header)
+            bloom = cls.__new__(cls)
+            bloom.capacity, bloom.error_rate = capacity, error_rate
+            bloom.num_bits, bloom.num_hashes, bloom.count = num_bits, num_hashes, count
+            bloom.bits = bytearray(f.read())
+        if len(bloom.bits) != (num_bits + 7) // 8:
+            raise ValueError(f"{path} is truncated")
+        return bloom
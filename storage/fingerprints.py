@@ -0,0 +1,136 @@
+"""Persistent cross-run fingerprint store: Bloom filter front, exact SQLite index behind."""
+
+import hashlib
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from data_schema import JobPosting
+from .bloom import BloomFilter
+import config
+
+logger = logging.getLogger(__name__)
+
+_QUERY_CHUNK = 500   # stay well under SQLite's bound-parameter limit
+
+
+def posting_fingerprint(job: JobPosting) -> str:
+    """Stable identity of a posting: hash of normalized (title, company, location)."""
+    key = "\x1f".join((
+        job.title.lower().strip(),
+        job.company.lower().strip(),
+        job.location.lower().strip(),
+    ))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class FingerprintStore:
+    """Remembers every posting fingerprint ever seen, with first/last sighting.
+
+    Lookups hit the in-memory Bloom filter first; only possible hits go to the
+    on-disk index, so new postings never touch SQLite until they are inserted.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = config.SEEN_INDEX_PATH,
+        capacity: int = config.BLOOM_CAPACITY,
+        error_rate: float = config.BLOOM_ERROR_RATE,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.bloom_path = self.path.with_suffix(".bloom")
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            " fp BLOB PRIMARY KEY, first_seen TEXT NOT NULL, last_seen TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self.bloom = self._load_bloom(capacity, error_rate)
+
+    # ── Bloom filter lifecycle ────────────────────────────────────
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+    def _load_bloom(self, capacity: int, error_rate: float) -> BloomFilter:
+        stored = len(self)
+        if self.bloom_path.exists():
+            try:
+                bloom = BloomFilter.load(self.bloom_path)
+                if bloom.count == stored and not bloom.saturated:
+                    return bloom
+            except (OSError, ValueError) as exc:
+                logger.warning("Discarding Bloom filter %s: %s", self.bloom_path, exc)
+        return self._rebuild_bloom(max(capacity, 2 * stored), error_rate)
+
+    def _rebuild_bloom(self, capacity: int, error_rate: float) -> BloomFilter:
+        bloom = BloomFilter(capacity, error_rate)
+        for (fp,) in self.conn.execute("SELECT fp FROM fingerprints"):
+            bloom.add(fp)
+        logger.info("Bloom filter rebuilt: %d fingerprints, capacity %d", bloom.count, capacity)
+        return bloom
+
+    # ── Lookups ───────────────────────────────────────────────────
+    def lookup(self, fingerprints: Iterable[str]) -> Dict[str, tuple]:
+        """Return {fingerprint: (first_seen, last_seen)} for the ones already stored."""
+        candidates = [bytes.fromhex(fp) for fp in fingerprints]
+        candidates = [fp for fp in candidates if fp in self.bloom]
+        found: Dict[str, tuple] = {}
+        for i in range(0, len(candidates), _QUERY_CHUNK):
+            chunk = candidates[i:i + _QUERY_CHUNK]
+            rows = self.conn.execute(
+                "SELECT fp, first_seen, last_seen FROM fingerprints WHERE fp IN (%s)"
+                % ",".join("?" * len(chunk)),
+                chunk,
+            )
+            for fp, first_seen, last_seen in rows:
+                found[fp.hex()] = (first_seen, last_seen)
+        return found
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return bool(self.lookup([fingerprint]))
+
+    # ── Update ────────────────────────────────────────────────────
+    def observe(self, jobs: List[JobPosting], seen_at: Optional[str] = None) -> int:
+        """Stamp first_seen/last_seen on each job and record the sighting. Returns new-posting count."""
+        seen_at = seen_at or datetime.now().isoformat(timespec="seconds")
+        for job in jobs:
+            if not job.fingerprint:
+                job.fingerprint = posting_fingerprint(job)
+        known = self.lookup({job.fingerprint for job in jobs})
+
+        new_rows = []
+        for job in jobs:
+            if job.fingerprint in known:
+                job.first_seen = known[job.fingerprint][0]
+            else:
+                job.first_seen = seen_at
+                known[job.fingerprint] = (seen_at, seen_at)
+                new_rows.append((bytes.fromhex(job.fingerprint), seen_at, seen_at))
+            job.last_seen = seen_at
+
+        with self.conn:
+            self.conn.executemany("INSERT INTO fingerprints VALUES (?, ?, ?)", new_rows)
+            self.conn.executemany(
+                "UPDATE fingerprints SET last_seen = ? WHERE fp = ?",
+                [(seen_at, bytes.fromhex(fp)) for fp in known],
+            )
+        for fp, _, _ in new_rows:
+            self.bloom.add(fp)
+        if self.bloom.saturated:
+            self.bloom = self._rebuild_bloom(2 * self.bloom.capacity, self.bloom.error_rate)
+        self.bloom.save(self.bloom_path)
+
+        logger.info("Seen index: %d new, %d previously seen", len(new_rows), len(jobs) - len(new_rows))
+        return len(new_rows)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "FingerprintStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
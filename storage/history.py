@@ -0,0 +1,125 @@
+"""Columnar run history: one Parquet (or Arrow IPC) file per run under history/date=YYYY-MM-DD/.
+
+Requires pyarrow; without it ``write_partition`` raises ImportError and the
+pipeline skips this stage.
+"""
+
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Union
+
+from data_schema import JobBatch, JobPosting
+import config
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("pyarrow is required for history partitions (pip install pyarrow)")
+
+
+def _partitioning():
+    # Keep the date key a string: ISO dates compare correctly and need no parsing
+    return ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive")
+
+
+def write_partition(
+    jobs: Union[JobBatch, Iterable[JobPosting]],
+    run_at: Optional[datetime] = None,
+    root: Union[str, Path] = config.HISTORY_DIR,
+    fmt: str = config.HISTORY_FORMAT,
+) -> Path:
+    """Write one run's postings as ``<root>/date=YYYY-MM-DD/run-HHMMSS-ffffff.<ext>``.
+
+    Should two runs still share a name (same microsecond, or a clock set
+    back), the later one gets a ``-1``, ``-2``… suffix instead of replacing it.
+
+    zone/source/contract_type (every categorical field) are dictionary
+    encoded. The file is written under a temp name and renamed, so readers
+    never pick up a partial partition.
+    """
+    _require_pyarrow()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown history format {fmt!r}; choose from {tuple(FORMATS)}")
+    batch = jobs if isinstance(jobs, JobBatch) else JobBatch.from_jobs(jobs)
+    run_at = run_at or datetime.now()
+
+    directory = Path(root) / f"date={run_at.date().isoformat()}"
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = f"run-{run_at.strftime('%H%M%S-%f')}"
+    path = directory / f"{stem}{FORMATS[fmt]}"
+    n = 0
+    while path.exists():
+        n += 1
+        path = directory / f"{stem}-{n}{FORMATS[fmt]}"
+    tmp = directory / f".{path.name}.{os.getpid()}.tmp"
+
+    table = batch.to_arrow()
+    if fmt == "parquet":
+        pq.write_table(table, tmp, compression=config.HISTORY_COMPRESSION)
+    else:
+        feather.write_feather(table, tmp, compression=config.HISTORY_COMPRESSION)
+    tmp.replace(path)
+    logger.info("History: %d postings → %s", len(batch), path)
+    return path
+
+
+def dataset(root: Union[str, Path] = config.HISTORY_DIR, fmt: str = config.HISTORY_FORMAT):
+    """pyarrow Dataset over every partition, with ``date`` as a column."""
+    _require_pyarrow()
+    return ds.dataset(
+        str(root),
+        format="parquet" if fmt == "parquet" else "ipc",
+        partitioning=_partitioning(),
+        exclude_invalid_files=True,
+        ignore_prefixes=[".", "_"],
+    )
+
+
+def read_history(
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    zones: Optional[Sequence[str]] = None,
+    columns: Optional[List[str]] = None,
+    root: Union[str, Path] = config.HISTORY_DIR,
+    fmt: str = config.HISTORY_FORMAT,
+):
+    """Arrow table of postings from runs dated ``start``..``end`` (inclusive, ISO dates).
+
+    The date bounds prune whole partitions before any file is opened; the
+    zone filter is pushed into the scan (Parquet row-group statistics let it
+    skip data that cannot match).
+    """
+    if not Path(root).exists():
+        _require_pyarrow()
+        return pa.table({})
+    expr = None
+
+    def _and(cond):
+        return cond if expr is None else expr & cond
+
+    if start is not None:
+        expr = _and(ds.field("date") >= start)
+    if end is not None:
+        expr = _and(ds.field("date") <= end)
+    if zones:
+        expr = _and(ds.field("zone").isin(list(zones)))
+    return dataset(root, fmt).to_table(columns=columns, filter=expr)
+
+
+def read_history_df(*args, **kwargs):
+    """``read_history`` as a pandas DataFrame (dictionary columns become categoricals)."""
+    return read_history(*args, **kwargs).to_pandas()
@@ -0,0 +1,143 @@
+"""Streaming newline-delimited JSON export: atomic writes, optional gzip, rotation."""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from data_schema import JobPosting
+import config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _encode(record: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+
+
+def rotated_path(path: Path, n: int) -> Path:
+    """``jobs.ndjson.gz`` → ``jobs.1.ndjson.gz`` (keeps the suffixes readers key on)."""
+    suffixes = "".join(path.suffixes)
+    stem = path.name[: len(path.name) - len(suffixes)] if suffixes else path.name
+    return path.with_name(f"{stem}.{n}{suffixes}")
+
+
+class NDJSONWriter:
+    """Write postings one JSON object per line, replacing ``path`` atomically.
+
+    Records go to a temp file next to ``path``; ``close()`` fsyncs it and
+    renames it over the target, so readers see either the previous file or
+    the complete new one, never a partial write. With ``keep`` > 0 the
+    previous file is first hard-linked (or copied) to ``<stem>.1<suffixes>``
+    (older ones shift along), so ``path`` itself never goes missing.
+    If the block raises, the temp file is discarded and ``path`` is untouched.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compress: Optional[bool] = None,
+        keep: int = 0,
+    ):
+        self.path = Path(path)
+        self.compress = self.path.suffix == ".gz" if compress is None else compress
+        self.keep = keep
+        self.count = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        self._raw = open(self._tmp, "wb")
+        self._out: IO[bytes] = (
+            gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6, mtime=0)
+            if self.compress else self._raw
+        )
+
+    def write(self, job: JobPosting) -> None:
+        self._out.write(_encode(job.to_dict()))
+        self.count += 1
+
+    def write_many(self, jobs: Iterable[JobPosting]) -> int:
+        for job in jobs:
+            self.write(job)
+        return self.count
+
+    def _rotate(self) -> None:
+        if not self.path.exists():
+            return
+        for n in range(self.keep, 1, -1):
+            older = rotated_path(self.path, n - 1)
+            if older.exists():
+                os.replace(older, rotated_path(self.path, n))
+        # Link, not rename: the live file stays in place until the new one replaces it
+        staged = self._tmp.with_name(self._tmp.name + ".1")
+        try:
+            os.link(self.path, staged)
+        except OSError:
+            shutil.copy2(self.path, staged)
+        os.replace(staged, rotated_path(self.path, 1))
+
+    def close(self) -> None:
+        if self._raw.closed:
+            return
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+        if self.keep > 0:
+            self._rotate()
+        os.replace(self._tmp, self.path)
+        logger.info("NDJSON export: %d postings → %s", self.count, self.path)
+
+    def abort(self) -> None:
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.close()
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_jobs(
+    jobs: Iterable[JobPosting],
+    path: Union[str, Path],
+    compress: Optional[bool] = None,
+    keep: int = config.EXPORT_KEEP,
+) -> int:
+    """Stream postings to ``path`` atomically. Returns the number written."""
+    with NDJSONWriter(path, compress=compress, keep=keep) as writer:
+        return writer.write_many(jobs)
+
+
+def _open(path: Path) -> IO[bytes]:
+    with open(path, "rb") as f:
+        compressed = f.read(2) == _GZIP_MAGIC
+    return gzip.open(path, "rb") if compressed else open(path, "rb")
+
+
+def iter_jobs(path: Union[str, Path]) -> Iterator[JobPosting]:
+    """Yield postings from an NDJSON file (plain or gzip) one line at a time."""
+    loads = orjson.loads if orjson is not None else json.loads
+    from_dict = JobPosting.from_dict
+    with _open(Path(path)) as f:
+        for line in f:
+            if line.strip():
+                yield from_dict(loads(line))
@@ -0,0 +1,229 @@
+"""Content-addressed store of raw portal pages, compressed with per-portal dictionaries.
+
+Each fetched body is keyed by a hash of its normalized form (whitespace
+collapsed, nonces/CSRF tokens dropped), so a page that did not change
+between runs is stored once. Every fetch still gets a manifest row
+(portal, url, fetched_at, hash) for audits and re-parsing.
+
+Blobs are compressed with zstd when ``zstandard`` is installed, otherwise
+zlib. Once a portal has enough sample pages a shared dictionary is built
+for it (trained with zstd, or a preset zlib dictionary), since pages of one
+portal share most of their markup.
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import struct
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import config
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional speedup
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Markup that changes on every request without changing the content
+_VOLATILE = re.compile(
+    rb'\s(?:nonce|data-csrf|data-request-id)="[^"]*"'
+    rb'|<input[^>]+name="(?:csrf[^"]*|_token|__RequestVerificationToken)"[^>]*>'
+    rb'|<meta[^>]+name="csrf-token"[^>]*>',
+    re.IGNORECASE,
+)
+_WS = re.compile(rb"\s+")
+
+_HEADER = struct.Struct("<4sB8s")     # magic, codec, dictionary id (zeros = none)
+_MAGIC = b"UJRP"
+_ZSTD, _ZLIB = 1, 2
+_NO_DICT = bytes(8)
+_ZLIB_DICT_SIZE = 32 * 1024           # zlib only looks back 32 KB
+
+
+def normalize_body(body: bytes) -> bytes:
+    return _WS.sub(b" ", _VOLATILE.sub(b"", body)).strip()
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.blake2b(normalize_body(body), digest_size=16).hexdigest()
+
+
+class RawPageStore:
+    """Raw HTML by content hash, plus a manifest of every fetch."""
+
+    def __init__(
+        self,
+        root: Union[str, Path] = config.RAW_PAGES_DIR,
+        level: int = config.RAW_PAGES_LEVEL,
+        dict_samples: int = config.RAW_PAGES_DICT_SAMPLES,
+        dict_size: int = config.RAW_PAGES_DICT_SIZE,
+    ):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / "dicts").mkdir(exist_ok=True)
+        self.level = level
+        self.dict_samples = dict_samples
+        self.dict_size = dict_size
+        self.codec = _ZSTD if zstandard is not None else _ZLIB
+        self._dicts: Dict[bytes, bytes] = {}     # dictionary id → bytes
+        self._portal_dict: Dict[str, bytes] = {}  # portal → current dictionary id
+
+        self.conn = sqlite3.connect(str(self.root / "manifest.sqlite"))
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS fetches ("
+                " portal TEXT NOT NULL, url TEXT NOT NULL, fetched_at TEXT NOT NULL, hash TEXT NOT NULL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_fetches_time ON fetches (portal, fetched_at)")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                " hash TEXT PRIMARY KEY, portal TEXT NOT NULL, raw_size INTEGER, stored_size INTEGER)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS dictionaries (portal TEXT PRIMARY KEY, dict_id TEXT NOT NULL)"
+            )
+        for portal, dict_id in self.conn.execute("SELECT portal, dict_id FROM dictionaries"):
+            self._portal_dict[portal] = bytes.fromhex(dict_id)
+
+    # ── Dictionaries ──────────────────────────────────────────────
+    def _dict_path(self, dict_id: bytes) -> Path:
+        return self.root / "dicts" / f"{dict_id.hex()}.dict"
+
+    def _dictionary(self, dict_id: bytes) -> bytes:
+        if dict_id not in self._dicts:
+            self._dicts[dict_id] = self._dict_path(dict_id).read_bytes()
+        return self._dicts[dict_id]
+
+    def _train(self, portal: str) -> None:
+        """Build the portal's dictionary from its stored pages (newest first)."""
+        hashes = [h for (h,) in self.conn.execute(
+            "SELECT hash FROM blobs WHERE portal = ? ORDER BY rowid DESC LIMIT ?",
+            (portal, 4 * self.dict_samples),
+        )]
+        samples = [self.get(h) for h in hashes]
+        if self.codec == _ZSTD:
+            try:
+                data = zstandard.train_dictionary(self.dict_size, samples).as_bytes()
+            except zstandard.ZstdError as exc:
+                logger.warning("Raw pages: could not train a dictionary for %s: %s", portal, exc)
+                return
+        else:
+            # A preset zlib dictionary is just bytes the page is likely to repeat;
+            # the most recent page's markup is the best guess for the next one
+            data = samples[0][-_ZLIB_DICT_SIZE:]
+        dict_id = hashlib.blake2b(data, digest_size=8).digest()
+        self._dict_path(dict_id).write_bytes(data)
+        self._dicts[dict_id] = data
+        self._portal_dict[portal] = dict_id
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO dictionaries VALUES (?, ?)", (portal, dict_id.hex()))
+        logger.info("Raw pages: %d-byte dictionary for %s from %d pages", len(data), portal, len(samples))
+
+    # ── Blobs ─────────────────────────────────────────────────────
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    def _compress(self, body: bytes, dict_id: bytes) -> bytes:
+        zdict = self._dictionary(dict_id) if dict_id != _NO_DICT else None
+        if self.codec == _ZSTD:
+            params = {"level": self.level}
+            if zdict is not None:
+                params["dict_data"] = zstandard.ZstdCompressionDict(zdict)
+            data = zstandard.ZstdCompressor(**params).compress(body)
+        else:
+            c = zlib.compressobj(min(self.level, 9), zdict=zdict) if zdict else zlib.compressobj(min(self.level, 9))
+            data = c.compress(body) + c.flush()
+        return _HEADER.pack(_MAGIC, self.codec, dict_id) + data
+
+    def _decompress(self, blob: bytes) -> bytes:
+        magic, codec, dict_id = _HEADER.unpack_from(blob)
+        if magic != _MAGIC:
+            raise ValueError("not a raw page blob")
+        data = memoryview(blob)[_HEADER.size:]
+        zdict = self._dictionary(dict_id) if dict_id != _NO_DICT else None
+        if codec == _ZSTD:
+            if zstandard is None:
+                raise ImportError("zstandard is required to read this blob")
+            params = {"dict_data": zstandard.ZstdCompressionDict(zdict)} if zdict is not None else {}
+            return zstandard.ZstdDecompressor(**params).decompressobj().decompress(data)
+        d = zlib.decompressobj(zdict=zdict) if zdict is not None else zlib.decompressobj()
+        return d.decompress(data) + d.flush()
+
+    def put(self, portal: str, url: str, body: bytes, fetched_at: Optional[str] = None) -> str:
+        """Record a fetch; the body is only written if its normalized content is new."""
+        digest = content_hash(body)
+        fetched_at = fetched_at or datetime.now().isoformat(timespec="seconds")
+        new = self.conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone() is None
+        if new:
+            blob = self._compress(body, self._portal_dict.get(portal, _NO_DICT))
+            path = self._blob_path(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(blob)
+            tmp.replace(path)
+        with self.conn:
+            if new:
+                self.conn.execute(
+                    "INSERT INTO blobs VALUES (?, ?, ?, ?)", (digest, portal, len(body), len(blob)),
+                )
+            self.conn.execute("INSERT INTO fetches VALUES (?, ?, ?, ?)", (portal, url, fetched_at, digest))
+
+        if new and portal not in self._portal_dict:
+            stored = self.conn.execute("SELECT COUNT(*) FROM blobs WHERE portal = ?", (portal,)).fetchone()[0]
+            if stored >= self.dict_samples:
+                self._train(portal)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        return self._decompress(self._blob_path(digest).read_bytes())
+
+    # ── Reading back ──────────────────────────────────────────────
+    def iter_pages(
+        self,
+        portal: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> Iterator[Tuple[str, str, bytes]]:
+        """(url, fetched_at, body) for each distinct page fetched in the range, oldest first.
+
+        A page fetched on many runs is yielded once, with its first fetch.
+        """
+        clauses, params = [], []
+        if portal is not None:
+            clauses.append("portal = ?")
+            params.append(portal)
+        if since is not None:
+            clauses.append("fetched_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("fetched_at < ?")
+            params.append(until)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT url, MIN(fetched_at), hash FROM fetches{where} GROUP BY hash ORDER BY MIN(fetched_at)",
+            params,
+        ).fetchall()
+        for url, fetched_at, digest in rows:
+            yield url, fetched_at, self.get(digest)
+
+    def stats(self) -> Dict[str, int]:
+        fetches = self.conn.execute("SELECT COUNT(*) FROM fetches").fetchone()[0]
+        blobs, raw, stored = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0) FROM blobs"
+        ).fetchone()
+        return {"fetches": fetches, "blobs": blobs, "raw_bytes": raw, "stored_bytes": stored}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "RawPageStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,210 @@
+"""Persistent job store: every cleaned posting in an indexed SQLite table."""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from data_schema import JobBatch, JobPosting
+from .fingerprints import posting_fingerprint
+import config
+
+logger = logging.getLogger(__name__)
+
+FIELDS = JobPosting.FIELD_NAMES
+_SEQUENCE_FIELDS = ("secondary_zones", "benefits")      # Stored as JSON arrays
+_TYPES = {"salary_min": "REAL", "salary_max": "REAL", "relevance_score": "REAL", "is_temporal": "INTEGER"}
+
+# Columns the query API filters, groups and sorts on
+INDEXED = ("zone", "source", "contract_type", "date_posted", "first_seen")
+FACETS = ("zone", "source", "contract_type", "salary_currency")
+ORDERABLE = INDEXED + ("last_seen", "relevance_score", "salary_max", "title", "company")
+
+
+class JobStore:
+    """SQLite table of postings keyed by fingerprint.
+
+    Runs upsert into it in one transaction, so history accumulates instead of
+    being overwritten; ``first_seen`` keeps the earliest value ever stored.
+    The database runs in WAL mode so readers (dashboard, CLI) never block a
+    writing scrape.
+    """
+
+    def __init__(self, path: Union[str, Path] = config.JOB_STORE_PATH, readonly: bool = False):
+        self.path = Path(path)
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.path))
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self._create()
+
+    def _create(self) -> None:
+        columns = ",\n".join(
+            f"  {name} {_TYPES.get(name, 'TEXT')}" + (" PRIMARY KEY" if name == "fingerprint" else "")
+            for name in FIELDS
+        )
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS jobs (\n{columns}\n)")
+            # fingerprint is indexed as the primary key
+            for name in INDEXED:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_jobs_{name} ON jobs ({name})")
+
+    # ── Rows ──────────────────────────────────────────────────────
+    @staticmethod
+    def _row(job: JobPosting) -> tuple:
+        if not job.fingerprint:
+            job.fingerprint = posting_fingerprint(job)
+        return tuple(
+            json.dumps(list(getattr(job, name)), ensure_ascii=False) if name in _SEQUENCE_FIELDS
+            else getattr(job, name)
+            for name in FIELDS
+        )
+
+    @staticmethod
+    def _job(row: tuple) -> JobPosting:
+        data = dict(zip(FIELDS, row))
+        for name in _SEQUENCE_FIELDS:
+            data[name] = json.loads(data[name]) if data[name] else ()
+        data["is_temporal"] = bool(data["is_temporal"])
+        return JobPosting.from_dict(data)
+
+    # ── Writes ────────────────────────────────────────────────────
+    def upsert(self, jobs: Iterable[JobPosting]) -> int:
+        """Insert or update postings in a single transaction. Returns the number written."""
+        rows = [self._row(job) for job in jobs]
+        updates = ", ".join(
+            f"{name} = excluded.{name}" for name in FIELDS
+            if name not in ("fingerprint", "first_seen")
+        )
+        sql = (
+            f"INSERT INTO jobs ({', '.join(FIELDS)}) VALUES ({', '.join('?' * len(FIELDS))}) "
+            f"ON CONFLICT(fingerprint) DO UPDATE SET {updates}, "
+            "first_seen = COALESCE(MIN(jobs.first_seen, excluded.first_seen), "
+            "jobs.first_seen, excluded.first_seen)"
+        )
+        with self.conn:
+            self.conn.executemany(sql, rows)
+        logger.info("Job store: %d postings upserted", len(rows))
+        return len(rows)
+
+    # ── Queries ───────────────────────────────────────────────────
+    @staticmethod
+    def _where(
+        zone: Optional[str] = None,
+        source: Optional[str] = None,
+        contract_type: Optional[str] = None,
+        posted_since: Optional[str] = None,
+        seen_since: Optional[str] = None,
+        last_seen: Optional[str] = None,
+        min_relevance: Optional[float] = None,
+        search: Optional[str] = None,
+    ) -> Tuple[str, list]:
+        clauses, params = [], []
+        for column, value in (("zone", zone), ("source", source), ("contract_type", contract_type)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if posted_since is not None:
+            clauses.append("date_posted >= ?")
+            params.append(posted_since)
+        if seen_since is not None:
+            clauses.append("first_seen >= ?")
+            params.append(seen_since)
+        if last_seen is not None:
+            clauses.append("last_seen = ?")
+            params.append(last_seen)
+        if min_relevance is not None:
+            clauses.append("relevance_score >= ?")
+            params.append(min_relevance)
+        if search:
+            clauses.append("(title LIKE ? OR company LIKE ?)")
+            params += [f"%{search}%"] * 2
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def iter_query(
+        self,
+        order_by: str = "first_seen",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        **filters,
+    ) -> Iterator[JobPosting]:
+        """Postings matching ``filters`` (see ``_where``), streamed from the cursor."""
+        if order_by not in ORDERABLE:
+            raise ValueError(f"Cannot order by {order_by!r}; choose from {ORDERABLE}")
+        where, params = self._where(**filters)
+        sql = f"SELECT {', '.join(FIELDS)} FROM jobs{where} ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        for row in self.conn.execute(sql, params):
+            yield self._job(row)
+
+    def query(self, **kwargs) -> List[JobPosting]:
+        return list(self.iter_query(**kwargs))
+
+    def batch(self, **kwargs) -> JobBatch:
+        return JobBatch.from_jobs(self.iter_query(**kwargs))
+
+    def get_many(self, fingerprints: Sequence[str]) -> List[JobPosting]:
+        """Postings by fingerprint, in the given order (unknown ones are skipped)."""
+        found: Dict[str, JobPosting] = {}
+        for start in range(0, len(fingerprints), 500):
+            chunk = list(fingerprints[start:start + 500])
+            sql = f"SELECT {', '.join(FIELDS)} FROM jobs WHERE fingerprint IN ({', '.join('?' * len(chunk))})"
+            for row in self.conn.execute(sql, chunk):
+                job = self._job(row)
+                found[job.fingerprint] = job
+        return [found[fp] for fp in fingerprints if fp in found]
+
+    def fingerprints(self, **filters) -> List[str]:
+        """Fingerprints of the postings matching ``filters``."""
+        where, params = self._where(**filters)
+        return [fp for (fp,) in self.conn.execute(f"SELECT fingerprint FROM jobs{where}", params)]
+
+    def salary_column(self, group_by: str, **filters) -> Tuple[np.ndarray, np.ndarray]:
+        """(group values, salary_max) for matching postings with a parsed salary."""
+        if group_by not in FACETS:
+            raise ValueError(f"Cannot group by {group_by!r}; choose from {FACETS}")
+        where, params = self._where(**filters)
+        where = f"{where} AND salary_max IS NOT NULL" if where else " WHERE salary_max IS NOT NULL"
+        rows = self.conn.execute(f"SELECT COALESCE({group_by}, ''), salary_max FROM jobs{where}", params).fetchall()
+        groups = np.array([g for g, _ in rows], dtype=object)
+        return groups, np.array([v for _, v in rows], dtype=np.float64)
+
+    def count(self, **filters) -> int:
+        where, params = self._where(**filters)
+        return self.conn.execute(f"SELECT COUNT(*) FROM jobs{where}", params).fetchone()[0]
+
+    def facet_counts(self, column: str, **filters) -> Dict[str, int]:
+        """{value: count} for a categorical column, most common first."""
+        if column not in FACETS:
+            raise ValueError(f"No facet {column!r}; choose from {FACETS}")
+        where, params = self._where(**filters)
+        rows = self.conn.execute(
+            f"SELECT {column}, COUNT(*) AS n FROM jobs{where} GROUP BY {column} ORDER BY n DESC",
+            params,
+        )
+        return dict(rows.fetchall())
+
+    def last_run(self) -> Optional[str]:
+        """``last_seen`` of the latest run that stored postings (None if no run stamped any)."""
+        return self.conn.execute("SELECT MAX(last_seen) FROM jobs").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "JobStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Same as the top-level scripts: modules import each other from the project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
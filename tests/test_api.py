@@ -0,0 +1,91 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer
+
+from api.server import APIHandler, JobAPI
+from data_schema import JobPosting
+from storage import JobStore
+
+
+def _store(path, zone="Turbo", fingerprint="a" * 32):
+    with JobStore(path) as store:
+        store.upsert([JobPosting(title="Auxiliar", company="Acme", location=zone, zone=zone, fingerprint=fingerprint)])
+
+
+def test_response_built_before_a_refresh_is_not_cached(tmp_path, monkeypatch):
+    db = tmp_path / "jobs.sqlite"
+    _store(db)
+    api = JobAPI(db, tmp_path / "search")
+    real = JobAPI.facets
+
+    def facets_while_data_changes(self, params):
+        payload = real(self, params)
+        _store(db, zone="Carepa", fingerprint="b" * 32)   # A scrape lands mid-request …
+        self.refresh()                                     # … and another request notices
+        return payload
+
+    monkeypatch.setitem(JobAPI.ROUTES, "/facets", facets_while_data_changes)
+    status, stale = api.respond("/facets", "field=zone")
+    assert status == HTTPStatus.OK
+    assert json.loads(stale.body) == {"zone": {"Turbo": 1}}
+
+    monkeypatch.setitem(JobAPI.ROUTES, "/facets", real)
+    status, fresh = api.respond("/facets", "field=zone")
+    assert json.loads(fresh.body) == {"zone": {"Turbo": 1, "Carepa": 1}}
+
+
+def test_missing_store_is_a_json_503(tmp_path):
+    api = JobAPI(tmp_path / "missing.sqlite", tmp_path / "search")
+    status, entry = api.respond("/jobs", "")
+    assert status == HTTPStatus.SERVICE_UNAVAILABLE
+    assert "error" in json.loads(entry.body)
+
+
+def test_unexpected_error_is_a_json_500_over_http(tmp_path, monkeypatch):
+    def broken(self, params):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(JobAPI.ROUTES, "/facets", broken)
+    handler = type("Handler", (APIHandler,), {"api": JobAPI(tmp_path / "jobs.sqlite", tmp_path / "search")})
+    with ThreadingHTTPServer(("127.0.0.1", 0), handler) as httpd:
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{httpd.server_port}/facets", timeout=5)
+            raise AssertionError("expected an HTTP error")
+        except urllib.error.HTTPError as exc:
+            assert exc.code == HTTPStatus.INTERNAL_SERVER_ERROR
+            assert json.loads(exc.read()) == {"error": "internal error"}
+        finally:
+            httpd.shutdown()
+
+
+def test_gzip_and_identity_bodies_have_distinct_etags(tmp_path):
+    db = tmp_path / "jobs.sqlite"
+    for k in range(40):
+        _store(db, zone=f"Vereda {k:02d}", fingerprint=f"{k:032x}")
+    handler = type("Handler", (APIHandler,), {"api": JobAPI(db, tmp_path / "search")})
+    with ThreadingHTTPServer(("127.0.0.1", 0), handler) as httpd:
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{httpd.server_port}/jobs"
+
+        def get(**headers):
+            try:
+                return urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=5)
+            except urllib.error.HTTPError as exc:
+                return exc
+
+        try:
+            plain, gzipped = get(), get(**{"Accept-Encoding": "gzip"})
+            assert gzipped.headers["Content-Encoding"] == "gzip"
+            assert plain.headers["Vary"] == gzipped.headers["Vary"] == "Accept-Encoding"
+            assert plain.headers["ETag"] != gzipped.headers["ETag"]
+
+            assert get(**{"If-None-Match": plain.headers["ETag"]}).status == HTTPStatus.NOT_MODIFIED
+            assert get(**{"If-None-Match": gzipped.headers["ETag"], "Accept-Encoding": "gzip"}).status \
+                == HTTPStatus.NOT_MODIFIED
+            assert get(**{"If-None-Match": gzipped.headers["ETag"]}).status == HTTPStatus.OK
+        finally:
+            httpd.shutdown()
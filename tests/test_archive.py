@@ -0,0 +1,28 @@
+from data_schema import JobPosting
+from storage.archive import PostingArchive
+
+
+def _archive(tmp_path, n=5):
+    archive = PostingArchive(tmp_path / "postings")
+    archive.append([
+        JobPosting(title=f"Auxiliar {i}", company="Acme", location="Turbo", zone="Turbo")
+        for i in range(n)
+    ])
+    archive.refresh()
+    return archive
+
+
+def test_close_and_refresh_with_raw_payloads_alive(tmp_path):
+    archive = _archive(tmp_path)
+    payloads = list(archive[0:3].iter_raw()) + [archive.raw(4)]
+    archive.refresh()
+    assert archive[1].title == "Auxiliar 1"
+    archive.close()
+    assert b'"Auxiliar 0"' in payloads[0]
+    assert b'"Auxiliar 4"' in payloads[3]
+
+
+def test_context_manager_exit_with_raw_payloads_alive(tmp_path):
+    with _archive(tmp_path) as archive:
+        payloads = list(archive.latest().iter_raw())
+    assert len(payloads) == 5
@@ -0,0 +1,34 @@
+import sqlite3
+
+from scrapers.base_scraper import BaseScraper
+
+
+class _Scraper(BaseScraper):
+    def get_urls(self):
+        return []
+
+    def parse_listings(self, soup, url):
+        return []
+
+
+class _Response:
+    content = b"<html><body><p>oferta</p></body></html>"
+
+    def raise_for_status(self):
+        pass
+
+
+class _FailingStore:
+    def put(self, portal, url, body):
+        raise sqlite3.OperationalError("database is locked")
+
+
+def test_failed_archive_write_still_returns_the_page(monkeypatch, caplog):
+    scraper = _Scraper("Test", raw_store=_FailingStore())
+    calls = []
+    monkeypatch.setattr(scraper.session, "get", lambda url, **kw: calls.append(url) or _Response())
+
+    soup = scraper.fetch("https://example.com/empleos")
+    assert soup.p.text == "oferta"
+    assert calls == ["https://example.com/empleos"]      # Not retried
+    assert "could not archive" in caplog.text
@@ -0,0 +1,40 @@
+import pickle
+import shutil
+from pathlib import Path
+
+import compiled_config
+import config
+
+
+def _region(tmp_path):
+    region = tmp_path / "region.py"
+    region.write_text('GENERIC_ZONE = "Urabá (General)"\n', encoding="utf-8")
+    return region
+
+
+def test_cache_key_covers_config_py_fallback(tmp_path, monkeypatch):
+    base = tmp_path / "config.py"
+    shutil.copy(config.__file__, base)
+    monkeypatch.setattr(config, "__file__", str(base))
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path / "cache")
+    region = _region(tmp_path)
+
+    first = compiled_config.load(region)
+    assert compiled_config.load(region).digest == first.digest
+
+    base.write_text(base.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    assert compiled_config.load(region).digest != first.digest
+
+
+def test_unimportable_cache_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_DIR", tmp_path)
+    region = _region(tmp_path)
+    digest = compiled_config.load(region, use_cache=False).digest
+    cache_path = Path(tmp_path) / f"compiled-config-{digest}.pickle"
+    # A pickle referring to a class that no longer exists
+    cache_path.write_bytes(b"cno_such_module\nCompiledConfig\n)R.")
+
+    compiled = compiled_config.load(region)
+    assert compiled.digest == digest
+    with open(cache_path, "rb") as f:
+        assert isinstance(pickle.load(f), compiled_config.CompiledConfig)
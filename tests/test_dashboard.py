@@ -0,0 +1,34 @@
+from dashboard import DashboardGenerator
+from data_schema import JobPosting
+
+PAYLOAD = "</script><script>alert(1)</script>"
+
+
+def _html(tmp_path, **fields):
+    job = {"title": "Auxiliar", "company": "Acme", "location": "Turbo", "zone": "Turbo", **fields}
+    path = tmp_path / "dashboard.html"
+    DashboardGenerator([JobPosting(**job)], cache=False).generate(str(path))
+    return path.read_text(encoding="utf-8")
+
+
+def test_company_name_cannot_close_the_charts_script(tmp_path):
+    html = _html(tmp_path, company=PAYLOAD)
+    assert "<script>alert(1)" not in html
+    assert "\\u003c/script>\\u003cscript>alert(1)" in html
+
+
+def test_facet_value_cannot_close_the_facets_script(tmp_path):
+    html = _html(tmp_path, contract_type=PAYLOAD, source=PAYLOAD)
+    assert "<script>alert(1)" not in html
+
+
+def test_charts_do_not_depend_on_row_order(tmp_path):
+    jobs = [
+        JobPosting(title=f"Oferta {i}", company=f"Empresa {i % 7}", location="", zone=f"Zona {i % 5}",
+                   source=f"portal{i % 3}", salary_max=1_000_000 + (i * 7919) % 3_000_000 + 0.1 * i)
+        for i in range(60)
+    ]
+    forward = DashboardGenerator(jobs, cache=False)
+    backward = DashboardGenerator(jobs[::-1], cache=False)
+    assert forward._chart_inputs() == backward._chart_inputs()
+    assert forward._charts_json() == backward._charts_json()
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+import config
+from data_schema import JobPosting
+from processing import dedup
+from processing.dedup import NearDuplicateDetector
+
+DESCRIPTION = "Se requiere auxiliar de bodega con experiencia en inventarios y despachos, turnos rotativos."
+
+
+def _job(zone, title="Auxiliar de bodega"):
+    return JobPosting(title=title, company="Banacol", location=zone, zone=zone, description=DESCRIPTION)
+
+
+@pytest.mark.parametrize("order", [(0, 1, 2), (1, 0, 2), (1, 2, 0), (2, 1, 0)])
+def test_generic_zone_does_not_chain_two_municipalities(order):
+    postings = [_job("Apartadó"), _job(config.GENERIC_ZONE), _job("Turbo")]
+    jobs = [postings[i] for i in order]
+    clusters = NearDuplicateDetector().clusters(jobs)
+    for cluster in clusters:
+        zones = {jobs[i].zone for i in cluster} - {config.GENERIC_ZONE}
+        assert len(zones) <= 1
+    # The generic posting still merges with one of them
+    assert sorted(len(c) for c in clusters) == [1, 2]
+
+
+def test_same_zone_duplicates_merge():
+    jobs = [_job("Turbo"), _job("Turbo"), _job(config.GENERIC_ZONE)]
+    assert [sorted(c) for c in NearDuplicateDetector().clusters(jobs)] == [[0, 1, 2]]
+
+
+def test_signature_chunks_are_bounded_by_shingle_count(monkeypatch):
+    jobs = [_job("Turbo", title=f"Cargo {i} " * (i % 7 + 1)) for i in range(40)]
+    whole = NearDuplicateDetector().signatures(jobs)
+    sizes = []
+    real = NearDuplicateDetector._hash_chunk
+
+    def spy(self, parts, out):
+        sizes.append(sum(len(p) for p in parts))
+        real(self, parts, out)
+
+    monkeypatch.setattr(dedup, "_SIGNATURE_CHUNK_SHINGLES", 300)
+    monkeypatch.setattr(NearDuplicateDetector, "_hash_chunk", spy)
+    chunked = NearDuplicateDetector().signatures(jobs)
+    assert np.array_equal(whole, chunked)
+    assert len(sizes) > 1
+    assert all(size <= 300 for size in sizes)
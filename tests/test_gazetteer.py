@@ -0,0 +1,6 @@
+from processing.gazetteer import drop_truncated_aliases
+
+
+def test_only_names_cut_mid_word_are_dropped():
+    names = ["Apartadó", "apartad", "San Juan", "San Juan de Urabá", "san juan de ura", "Necoclí", "Necoclí"]
+    assert drop_truncated_aliases(names) == ["apartado", "san juan", "san juan de uraba", "necocli"]
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+import pytest
+
+from data_schema import JobPosting
+from storage import history
+
+pytest.importorskip("pyarrow")
+
+
+def test_runs_in_the_same_second_keep_separate_partitions(tmp_path):
+    jobs = [JobPosting(title="Auxiliar", company="Acme", location="Turbo", zone="Turbo")]
+    paths = {
+        history.write_partition(jobs, run_at=at, root=tmp_path, fmt="arrow")
+        for at in (datetime(2026, 1, 2, 8, 0, 0, 100), datetime(2026, 1, 2, 8, 0, 0, 900),
+                   datetime(2026, 1, 2, 8, 0, 0, 900))
+    }
+    assert len(paths) == 3
+    assert history.read_history(root=tmp_path, fmt="arrow").num_rows == 3
@@ -0,0 +1,36 @@
+import config
+import main
+from data_schema import JobPosting
+from storage import JobStore
+
+
+def _run(store, seen_at, *titles):
+    store.upsert([
+        JobPosting(title=title, company="Acme", location="Turbo", zone="Turbo",
+                   fingerprint=title[0] * 32, first_seen=seen_at, last_seen=seen_at)
+        for title in titles
+    ])
+
+
+def _regenerate(tmp_path, monkeypatch, **kwargs):
+    built = []
+    monkeypatch.setattr(config, "JOB_STORE_PATH", tmp_path / "jobs.sqlite")
+    monkeypatch.setattr(main, "write_dashboard", lambda gen: built.append(gen) or tmp_path / "dashboard.html")
+    main.regenerate_dashboard(**kwargs)
+    return sorted(built[0].batch.column("title"))
+
+
+def test_dashboard_only_uses_the_latest_run(tmp_path, monkeypatch):
+    with JobStore(tmp_path / "jobs.sqlite") as store:
+        _run(store, "2026-01-01T08:00:00", "auxiliar", "bodeguero")
+        _run(store, "2026-01-02T08:00:00", "auxiliar", "conductor")
+
+    assert _regenerate(tmp_path, monkeypatch) == ["auxiliar", "conductor"]
+    assert _regenerate(tmp_path, monkeypatch, all_postings=True) == ["auxiliar", "bodeguero", "conductor"]
+
+
+def test_unstamped_store_is_used_whole(tmp_path, monkeypatch):
+    with JobStore(tmp_path / "jobs.sqlite") as store:
+        _run(store, None, "auxiliar", "bodeguero")
+
+    assert _regenerate(tmp_path, monkeypatch) == ["auxiliar", "bodeguero"]
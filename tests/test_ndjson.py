@@ -0,0 +1,39 @@
+import os
+
+from data_schema import JobPosting
+from storage import ndjson
+from storage.ndjson import iter_jobs, rotated_path, write_jobs
+
+
+def _jobs(title):
+    return [JobPosting(title=title, company="Acme", location="Turbo")]
+
+
+def test_rotation_keeps_previous_exports(tmp_path):
+    path = tmp_path / "jobs.ndjson"
+    for title in ("first", "second", "third"):
+        write_jobs(_jobs(title), path, keep=2)
+    assert [j.title for j in iter_jobs(path)] == ["third"]
+    assert [j.title for j in iter_jobs(rotated_path(path, 1))] == ["second"]
+    assert [j.title for j in iter_jobs(rotated_path(path, 2))] == ["first"]
+
+
+def test_live_file_never_missing_during_rotation(tmp_path, monkeypatch):
+    path = tmp_path / "jobs.ndjson"
+    write_jobs(_jobs("first"), path, keep=1)
+
+    real_replace = os.replace
+    seen = []
+
+    def checked_replace(src, dst):
+        seen.append(path.exists())
+        real_replace(src, dst)
+        seen.append(path.exists())
+
+    monkeypatch.setattr(ndjson.os, "replace", checked_replace)
+    write_jobs(_jobs("second"), path, keep=1)
+
+    assert seen and all(seen)
+    assert [j.title for j in iter_jobs(path)] == ["second"]
+    assert [j.title for j in iter_jobs(rotated_path(path, 1))] == ["first"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["jobs.1.ndjson", "jobs.ndjson"]
@@ -0,0 +1,23 @@
+import pytest
+
+import config
+from processing.salary import SalaryParser
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("$8.000 por hora", 8_000 * config.MONTHLY_HOURS),
+    ("valor hora: $8.000", 8_000 * config.MONTHLY_HOURS),
+    ("$60.000 diarios", 60_000 * config.MONTHLY_DAYS),
+    ("jornal de $60.000", 60_000 * config.MONTHLY_DAYS),
+])
+def test_rate_next_to_period_phrase_is_scaled(raw, expected):
+    assert SalaryParser.parse(raw) == (expected, expected)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Trabajo de 8 horas diarias $1.500.000", (1_500_000, 1_500_000)),
+    ("2 SMMLV, turnos de 8 horas diarias", (2 * config.SMMLV, 2 * config.SMMLV)),
+    ("$60.000 diarios o $1.800.000 mensuales", (1_800_000, 1_800_000)),
+])
+def test_monthly_amounts_are_not_scaled_by_period(raw, expected):
+    assert SalaryParser.parse(raw) == expected
@@ -0,0 +1,50 @@
+from data_schema import JobPosting
+from search import SearchIndex
+
+
+def _job(zone):
+    return JobPosting(
+        title="Auxiliar de bodega", company="Banacol", location="Carepa, Antioquia",
+        zone=zone, contract_type="temporal", source="computrabajo",
+        fingerprint="f" * 32, raw_hash="r1",
+    )
+
+
+def test_facets_follow_re_enriched_postings(tmp_path):
+    with SearchIndex(tmp_path) as index:
+        index.add([_job("Urabá (General)")])
+
+    with SearchIndex(tmp_path) as index:
+        # Same scraped text (raw_hash), zone re-derived by newer rules
+        assert index.add([_job("Carepa")]) == 0
+        assert [fp for fp, _ in index.search("auxiliar", zone="Carepa")] == ["f" * 32]
+        assert index.search("auxiliar", zone="Urabá (General)") == []
+
+    reloaded = SearchIndex(tmp_path)
+    assert [fp for fp, _ in reloaded.search("bodega", zone="Carepa")] == ["f" * 32]
+    assert len(reloaded) == 1
+
+
+def test_unchanged_posting_is_skipped(tmp_path):
+    with SearchIndex(tmp_path) as index:
+        index.add([_job("Carepa")])
+    index = SearchIndex(tmp_path)
+    assert index.add([_job("Carepa")]) == 0
+    assert not index.dirty
+
+
+def _posting(fp, title, raw_hash="r1"):
+    return JobPosting(title=title, company="Acme", location="Turbo", fingerprint=fp * 32, raw_hash=raw_hash)
+
+
+def test_scores_ignore_tombstoned_docs(tmp_path):
+    updated = SearchIndex(tmp_path / "updated")
+    updated.add([_posting("a", "Operario de banano"), _posting("b", "Auxiliar de banano"), _posting("c", "Cajero")])
+    updated.add([_posting("b", "Auxiliar de cacao", raw_hash="r2")])     # Tombstones b's old doc
+
+    fresh = SearchIndex(tmp_path / "fresh")
+    fresh.add([_posting("a", "Operario de banano"), _posting("c", "Cajero"), _posting("b", "Auxiliar de cacao")])
+
+    assert updated.search("banano") == fresh.search("banano")
+    updated.compact()
+    assert updated.search("banano") == fresh.search("banano")
@@ -0,0 +1,12 @@
+from dashboard.site import shard_rows
+from data_schema import JobBatch, JobPosting
+
+
+def test_undated_month_shard_comes_last():
+    batch = JobBatch.from_jobs([
+        JobPosting(title="a", company="", location="", first_seen="2026-01-05T08:00:00"),
+        JobPosting(title="b", company="", location="", scraped_at=""),
+        JobPosting(title="c", company="", location="", first_seen="2026-03-01T08:00:00"),
+        JobPosting(title="d", company="", location="", scraped_at="2026-02-10T08:00:00"),
+    ])
+    assert shard_rows(batch, "month") == [("2026-03", [2]), ("2026-02", [3]), ("2026-01", [0]), ("Sin fecha", [1])]
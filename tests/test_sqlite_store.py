@@ -0,0 +1,11 @@
+from data_schema import JobPosting
+from storage import JobStore
+
+
+def test_upsert_does_not_count_the_table(tmp_path):
+    with JobStore(tmp_path / "jobs.sqlite") as store:
+        statements = []
+        store.conn.set_trace_callback(statements.append)
+        assert store.upsert([JobPosting(title="Auxiliar", company="Acme", location="Turbo")]) == 1
+        assert not [sql for sql in statements if "COUNT(" in sql.upper()]
+        assert len(store) == 1